@@ -35,6 +35,9 @@ setuptools.setup(
         "yc": [
             "yandexcloud",
         ],
+        "arrow": [
+            "pyarrow",
+        ],
     },
     entry_points={
         "sqlalchemy.dialects": [
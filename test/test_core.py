@@ -502,6 +502,128 @@ class TestWithClause(TablesTest):
         assert desc.partitioning_settings.min_partitions_count == 3
         assert desc.partitioning_settings.max_partitions_count == 5
 
+    @pytest.mark.parametrize(
+        "column_type,unit",
+        [
+            (sa.DateTime, None),
+            (types.UInt64, "seconds"),
+        ],
+    )
+    def test_ttl(self, connection, metadata, column_type, unit):
+        ttl = ydb_sa.TTL("expire_at", datetime.timedelta(days=1), unit=unit)
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("id", types.UInt32, primary_key=True),
+            Column("expire_at", column_type),
+            ydb_ttl=ttl,
+        )
+        table.create(connection)
+
+        desc = connection.connection.driver_connection.describe(table.name)
+        mode = desc.ttl_settings.value_since_unix_epoch if unit else desc.ttl_settings.date_type_column
+        assert mode.column_name == "expire_at"
+        assert mode.expire_after_seconds == 24 * 3600
+
+        reflected = Table(table.name, sa.MetaData(), autoload_with=connection)
+        assert reflected.dialect_options["ydb"]["ttl"] == ttl
+
+    def test_column_table(self, connection, metadata):
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("host", sa.String, primary_key=True),
+            Column("ts", sa.DateTime, primary_key=True),
+            Column("value", sa.Float),
+            ydb_store="column",
+            ydb_partition_by_hash=["host"],
+            ydb_partition_count=4,
+        )
+        table.create(connection)
+
+        desc = connection.connection.driver_connection.describe(table.name)
+        assert desc.type == ydb.SchemeEntryType.COLUMN_TABLE
+
+        reflected = Table(table.name, sa.MetaData(), autoload_with=connection)
+        assert reflected.dialect_options["ydb"]["store"] == "column"
+        assert [column.name for column in reflected.primary_key] == ["host", "ts"]
+        assert list(reflected.c.keys()) == ["host", "ts", "value"]
+
+    def test_column_families(self, connection, metadata):
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("id", types.UInt32, primary_key=True),
+            Column("body", sa.String, ydb_family="cold"),
+            ydb_families=[ydb_sa.ColumnFamily("cold", compression="lz4")],
+        )
+        table.create(connection)
+
+        desc = connection.connection.driver_connection.describe(table.name)
+        assert {column.name: column.family for column in desc.columns}["body"] == "cold"
+
+        reflected = Table(table.name, sa.MetaData(), autoload_with=connection)
+        assert reflected.c.body.dialect_options["ydb"]["family"] == "cold"
+        families = {family.name: family for family in reflected.dialect_options["ydb"]["families"]}
+        assert families["cold"].compression == "lz4"
+
+    def test_alter_ttl(self, connection, metadata):
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("id", types.UInt32, primary_key=True),
+            Column("expire_at", sa.DateTime),
+        )
+        table.create(connection)
+
+        connection.execute(ydb_sa.SetTableOptions(table, ttl=ydb_sa.TTL("expire_at", "PT1H")))
+        assert sa.inspect(connection).get_table_options(table.name) == {
+            "ydb_ttl": ydb_sa.TTL("expire_at", datetime.timedelta(hours=1))
+        }
+
+        connection.execute(ydb_sa.ResetTableOptions(table.name, "ttl"))
+        assert sa.inspect(connection).get_table_options(table.name) == {}
+
+    def test_read_table_options(self, connection, metadata):
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("id", types.UInt32, primary_key=True),
+            ydb_read_replicas_settings="PER_AZ:1",
+            ydb_key_bloom_filter=True,
+        )
+        table.create(connection)
+
+        assert sa.inspect(connection).get_table_options(table.name) == {
+            "ydb_read_replicas_settings": "PER_AZ:1",
+            "ydb_key_bloom_filter": True,
+        }
+
+        connection.execute(ydb_sa.SetTableOptions(table, read_replicas_settings="ANY_AZ:2", key_bloom_filter=False))
+        assert sa.inspect(connection).get_table_options(table.name) == {"ydb_read_replicas_settings": "ANY_AZ:2"}
+
+    def test_changefeeds(self, connection, metadata):
+        table = Table(
+            "clause_with_test",
+            metadata,
+            Column("id", types.UInt32, primary_key=True),
+            ydb_changefeeds=[ydb_sa.Changefeed("updates", "updates", retention_period=datetime.timedelta(hours=12))],
+        )
+        table.create(connection)
+
+        changefeed = ydb_sa.Changefeed("images", "new_and_old_images", initial_scan=True)
+        connection.execute(ydb_sa.AddChangefeed(table, changefeed))
+        options = sa.inspect(connection).get_table_options(table.name, ydb_reflect_changefeeds=True)
+        changefeeds = options["ydb_changefeeds"]
+        assert {feed.name: feed.mode for feed in changefeeds} == {
+            "updates": "updates",
+            "images": "new_and_old_images",
+        }
+
+        connection.execute(ydb_sa.DropChangefeed(table, "images"))
+        connection.execute(ydb_sa.DropChangefeed(table, "updates"))
+        assert sa.inspect(connection).get_table_options(table.name) == {}
+
 
 class TestTransaction(TablesTest):
     __backend__ = True
@@ -894,6 +1016,121 @@ class TestUpsertDoesNotReplaceInsert(TablesTest):
         assert row == (2, "INSERT is my favourite operation")
 
 
+class TestReplace(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_replace",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val", Integer),
+            Column("text", Unicode),
+        )
+
+    def test_string(self, connection):
+        tb = self.tables.test_replace
+        stm = ydb_sa.replace(tb).values(id=0, val=5)
+
+        assert str(stm) == "REPLACE INTO test_replace (id, val) VALUES (?, ?)"
+
+    def test_replace_overwrites_row(self, connection):
+        tb = self.tables.test_replace
+        connection.execute(ydb_sa.replace(tb).values(id=0, val=1, text="a"))
+        connection.execute(ydb_sa.replace(tb).values(id=0, val=2))
+
+        # Unlike UPSERT, columns missing in REPLACE are reset
+        assert connection.execute(sa.select(tb)).fetchall() == [(0, 2, None)]
+
+    def test_replace_from_select(self, connection):
+        tb = self.tables.test_replace
+        connection.execute(ydb_sa.replace(tb), [{"id": 0, "val": 1, "text": "a"}, {"id": 1, "val": 2, "text": "b"}])
+        connection.execute(
+            ydb_sa.replace(tb).from_select(["id", "val", "text"], sa.select(tb.c.id + 10, tb.c.val, tb.c.text))
+        )
+
+        assert connection.execute(sa.select(tb).order_by(tb.c.id)).fetchall() == [
+            (0, 1, "a"),
+            (1, 2, "b"),
+            (10, 1, "a"),
+            (11, 2, "b"),
+        ]
+
+
+class TestUpdateOnDeleteOn(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_update_on",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val", Integer),
+            Column("text", Unicode),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test_update_on.insert(),
+            [{"id": i, "val": i, "text": str(i)} for i in range(5)],
+        )
+
+    def test_string(self, connection):
+        tb = self.tables.test_update_on
+
+        assert str(ydb_sa.update_on(tb).values(id=0, val=5)) == "UPDATE test_update_on ON (id, val) VALUES (?, ?)"
+        assert str(ydb_sa.delete_on(tb).values(id=0)) == "DELETE FROM test_update_on ON (id) VALUES (?)"
+
+    def test_update_on_many(self, connection):
+        tb = self.tables.test_update_on
+        # Rows with missing keys are skipped, columns missing in the statement are kept
+        connection.execute(ydb_sa.update_on(tb), [{"id": 1, "val": 10}, {"id": 3, "val": 30}, {"id": 7, "val": 70}])
+
+        rows = connection.execute(sa.select(tb).order_by(tb.c.id)).fetchall()
+        assert rows == [(0, 0, "0"), (1, 10, "1"), (2, 2, "2"), (3, 30, "3"), (4, 4, "4")]
+
+    def test_delete_on_many(self, connection):
+        tb = self.tables.test_update_on
+        connection.execute(ydb_sa.delete_on(tb), [{"id": 1}, {"id": 3}, {"id": 7}])
+        connection.execute(ydb_sa.delete_on(tb).from_select(["id"], sa.select(tb.c.id).where(tb.c.val > 3)))
+
+        assert connection.execute(sa.select(tb.c.id).order_by(tb.c.id)).fetchall() == [(0,), (2,)]
+
+
+class TestBatchDml(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_batch_dml",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val", Integer),
+        )
+
+    def test_batch_update_and_delete(self, connection):
+        tb = self.tables.test_batch_dml
+        connection.execute(tb.insert(), [{"id": i, "val": 0} for i in range(10)])
+
+        connection.execute(ydb_sa.batch_update(tb).where(tb.c.id >= 5).values(val=1))
+        connection.execute(ydb_sa.batch_delete(tb).where(tb.c.id < 3))
+
+        rows = connection.execute(sa.select(tb).order_by(tb.c.id)).fetchall()
+        assert rows == [(3, 0), (4, 0)] + [(i, 1) for i in range(5, 10)]
+
+    def test_batch_delete_in_transaction(self, connection_no_trans):
+        tb = self.tables.test_batch_dml
+
+        connection_no_trans.execution_options(isolation_level=IsolationLevel.SERIALIZABLE)
+        with connection_no_trans.begin():
+            with pytest.raises(sa.exc.ProgrammingError, match="interactive transaction"):
+                connection_no_trans.execute(ydb_sa.batch_delete(tb).where(tb.c.id < 3))
+
+
 class TestSecondaryIndex(TestBase):
     __backend__ = True
 
@@ -1069,6 +1306,38 @@ class TestSecondaryIndex(TestBase):
         cursor = connection.execute(select_stmt)
         assert cursor.one() == ("Sarah Connor", "wanted")
 
+    def test_vector_index_search(self, connection, metadata: sa.MetaData):
+        documents = Table(
+            "test_vector_index_search/documents",
+            metadata,
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("embedding", types.Vector(2)),
+        )
+        index = sa.Index(
+            "ix_embedding",
+            documents.c.embedding,
+            ydb_type="vector_kmeans_tree",
+            ydb_vector_options={"distance": "cosine", "vector_type": "float", "vector_dimension": 2, "levels": 1},
+        )
+        documents.create(connection)
+        connection.execute(
+            sa.insert(documents).values(
+                [
+                    {"id": 1, "embedding": [1.0, 0.0]},
+                    {"id": 2, "embedding": [0.0, 1.0]},
+                    {"id": 3, "embedding": [0.7, 0.7]},
+                ]
+            )
+        )
+        index.create(connection)
+
+        assert connection.execute(sa.select(documents.c.embedding).where(documents.c.id == 3)).scalar_one() == [
+            pytest.approx(0.7),
+            pytest.approx(0.7),
+        ]
+        select_stmt = ydb_sa.knn_search(documents, "embedding", [0.1, 1.0], limit=2, columns=["id"])
+        assert connection.execute(select_stmt).scalars().all() == [2, 3]
+
     def test_index_deletion(self, connection, metadata: sa.MetaData):
         persons = Table(
             "test_index_deletion/persons",
@@ -1145,6 +1414,20 @@ class TestTablePathPrefix(TablesTest):
 
         assert "nested_dir/table" in metadata.tables
 
+    def test_get_table_names_filter(self):
+        reflection_engine = sa.create_engine(config.db_url, connect_args={"ydb_table_path_prefix": "/local/some_dir"})
+        with reflection_engine.connect() as connection:
+            inspector = sa.inspect(connection)
+            assert inspector.get_table_names(ydb_filter="nested_dir/*") == ["nested_dir/table"]
+            assert inspector.get_table_names(ydb_filter="other_dir/**") == []
+            assert inspector.get_table_names(ydb_max_depth=0) == []
+
+    def test_reflection_filter(self):
+        metadata = sa.MetaData()
+        metadata.reflect(config.db, only=lambda name, _: name.startswith("some_dir/"))
+
+        assert list(metadata.tables) == ["some_dir/nested_dir/table"]
+
 
 class TestAsTable(TablesTest):
     __backend__ = True
@@ -1295,3 +1578,424 @@ class TestAsTable(TablesTest):
             (1, 10, "a"),
             (2, None, "b"),
         ]
+
+
+class TestExecutemanyAsTable(TablesTest):
+    __backend__ = True
+    __only_on__ = "yql+ydb"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_executemany_as_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val_int", Integer, nullable=True),
+            Column("val_str", String, nullable=True),
+        )
+
+    @pytest.fixture
+    def as_table_engine(self):
+        engine = sa.create_engine(config.db_url, _executemany_as_table=True, _executemany_as_table_max_rows=2)
+        yield engine
+        engine.dispose()
+
+    def test_insert_many(self, as_table_engine):
+        table = self.tables.test_executemany_as_table
+        input_data = [
+            {"id": 1, "val_int": 10, "val_str": "a"},
+            {"id": 2, "val_int": None, "val_str": "b"},
+            {"id": 3, "val_int": 30, "val_str": None},
+        ]
+
+        with as_table_engine.begin() as connection:
+            connection.execute(sa.insert(table), input_data)
+
+        with as_table_engine.connect() as connection:
+            rows = connection.execute(sa.select(table).order_by(table.c.id)).fetchall()
+
+        assert rows == [(1, 10, "a"), (2, None, "b"), (3, 30, None)]
+
+    def test_upsert_many(self, as_table_engine):
+        table = self.tables.test_executemany_as_table
+
+        with as_table_engine.begin() as connection:
+            connection.execute(ydb_sa.upsert(table), [{"id": 1, "val_int": 1, "val_str": "a"}])
+            connection.execute(
+                ydb_sa.upsert(table),
+                [
+                    {"id": 1, "val_int": 10, "val_str": "b"},
+                    {"id": 2, "val_int": 20, "val_str": "c"},
+                    {"id": 3, "val_int": 30, "val_str": "d"},
+                ],
+            )
+
+        with as_table_engine.connect() as connection:
+            rows = connection.execute(sa.select(table).order_by(table.c.id)).fetchall()
+
+        assert rows == [(1, 10, "b"), (2, 20, "c"), (3, 30, "d")]
+
+    def test_update_and_delete_by_key_many(self, as_table_engine):
+        table = self.tables.test_executemany_as_table
+
+        with as_table_engine.begin() as connection:
+            connection.execute(sa.insert(table), [{"id": i, "val_int": i, "val_str": str(i)} for i in range(5)])
+            connection.execute(
+                sa.update(table).where(table.c.id == sa.bindparam("b_id")),
+                [{"b_id": 1, "val_int": 10}, {"b_id": 2, "val_int": 20}, {"b_id": 3, "val_int": 30}],
+            )
+            connection.execute(sa.delete(table).where(table.c.id == sa.bindparam("b_id")), [{"b_id": 0}, {"b_id": 4}])
+
+        with as_table_engine.connect() as connection:
+            rows = connection.execute(sa.select(table).order_by(table.c.id)).fetchall()
+
+        assert rows == [(1, 10, "1"), (2, 20, "2"), (3, 30, "3")]
+
+
+class TestRenderInAsList(TablesTest):
+    __backend__ = True
+    __only_on__ = "yql+ydb"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_render_in_as_list",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val", String, nullable=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test_render_in_as_list.insert(),
+            [{"id": i, "val": str(i)} for i in range(10)],
+        )
+
+    def test_select_in(self):
+        table = self.tables.test_render_in_as_list
+        engine = sa.create_engine(config.db_url, _render_in_as_list=True)
+
+        with engine.connect() as connection:
+            for ids in ([1, 3, 5], [2, 4], [], [7, None]):
+                stmt = sa.select(table.c.id).where(table.c.id.in_(ids)).order_by(table.c.id)
+                assert "IN $" in str(stmt.compile(connection))
+                rows = connection.execute(stmt).fetchall()
+                assert rows == [(i,) for i in sorted(i for i in ids if i is not None)]
+
+            rows = connection.execute(
+                sa.select(table.c.id).where(table.c.val.not_in(["1", "2"]), table.c.id < 4).order_by(table.c.id)
+            ).fetchall()
+            assert rows == [(0,), (3,)]
+
+        engine.dispose()
+
+
+class TestBulkUpsert(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_bulk_upsert",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val_int", Integer, nullable=True),
+            Column("val_str", String, nullable=True),
+            Column("val_dt", types.YqlDateTime, nullable=True),
+        )
+
+    def test_bulk_upsert(self, connection):
+        table = self.tables.test_bulk_upsert
+        val_dt = datetime.datetime(2024, 1, 1, 12, 30)
+
+        ydb_sa.bulk_upsert(connection, table, [{"id": 1, "val_int": 1, "val_str": "a", "val_dt": None}])
+        ydb_sa.bulk_upsert(
+            connection,
+            table,
+            ({"id": i, "val_int": i * 10, "val_str": str(i), "val_dt": val_dt} for i in range(1, 6)),
+            max_rows=2,
+        )
+
+        rows = connection.execute(sa.select(table).order_by(table.c.id)).fetchall()
+        assert rows == [(i, i * 10, str(i), val_dt) for i in range(1, 6)]
+
+    def test_bulk_upsert_keeps_missing_columns(self, connection):
+        table = self.tables.test_bulk_upsert
+
+        ydb_sa.bulk_upsert(connection, table, [{"id": 1, "val_int": 1, "val_str": "a", "val_dt": None}])
+        ydb_sa.bulk_upsert(connection, table, [{"id": 1, "val_int": 2}])
+
+        rows = connection.execute(sa.select(table)).fetchall()
+        assert rows == [(1, 2, "a", None)]
+
+
+class TestStreamResults(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_stream_results",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val_str", String, nullable=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        table = cls.tables.test_stream_results
+        connection.execute(table.insert(), [{"id": i, "val_str": str(i) * 100} for i in range(1000)])
+
+    def test_stream_results(self, connection):
+        table = self.tables.test_stream_results
+        result = connection.execution_options(stream_results=True).execute(sa.select(table).order_by(table.c.id))
+
+        assert [row.id for row in result] == list(range(1000))
+
+    def test_yield_per(self, connection):
+        table = self.tables.test_stream_results
+        result = connection.execution_options(yield_per=100).execute(sa.select(table).order_by(table.c.id))
+
+        partitions = list(result.partitions())
+        assert [len(partition) for partition in partitions] == [100] * 10
+        assert [row.id for partition in partitions for row in partition] == list(range(1000))
+
+    def test_stream_results_in_transaction(self, connection_no_trans):
+        table = self.tables.test_stream_results
+
+        connection_no_trans.execution_options(isolation_level=IsolationLevel.SERIALIZABLE)
+        with connection_no_trans.begin():
+            result = connection_no_trans.execution_options(stream_results=True).execute(
+                sa.select(table).order_by(table.c.id)
+            )
+            assert result.fetchmany(10) == [(i, str(i) * 100) for i in range(10)]
+            result.close()
+
+            count = connection_no_trans.execute(sa.select(sa.func.count()).select_from(table)).scalar()
+            assert count == 1000
+
+
+class TestArrowResultFormat(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_arrow_result_format",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val_str", String, nullable=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        table = cls.tables.test_arrow_result_format
+        connection.execute(table.insert(), [{"id": i, "val_str": str(i) if i % 2 else None} for i in range(100)])
+
+    def test_fetch_arrow(self, connection):
+        table = self.tables.test_arrow_result_format
+        result = connection.execution_options(ydb_result_format="arrow").execute(sa.select(table).order_by(table.c.id))
+        arrow_table = ydb_sa.fetch_arrow(result)
+
+        assert arrow_table.column_names == ["id", "val_str"]
+        assert arrow_table.column("id").to_pylist() == list(range(100))
+        assert arrow_table.column("val_str").to_pylist()[:4] == [None, "1", None, "3"]
+
+    def test_iter_arrow_batches(self, connection):
+        table = self.tables.test_arrow_result_format
+        result = connection.execution_options(ydb_result_format="arrow").execute(
+            sa.select(table.c.id).where(table.c.id < 10).order_by(table.c.id)
+        )
+
+        ids = [value for batch in ydb_sa.iter_arrow_batches(result) for value in batch.column(0).to_pylist()]
+        assert ids == list(range(10))
+
+    def test_fetch_arrow_requires_execution_option(self, connection):
+        table = self.tables.test_arrow_result_format
+        result = connection.execute(sa.select(table))
+
+        with pytest.raises(sa.exc.ArgumentError):
+            ydb_sa.fetch_arrow(result)
+
+
+class TestScanTable(TablesTest):
+    __backend__ = True
+    __only_on__ = "yql+ydb"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_scan_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("val_str", String, nullable=True),
+            ydb_partition_at_keys=(100, 1000),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        table = cls.tables.test_scan_table
+        connection.execute(table.insert(), [{"id": i, "val_str": str(i)} for i in range(2000)])
+
+    def test_key_ranges(self, connection):
+        key_ranges = connection.dialect._get_table_key_ranges(connection, "test_scan_table")
+        assert len(key_ranges) == 3
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_scan_table(self, ordered):
+        table = self.tables.test_scan_table
+        rows = list(ydb_sa.scan_table(config.db, table, ordered=ordered, max_workers=2, yield_per=100))
+
+        ids = [row.id for row in rows]
+        assert len(ids) == 2000
+        assert (ids if ordered else sorted(ids)) == list(range(2000))
+        assert rows[0].val_str == str(rows[0].id)
+
+    def test_scan_table_columns(self):
+        table = self.tables.test_scan_table
+        rows = list(ydb_sa.scan_table(config.db, table, columns=[table.c.val_str], ordered=True))
+        assert [row._fields for row in rows[:1]] == [("val_str",)]
+        assert len(rows) == 2000
+
+    def test_async_scan_table(self):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        table = self.tables.test_scan_table
+
+        async def scan():
+            engine = create_async_engine(config.db_url.set(drivername="yql+ydb_async"))
+            try:
+                return [row.id async for row in ydb_sa.async_scan_table(engine, table, ordered=True, max_workers=2)]
+            finally:
+                await engine.dispose()
+
+        assert asyncio.get_event_loop().run_until_complete(scan()) == list(range(2000))
+
+
+class TestKeysetPages(TablesTest):
+    __backend__ = True
+    __only_on__ = "yql+ydb"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test_keyset_pages",
+            metadata,
+            Column("a", Integer, primary_key=True),
+            Column("b", Integer, primary_key=True),
+            Column("val", Integer, nullable=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        table = cls.tables.test_keyset_pages
+        connection.execute(table.insert(), [{"a": a, "b": b, "val": a * 10 + b} for a in range(10) for b in range(10)])
+
+    def test_iter_keyset_pages(self, connection):
+        table = self.tables.test_keyset_pages
+        pages = list(ydb_sa.iter_keyset_pages(connection, table, page_size=30))
+
+        assert [len(page.rows) for page in pages] == [30, 30, 30, 10]
+        assert [page.next_key for page in pages] == [(2, 9), (5, 9), (8, 9), None]
+        assert [row.val for page in pages for row in page.rows] == list(range(100))
+
+    def test_fetch_keyset_page(self, connection):
+        table = self.tables.test_keyset_pages
+        page = ydb_sa.fetch_keyset_page(connection, table, 3, after=(4, 8), where=table.c.val % 2 == 0)
+
+        assert page.rows == [(5, 0, 50), (5, 2, 52), (5, 4, 54)]
+        assert page.next_key == (5, 4)
+
+    def test_fetch_keyset_page_reflected_primary_key(self, connection):
+        # Primary key columns are reflected when the table metadata doesn't have them
+        table = Table("test_keyset_pages", sa.MetaData(), Column("a", Integer), Column("b", Integer))
+        page = ydb_sa.fetch_keyset_page(connection, table, 2, after=(9, 8))
+
+        assert page == ([(9, 9)], None)
+
+    def test_async_iter_keyset_pages(self):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        table = self.tables.test_keyset_pages
+
+        async def read_pages():
+            engine = create_async_engine(config.db_url.set(drivername="yql+ydb_async"))
+            try:
+                async with engine.connect() as connection:
+                    return [page async for page in ydb_sa.async_iter_keyset_pages(connection, table, page_size=40)]
+            finally:
+                await engine.dispose()
+
+        pages = asyncio.get_event_loop().run_until_complete(read_pages())
+        assert [page.next_key for page in pages] == [(3, 9), (7, 9), None]
+        assert [row.val for page in pages for row in page.rows] == list(range(100))
+
+
+class TestMultiReflection(TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        for i in range(3):
+            Table(
+                f"test_multi_reflection_{i}",
+                metadata,
+                Column("id", Integer, primary_key=True),
+                Column("val_str", String, nullable=True),
+                sa.Index(f"ix_test_multi_reflection_{i}_val_str", "val_str"),
+            )
+
+    @pytest.mark.skipif(sa.__version__ < "2.", reason="get_multi_* reflection is available since SQLAlchemy 2.0")
+    def test_get_multi_columns(self, connection):
+        names = [f"test_multi_reflection_{i}" for i in range(3)]
+        inspector = sa.inspect(connection)
+
+        columns = inspector.get_multi_columns(filter_names=names)
+        pk_constraints = inspector.get_multi_pk_constraint(filter_names=names)
+        indexes = inspector.get_multi_indexes(filter_names=names)
+
+        assert sorted(columns) == sorted(pk_constraints) == sorted(indexes) == [(None, name) for name in names]
+        for name in names:
+            assert [column["name"] for column in columns[(None, name)]] == ["id", "val_str"]
+            assert pk_constraints[(None, name)]["constrained_columns"] == ["id"]
+            assert [index["column_names"] for index in indexes[(None, name)]] == [["val_str"]]
+
+    def test_reflect_metadata(self, connection):
+        names = [f"test_multi_reflection_{i}" for i in range(3)]
+        metadata = sa.MetaData()
+        metadata.reflect(connection, only=names)
+
+        assert sorted(metadata.tables) == names
+        for name in names:
+            assert [column.name for column in metadata.tables[name].primary_key] == ["id"]
+
+
+class TestReflectionCache(TestBase):
+    __backend__ = True
+
+    def test_reflection_cache(self, tmp_path):
+        engine = sa.create_engine(config.db_url, _reflection_cache_path=str(tmp_path / "reflection.db"))
+        metadata = sa.MetaData()
+        table = Table("test_reflection_cache", metadata, Column("id", Integer, primary_key=True))
+        metadata.create_all(engine)
+        try:
+            reflected = Table("test_reflection_cache", sa.MetaData(), autoload_with=engine)
+            assert list(reflected.c.keys()) == ["id"]
+
+            # Another engine uses the file without describing the table
+            cached_engine = sa.create_engine(config.db_url, _reflection_cache_path=str(tmp_path / "reflection.db"))
+            with cached_engine.connect() as connection:
+                key = cached_engine.dialect._get_reflection_cache_key(connection, table.name)
+                assert cached_engine.dialect._reflection_cache.contains(*key, "get_columns")
+
+            # DDL executed through the dialect invalidates the cache
+            table.drop(engine)
+            Table(
+                "test_reflection_cache", sa.MetaData(), Column("id", Integer, primary_key=True), Column("val", Integer)
+            ).create(engine)
+            reflected = Table("test_reflection_cache", sa.MetaData(), autoload_with=engine)
+            assert list(reflected.c.keys()) == ["id", "val"]
+        finally:
+            metadata.drop_all(engine)
+            engine.dispose()
@@ -6,6 +6,8 @@ from sqlalchemy import Column, Integer, Unicode
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.testing.fixtures import TablesTest, config
 
+from ydb_sqlalchemy import sqlalchemy as ydb_sa
+
 
 class TestDirectories(TablesTest):
     __backend__ = True
@@ -54,3 +56,81 @@ class TestDirectories(TablesTest):
             self.try_update(session, Table)
         assert "Unknown name: $dir" in str(excinfo.value)
         self.drop_table(base, engine_bad)
+
+
+class TestReplace(TablesTest):
+    __backend__ = True
+
+    def test_bulk_replace(self):
+        engine = sa.create_engine(config.db_url)
+        base = declarative_base()
+
+        class Item(base):
+            __tablename__ = "test_orm_replace"
+            id = Column(Integer, primary_key=True)
+            name = Column("text", Unicode)
+
+        base.metadata.create_all(engine)
+        try:
+            session = sessionmaker(bind=engine)()
+            session.execute(ydb_sa.replace(Item), [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}])
+            session.execute(ydb_sa.replace(Item), [{"id": 1, "name": "baz"}])
+            session.commit()
+
+            assert session.execute(sa.select(Item.id, Item.name).order_by(Item.id)).all() == [(1, "baz"), (2, "bar")]
+        finally:
+            base.metadata.drop_all(engine)
+
+
+class TestBulkUpdate(TablesTest):
+    __backend__ = True
+
+    def test_bulk_update_through_update_on(self):
+        engine = sa.create_engine(config.db_url, _executemany_update_delete_on=True)
+        base = declarative_base()
+
+        class Item(base):
+            __tablename__ = "test_orm_bulk_update"
+            id = Column(Integer, primary_key=True)
+            name = Column("text", Unicode)
+
+        base.metadata.create_all(engine)
+        try:
+            session = sessionmaker(bind=engine)()
+            session.execute(sa.insert(Item), [{"id": i, "name": str(i)} for i in range(10)])
+            session.execute(sa.update(Item), [{"id": i, "name": f"new {i}"} for i in range(0, 10, 2)])
+            session.commit()
+
+            rows = session.execute(sa.select(Item.id, Item.name).order_by(Item.id)).all()
+            assert rows == [(i, f"new {i}" if i % 2 == 0 else str(i)) for i in range(10)]
+        finally:
+            base.metadata.drop_all(engine)
+            engine.dispose()
+
+
+class TestFlushManyObjects(TablesTest):
+    __backend__ = True
+
+    def test_flush_many_objects(self):
+        engine = sa.create_engine(config.db_url)
+        base = declarative_base()
+
+        class Item(base):
+            __tablename__ = "test_orm_flush_many"
+            id = Column(Integer, primary_key=True)
+            name = Column("text", Unicode)
+
+        base.metadata.create_all(engine)
+        statements = []
+        sa.event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        try:
+            session = sessionmaker(bind=engine)()
+            session.add_all([Item(id=i, name=str(i)) for i in range(2500)])
+            session.commit()
+
+            # New objects are inserted by pages of insertmanyvalues
+            assert len([statement for statement in statements if statement.startswith("INSERT")]) == 3
+            assert session.execute(sa.select(sa.func.count()).select_from(Item)).scalar() == 2500
+        finally:
+            base.metadata.drop_all(engine)
+            engine.dispose()
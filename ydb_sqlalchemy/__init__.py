@@ -1,4 +1,41 @@
 from ._version import VERSION  # noqa: F401
 from ydb_dbapi import IsolationLevel  # noqa: F401
-from .sqlalchemy import Upsert, types, upsert  # noqa: F401
+from .sqlalchemy import (  # noqa: F401
+    AddChangefeed,
+    BatchDelete,
+    BatchUpdate,
+    Changefeed,
+    ColumnFamily,
+    DeleteOn,
+    DropChangefeed,
+    KeysetPage,
+    ReflectionCache,
+    Replace,
+    ResetTableOptions,
+    SetTableOptions,
+    TTL,
+    TTLTier,
+    UpdateOn,
+    Upsert,
+    async_bulk_upsert,
+    async_fetch_keyset_page,
+    async_iter_keyset_pages,
+    async_scan_table,
+    batch_delete,
+    batch_update,
+    bulk_upsert,
+    delete_on,
+    fetch_arrow,
+    fetch_keyset_page,
+    iter_arrow_batches,
+    iter_keyset_pages,
+    knn_distance,
+    knn_search,
+    knn_similarity,
+    replace,
+    scan_table,
+    types,
+    update_on,
+    upsert,
+)
 import ydb_dbapi as dbapi
@@ -3,13 +3,19 @@ Experimental
 Work in progress, breaking changes are possible.
 """
 
+import asyncio
 import collections
 import collections.abc
+import concurrent.futures
+import datetime
+import functools
+import posixpath
 import re
-from typing import Any, Mapping, Optional, Sequence, Tuple, Union
+from typing import AbstractSet, Any, Callable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 import sqlalchemy as sa
 import ydb
+from ydb.retries import retry_operation_async, retry_operation_sync
 from sqlalchemy import util
 from sqlalchemy.engine import characteristics, reflection
 from sqlalchemy.engine.default import DefaultExecutionContext, StrCompileDialect
@@ -19,8 +25,38 @@ from sqlalchemy.sql import functions
 from sqlalchemy.sql.elements import ClauseList
 
 import ydb_dbapi
-from ydb_sqlalchemy.sqlalchemy.dbapi_adapter import AdaptedAsyncConnection
-from ydb_sqlalchemy.sqlalchemy.dml import Upsert
+from ydb_dbapi.utils import handle_ydb_errors
+from ydb_sqlalchemy.sqlalchemy.bulk import (  # noqa: F401
+    _estimate_value_size,
+    _split_rows,
+    async_bulk_upsert,
+    bulk_upsert,
+)
+from ydb_sqlalchemy.sqlalchemy.arrow import fetch_arrow, iter_arrow_batches  # noqa: F401
+from ydb_sqlalchemy.sqlalchemy.cursors import VALUE_RESULT_FORMAT, StreamingCursor
+from ydb_sqlalchemy.sqlalchemy.dbapi_adapter import AdaptedAsyncConnection, AdaptedAsyncStreamingCursor
+from ydb_sqlalchemy.sqlalchemy.reflection_cache import ReflectionCache, persistent_cache  # noqa: F401
+from ydb_sqlalchemy.sqlalchemy.scheme import SchemeFilter, _async_walk_scheme, _walk_scheme
+from ydb_sqlalchemy.sqlalchemy.scan import async_scan_table, scan_table  # noqa: F401
+from ydb_sqlalchemy.sqlalchemy.ddl import (  # noqa: F401
+    TTL,
+    AddChangefeed,
+    Changefeed,
+    ColumnFamily,
+    DropChangefeed,
+    ResetTableOptions,
+    SetTableOptions,
+    TTLTier,
+)
+from ydb_sqlalchemy.sqlalchemy.dml import BatchDelete, BatchUpdate, DeleteOn, Replace, UpdateOn, Upsert
+from ydb_sqlalchemy.sqlalchemy.knn import knn_distance, knn_search, knn_similarity  # noqa: F401
+from ydb_sqlalchemy.sqlalchemy.pagination import (  # noqa: F401
+    KeysetPage,
+    async_fetch_keyset_page,
+    async_iter_keyset_pages,
+    fetch_keyset_page,
+    iter_keyset_pages,
+)
 
 from ydb_sqlalchemy.sqlalchemy.compiler import YqlCompiler, YqlDDLCompiler, YqlIdentifierPreparer, YqlTypeCompiler
 
@@ -31,6 +67,9 @@ from .._version import VERSION
 
 OLD_SA = sa.__version__ < "2."
 
+if not OLD_SA:
+    from sqlalchemy.engine.interfaces import ExecuteStyle
+
 
 class ParametrizedFunction(functions.Function):
     __visit_name__ = "parametrized_function"
@@ -46,6 +85,26 @@ def upsert(table):
     return Upsert(table)
 
 
+def replace(table):
+    return Replace(table)
+
+
+def batch_update(table):
+    return BatchUpdate(table)
+
+
+def batch_delete(table):
+    return BatchDelete(table)
+
+
+def update_on(table):
+    return UpdateOn(table)
+
+
+def delete_on(table):
+    return DeleteOn(table)
+
+
 COLUMN_TYPES = {
     ydb.PrimitiveType.Int8: sa.INTEGER,
     ydb.PrimitiveType.Int16: sa.INTEGER,
@@ -81,6 +140,111 @@ DBAPI_COLUMN_TYPES = {
 
 DECIMAL_DBAPI_TYPE_RE = re.compile(r"^Decimal\((\d+),\s*(\d+)\)$")
 
+AS_TABLE_ROWS_PARAMETER = "$rows"
+
+# Estimated size of a row parameter in the text of an "insertmanyvalues" query beyond its name: "$`name__999`, "
+INSERTMANYVALUES_PARAMETER_TEXT_SIZE = 16
+# ... and of its declaration with _add_declare_for_yql_stmt_vars: "DECLARE $`name__999` as Optional<Utf8>;"
+INSERTMANYVALUES_DECLARED_PARAMETER_TEXT_SIZE = 64
+
+# Changefeeds are not returned by table descriptions of the SDK, they are read from SHOW CREATE TABLE
+CHANGEFEED_RE = re.compile(r"ADD\s+CHANGEFEED\s+`?([^`\s]+)`?\s+WITH\s*\((.*?)\)\s*(?:;|$)", re.IGNORECASE | re.DOTALL)
+CHANGEFEED_SETTING_RE = re.compile(
+    r"(\w+)\s*=\s*(?:INTERVAL\s*\(\s*['\"]([^'\"]*)['\"]\s*\)|['\"]([^'\"]*)['\"]|(\w+))", re.IGNORECASE
+)
+
+DEFAULT_COLUMN_FAMILY = "default"
+
+COLUMN_FAMILY_COMPRESSIONS = {
+    ydb.Compression.NONE: "off",
+    ydb.Compression.LZ4: "lz4",
+}
+
+# Scheme entries which has_table reports as existing tables
+TABLE_SCHEME_ENTRY_TYPES = frozenset(
+    (
+        ydb.SchemeEntryType.TABLE,
+        ydb.SchemeEntryType.COLUMN_TABLE,
+        ydb.SchemeEntryType.EXTERNAL_TABLE,
+        ydb.SchemeEntryType.VIEW,
+    )
+)
+
+
+def _get_reflected_ttl(ttl_settings: ydb.TtlSettings) -> TTL:
+    if ttl_settings.value_since_unix_epoch is not None:
+        mode = ttl_settings.value_since_unix_epoch
+        unit = mode.column_unit.name[len("UNIT_") :].lower()  # noqa: E203
+    else:
+        mode = ttl_settings.date_type_column
+        unit = None
+    return TTL(mode.column_name, datetime.timedelta(seconds=mode.expire_after_seconds), unit=unit)
+
+
+def _get_reflected_column_family(column_family: ydb.ColumnFamily) -> ColumnFamily:
+    return ColumnFamily(
+        column_family.name,
+        data=column_family.data.media if column_family.data is not None else None,
+        compression=COLUMN_FAMILY_COMPRESSIONS.get(column_family.compression),
+    )
+
+
+def _get_reflected_changefeeds(create_query: str) -> List[Changefeed]:
+    changefeeds = []
+    for name, settings_text in CHANGEFEED_RE.findall(create_query):
+        settings = {
+            key.lower(): interval or string or keyword
+            for key, interval, string, keyword in CHANGEFEED_SETTING_RE.findall(settings_text)
+        }
+        changefeeds.append(
+            Changefeed(
+                name,
+                settings["mode"],
+                settings.get("format", "json"),
+                retention_period=settings.get("retention_period"),
+                virtual_timestamps=True if settings.get("virtual_timestamps", "").upper() == "TRUE" else None,
+            )
+        )
+    return changefeeds
+
+
+def _with_request_settings(settings: ydb.BaseRequestSettings, request_settings: ydb.BaseRequestSettings):
+    # Timeouts and the trace id of the connection applied to settings of a specific request
+    return (
+        settings.with_trace_id(request_settings.trace_id)
+        .with_request_type(request_settings.request_type)
+        .with_timeout(request_settings.timeout)
+        .with_cancel_after(request_settings.cancel_after)
+        .with_operation_timeout(request_settings.operation_timeout)
+        .with_compression(request_settings.compression)
+        .with_need_rpc_auth(request_settings.need_rpc_auth)
+    )
+
+
+def _is_scheme_error(error: Exception) -> bool:
+    # Errors of scheme operations on paths which don't exist or are not tables
+    return isinstance(error, ydb_dbapi.ProgrammingError) and isinstance(
+        getattr(error, "original_error", None), ydb.SchemeError
+    )
+
+
+def _is_show_create_unsupported(error: sa.exc.DBAPIError) -> bool:
+    # Older YDB versions either reject the statement as unsupported or fail to parse it
+    if isinstance(error.orig, ydb_dbapi.NotSupportedError):
+        return True
+    original_error = getattr(error.orig, "original_error", None)
+    return isinstance(original_error, ydb.BadRequest) and "SHOW" in str(original_error.message).upper()
+
+
+def _get_reflected_read_replicas_settings(settings: Optional[ydb.ReadReplicasSettings]) -> Optional[str]:
+    if settings is None:
+        return None
+    if settings.per_az_read_replicas_count:
+        return f"PER_AZ:{settings.per_az_read_replicas_count}"
+    if settings.any_az_read_replicas_count:
+        return f"ANY_AZ:{settings.any_az_read_replicas_count}"
+    return None
+
 
 def _get_column_info(t):
     nullable = False
@@ -116,6 +280,14 @@ def _format_reflected_column(name, col_type, nullable):
     }
 
 
+def _iterate_and_clauses(clause: sa.sql.ColumnElement) -> Iterator[sa.sql.ColumnElement]:
+    if isinstance(clause, sa.sql.elements.BooleanClauseList) and clause.operator is sa.sql.operators.and_:
+        for nested_clause in clause.clauses:
+            yield from _iterate_and_clauses(nested_clause)
+    else:
+        yield clause
+
+
 class YdbRequestSettingsCharacteristic(characteristics.ConnectionCharacteristic):
     def reset_characteristic(self, dialect: "YqlDialect", dbapi_connection: ydb_dbapi.Connection) -> None:
         dialect.reset_ydb_request_settings(dbapi_connection)
@@ -144,6 +316,30 @@ class YdbRetrySettingsCharacteristic(characteristics.ConnectionCharacteristic):
         return dialect.get_ydb_retry_settings(dbapi_connection)
 
 
+class YqlExecutionContext(DefaultExecutionContext):
+    def create_cursor(self):
+        result_format = self.execution_options.get("ydb_result_format", VALUE_RESULT_FORMAT)
+        if result_format != VALUE_RESULT_FORMAT:
+            # Arrow batches are read from the cursor directly, SQLAlchemy must not prefetch rows
+            self._is_server_side = False
+            return self.dialect._create_server_side_cursor(self._dbapi_connection.dbapi_connection, result_format)
+        return super().create_cursor()
+
+    def create_server_side_cursor(self):
+        return self.dialect._create_server_side_cursor(self._dbapi_connection.dbapi_connection)
+
+    def pre_exec(self):
+        super().pre_exec()
+        if not OLD_SA and self.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            self.dialect._prepare_insertmanyvalues(self)
+
+    def post_exec(self):
+        super().post_exec()
+        if self.isddl and self.dialect._reflection_cache is not None:
+            dbapi_connection = self._dbapi_connection.dbapi_connection
+            self.dialect._reflection_cache.invalidate(dbapi_connection.endpoint, dbapi_connection.database)
+
+
 class YqlDialect(StrCompileDialect):
     name = "yql"
     driver = "ydb"
@@ -152,6 +348,7 @@ class YqlDialect(StrCompileDialect):
     max_identifier_length = 63
     supports_sane_rowcount = False
     supports_statement_cache = True
+    supports_server_side_cursors = True
 
     supports_native_enum = False
     supports_native_boolean = True
@@ -175,12 +372,21 @@ class YqlDialect(StrCompileDialect):
     supports_multivalues_insert = True
     default_paramstyle = "qmark"
 
+    # Executemany of INSERT is sent as INSERT ... VALUES with a page of rows,
+    # pages are also limited by _insertmanyvalues_max_bytes and _insertmanyvalues_max_query_size
+    use_insertmanyvalues = True
+    use_insertmanyvalues_wo_returning = True
+    insertmanyvalues_page_size = 1000
+    # Every distinct query text is compiled by YDB, long lists of parameters make it slow
+    insertmanyvalues_max_parameters = 10000
+
     isolation_level = None
 
     preparer = YqlIdentifierPreparer
     statement_compiler = YqlCompiler
     ddl_compiler = YqlDDLCompiler
     type_compiler = YqlTypeCompiler
+    execution_ctx_cls = YqlExecutionContext
     colspecs = {
         sa.types.JSON: types.YqlJSON,
         sa.types.JSON.JSONPathType: types.YqlJSON.YqlJSONPathType,
@@ -214,6 +420,20 @@ class YqlDialect(StrCompileDialect):
                 "auto_partitioning_max_partitions_count": None,
                 "uniform_partitions": None,
                 "partition_at_keys": None,
+                "read_replicas_settings": None,
+                "key_bloom_filter": None,
+                "ttl": None,
+                "store": None,
+                "partition_by_hash": None,
+                "partition_count": None,
+                "families": None,
+                "changefeeds": None,
+            },
+        ),
+        (
+            sa.schema.Column,
+            {
+                "family": None,
             },
         ),
         (
@@ -221,6 +441,8 @@ class YqlDialect(StrCompileDialect):
             {
                 "async": False,
                 "cover": [],
+                "type": None,
+                "vector_options": None,
             },
         ),
     ]
@@ -239,6 +461,17 @@ class YqlDialect(StrCompileDialect):
         json_deserializer=None,
         _add_declare_for_yql_stmt_vars=False,
         _statement_prefixes_list=None,
+        _executemany_as_table=False,
+        _executemany_as_table_max_rows=1000,
+        _executemany_as_table_max_bytes=8 * 1024 * 1024,
+        _executemany_update_delete_on=False,
+        _insertmanyvalues_max_bytes=8 * 1024 * 1024,
+        _insertmanyvalues_max_query_size=1024 * 1024,
+        _render_in_as_list=False,
+        _reflection_max_workers=10,
+        _reflection_cache_path=None,
+        _reflection_cache_version=None,
+        _reflection_cache_max_age=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -249,27 +482,149 @@ class YqlDialect(StrCompileDialect):
         # no need in declare in yql statement here since ydb 24-1
         self._add_declare_for_yql_stmt_vars = _add_declare_for_yql_stmt_vars
         self._statement_prefixes = tuple(_statement_prefixes_list) if _statement_prefixes_list else ()
+        self._executemany_as_table = _executemany_as_table
+        self._executemany_as_table_max_rows = _executemany_as_table_max_rows
+        self._executemany_as_table_max_bytes = _executemany_as_table_max_bytes
+        self._executemany_update_delete_on = _executemany_update_delete_on
+        self._insertmanyvalues_max_bytes = _insertmanyvalues_max_bytes
+        self._insertmanyvalues_max_query_size = _insertmanyvalues_max_query_size
+        self._render_in_as_list = _render_in_as_list
+        self._reflection_max_workers = _reflection_max_workers
+        self._reflection_cache = (
+            ReflectionCache(_reflection_cache_path, _reflection_cache_version, _reflection_cache_max_age)
+            if _reflection_cache_path
+            else None
+        )
 
     def _ensure_schema_unsupported(self, schema):
         if schema:
             raise ydb_dbapi.NotSupportedError("unsupported on non empty schema")
 
-    def _describe_table(self, connection, table_name, schema=None) -> ydb.TableDescription:
+    def _describe_table(self, connection, table_name, schema=None, **kw) -> ydb.TableDescription:
+        qt = table_name if isinstance(table_name, str) else table_name.name
+        table = self._describe_tables(connection, [qt], schema, **kw)[qt]
+        if isinstance(table, ydb_dbapi.ProgrammingError):
+            raise NoSuchTableError(qt) from table
+        return table
+
+    def _describe_table_names(
+        self, dbapi_connection: ydb_dbapi.Connection, table_names: Sequence[str]
+    ) -> List[Union[ydb.TableDescription, ydb_dbapi.ProgrammingError]]:
+        # Tables which don't exist are described by their scheme errors, other errors are raised
+        def describe(table_name):
+            try:
+                return dbapi_connection.describe(table_name)
+            except ydb_dbapi.ProgrammingError as e:
+                if not _is_scheme_error(e):
+                    raise
+                return e
+
+        if len(table_names) == 1:
+            return [describe(table_names[0])]
+
+        with concurrent.futures.ThreadPoolExecutor(self._reflection_max_workers) as executor:
+            return list(executor.map(describe, table_names))
+
+    def _describe_tables(
+        self, connection, table_names: Sequence[str], schema=None, info_cache=None, **kw
+    ) -> Mapping[str, Union[ydb.TableDescription, ydb_dbapi.ProgrammingError]]:
         self._ensure_schema_unsupported(schema)
 
-        qt = table_name if isinstance(table_name, str) else table_name.name
-        raw_conn = connection.connection
-        try:
-            return raw_conn.describe(qt)
-        except ydb_dbapi.DatabaseError as e:
-            raise NoSuchTableError(qt) from e
+        descriptions = info_cache.setdefault("ydb_table_descriptions", {}) if info_cache is not None else {}
+        missing_table_names = list(dict.fromkeys(name for name in table_names if name not in descriptions))
+        if missing_table_names:
+            dbapi_connection = connection.connection.dbapi_connection
+            descriptions.update(
+                zip(missing_table_names, self._describe_table_names(dbapi_connection, missing_table_names))
+            )
+        return {name: descriptions[name] for name in table_names}
 
-    @reflection.cache
-    def get_view_names(self, connection, schema=None, **kw: Any):
+    def _get_reflection_cache_key(self, connection, table_name, schema=None) -> Tuple[str, str]:
+        self._ensure_schema_unsupported(schema)
+
+        dbapi_connection = connection.connection.dbapi_connection
+        table_path = posixpath.join(dbapi_connection.database, dbapi_connection.table_path_prefix, table_name)
+        return dbapi_connection.endpoint, table_path
+
+    def _describe_multi_tables(self, connection, method, kind, schema, filter_names, scope, **kw) -> None:
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        if kw.get("info_cache") is None:
+            return
+
+        if filter_names and scope is ObjectScope.ANY and kind is ObjectKind.ANY:
+            table_names = filter_names
+        elif ObjectKind.TABLE in kind and ObjectScope.DEFAULT in scope:
+            table_names = self.get_table_names(connection, schema, **kw)
+            if filter_names:
+                filter_names = set(filter_names)
+                table_names = [name for name in table_names if name in filter_names]
+        else:
+            return
+
+        cache = self._reflection_cache
+        if cache is not None:
+            # Tables with cached results are not described, presence of all of them is checked by a single query
+            keys = [self._get_reflection_cache_key(connection, name, schema) for name in table_names]
+            if keys:
+                contained = cache.contained(keys[0][0], [table_path for _, table_path in keys], method)
+                table_names = [name for name, (_, table_path) in zip(table_names, keys) if table_path not in contained]
+        self._describe_tables(connection, table_names, schema, **kw)
+
+    def _retry_operation(self, dbapi_connection, callee: Callable[[], Any]) -> Any:
+        # Scheme and table client requests made outside of queries, retried like queries of the connection
+        return retry_operation_sync(callee, dbapi_connection.get_ydb_retry_settings())
+
+    def _describe_path(self, dbapi_connection, path: str) -> ydb.SchemeEntry:
+        settings = dbapi_connection._get_request_settings()
+        scheme_client = dbapi_connection._driver.scheme_client
+        return self._retry_operation(dbapi_connection, lambda: scheme_client.describe_path(path, settings=settings))
+
+    def _list_directory(self, dbapi_connection, path: str) -> ydb.Directory:
+        settings = dbapi_connection._get_request_settings()
+        scheme_client = dbapi_connection._driver.scheme_client
+        return self._retry_operation(dbapi_connection, lambda: scheme_client.list_directory(path, settings=settings))
+
+    def _walk_scheme(self, dbapi_connection, entry_types, scheme_filter, max_depth) -> List[str]:
+        root = posixpath.join(dbapi_connection.database, dbapi_connection.table_path_prefix)
+        list_directory = functools.partial(self._list_directory, dbapi_connection)
+        return list(
+            _walk_scheme(list_directory, root, entry_types, scheme_filter, max_depth, self._reflection_max_workers)
+        )
+
+    def _get_entity_names(self, connection, entry_types, schema=None, ydb_filter=None, ydb_max_depth=None) -> List[str]:
+        self._ensure_schema_unsupported(schema)
+
+        scheme_filter = SchemeFilter(ydb_filter) if ydb_filter else None
+        walk_scheme = handle_ydb_errors(self._walk_scheme)
+        # Inspector caches the complete list, so names are buffered rather than streamed
+        return sorted(walk_scheme(connection.connection, entry_types, scheme_filter, ydb_max_depth))
+
+    def _describe_table_with_shard_key_bounds(self, dbapi_connection, table_path: str) -> ydb.TableSchemeEntry:
+        settings = _with_request_settings(
+            ydb.DescribeTableSettings().with_include_shard_key_bounds(True), dbapi_connection._get_request_settings()
+        )
+        table_client = dbapi_connection._driver.table_client
+        return self._retry_operation(
+            dbapi_connection, lambda: table_client.describe_table(table_path, settings=settings)
+        )
+
+    def _get_table_key_ranges(self, connection, table_name, schema=None) -> List[ydb.KeyRange]:
         self._ensure_schema_unsupported(schema)
 
         raw_conn = connection.connection
-        return raw_conn.get_view_names()
+        table_path = posixpath.join(raw_conn.database, raw_conn.table_path_prefix, table_name)
+        describe_table = handle_ydb_errors(self._describe_table_with_shard_key_bounds)
+        try:
+            return describe_table(raw_conn, table_path).shard_key_ranges
+        except ydb_dbapi.ProgrammingError as e:
+            if not _is_scheme_error(e):
+                raise
+            raise NoSuchTableError(table_name) from e
+
+    @reflection.cache
+    def get_view_names(self, connection, schema=None, ydb_filter=None, ydb_max_depth=None, **kw: Any):
+        return self._get_entity_names(connection, [ydb.SchemeEntryType.VIEW], schema, ydb_filter, ydb_max_depth)
 
     @reflection.cache
     def get_view_definition(self, connection, view_name, schema=None, **kw: Any):
@@ -282,15 +637,37 @@ class YqlDialect(StrCompileDialect):
             return None
         return row._mapping.get("CreateQuery") or row[0]
 
+    def get_multi_columns(self, connection, **kw):
+        self._describe_multi_tables(connection, "get_columns", **kw)
+        return super().get_multi_columns(connection, **kw)
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        self._describe_multi_tables(connection, "get_pk_constraint", **kw)
+        return super().get_multi_pk_constraint(connection, **kw)
+
+    def get_multi_indexes(self, connection, **kw):
+        self._describe_multi_tables(connection, "get_indexes", **kw)
+        return super().get_multi_indexes(connection, **kw)
+
+    def get_multi_table_options(self, connection, **kw):
+        self._describe_multi_tables(connection, "_get_table_options", **kw)
+        return super().get_multi_table_options(connection, **kw)
+
     @reflection.cache
+    @persistent_cache
     def get_columns(self, connection, table_name, schema=None, **kw):
-        table = self._describe_table(connection, table_name, schema)
+        table = self._describe_table(connection, table_name, schema, **kw)
         as_compatible = []
         for column in table.columns:
             col_type, nullable = _get_column_info(column.type)
-            as_compatible.append(_format_reflected_column(column.name, col_type, nullable))
+            reflected_column = _format_reflected_column(column.name, col_type, nullable)
+            if column.family and column.family != DEFAULT_COLUMN_FAMILY:
+                reflected_column["dialect_options"] = {"ydb_family": column.family}
+            as_compatible.append(reflected_column)
 
         if not as_compatible:
+            # The SDK has no describe call for views and external tables: the scheme entry has no columns and
+            # SHOW CREATE VIEW returns only the query text, so column types are taken from an empty result
             quoted_table_name = self.identifier_preparer.quote(table_name)
             result = connection.execute(sa.text(f"SELECT * FROM {quoted_table_name} LIMIT 0"))
             for column in result.cursor.description or []:
@@ -300,33 +677,89 @@ class YqlDialect(StrCompileDialect):
         return as_compatible
 
     @reflection.cache
-    def get_table_names(self, connection, schema=None, **kw):
-        self._ensure_schema_unsupported(schema)
-
-        raw_conn = connection.connection
-        return raw_conn.get_table_names()
+    def get_table_names(self, connection, schema=None, ydb_filter=None, ydb_max_depth=None, **kw):
+        entry_types = [ydb.SchemeEntryType.TABLE, ydb.SchemeEntryType.COLUMN_TABLE]
+        return self._get_entity_names(connection, entry_types, schema, ydb_filter, ydb_max_depth)
 
     @reflection.cache
     def has_table(self, connection, table_name, schema=None, **kwargs):
+        self._ensure_schema_unsupported(schema)
+
+        info_cache = kwargs.get("info_cache")
+        descriptions = info_cache.get("ydb_table_descriptions", {}) if info_cache is not None else {}
+        if table_name in descriptions:
+            return not isinstance(descriptions[table_name], ydb_dbapi.ProgrammingError)
+
+        # Scheme entry is much cheaper to get than a full table description
+        raw_conn = connection.connection
+        table_path = posixpath.join(raw_conn.database, raw_conn.table_path_prefix, table_name)
+        describe_path = handle_ydb_errors(self._describe_path)
         try:
-            self._describe_table(connection, table_name, schema)
-            return True
-        except NoSuchTableError:
+            return describe_path(raw_conn, table_path).type in TABLE_SCHEME_ENTRY_TYPES
+        except ydb_dbapi.ProgrammingError as e:
+            if not _is_scheme_error(e):
+                raise
             return False
 
     @reflection.cache
+    @persistent_cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kwargs):
-        table = self._describe_table(connection, table_name, schema)
+        table = self._describe_table(connection, table_name, schema, **kwargs)
         return {"constrained_columns": table.primary_key, "name": None}
 
+    @reflection.cache
+    @persistent_cache
+    def _get_table_options(self, connection, table_name, schema=None, **kw):
+        table = self._describe_table(connection, table_name, schema, **kw)
+        options = {}
+        if table.type == ydb.SchemeEntryType.COLUMN_TABLE:
+            options["ydb_store"] = "column"
+        read_replicas_settings = _get_reflected_read_replicas_settings(table.read_replicas_settings)
+        if read_replicas_settings is not None:
+            options["ydb_read_replicas_settings"] = read_replicas_settings
+        if table.key_bloom_filter == ydb.FeatureFlag.ENABLED:
+            options["ydb_key_bloom_filter"] = True
+        if table.ttl_settings is not None:
+            options["ydb_ttl"] = _get_reflected_ttl(table.ttl_settings)
+        families = [_get_reflected_column_family(family) for family in table.column_families]
+        if families and families != [ColumnFamily(DEFAULT_COLUMN_FAMILY)]:
+            options["ydb_families"] = families
+        return options
+
+    @reflection.cache
+    def get_table_options(self, connection, table_name, schema=None, ydb_reflect_changefeeds=False, **kw):
+        options = self._get_table_options(connection, table_name, schema, **kw)
+        # Changefeeds cost a SHOW CREATE TABLE query per table, so they are reflected only on request
+        if ydb_reflect_changefeeds and options.get("ydb_store") != "column":
+            changefeeds = self._get_changefeeds(connection, table_name, schema)
+            if changefeeds:
+                options = {**options, "ydb_changefeeds": changefeeds}
+        return options
+
+    def _get_changefeeds(self, connection, table_name, schema=None) -> List[Changefeed]:
+        self._ensure_schema_unsupported(schema)
+
+        quoted_table_name = self.identifier_preparer.quote(table_name)
+        try:
+            row = connection.execute(sa.text(f"SHOW CREATE TABLE {quoted_table_name}")).fetchone()
+        except sa.exc.DBAPIError as e:
+            if not _is_show_create_unsupported(e):
+                raise
+            # SHOW CREATE TABLE is not supported by older YDB versions
+            return []
+        if row is None:
+            return []
+        return _get_reflected_changefeeds(row._mapping.get("CreateQuery") or row[0])
+
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kwargs):
         # foreign keys unsupported
         return []
 
     @reflection.cache
+    @persistent_cache
     def get_indexes(self, connection, table_name, schema=None, **kwargs):
-        table = self._describe_table(connection, table_name, schema)
+        table = self._describe_table(connection, table_name, schema, **kwargs)
         indexes: list[ydb.TableIndex] = table.indexes
         if OLD_SA:
             sa_indexes: list[dict] = []
@@ -408,6 +841,11 @@ class YqlDialect(StrCompileDialect):
     def connect(self, *cargs, **cparams):
         return self.dbapi.connect(*cargs, **cparams)
 
+    def _create_server_side_cursor(
+        self, dbapi_connection: ydb_dbapi.Connection, result_format: str = VALUE_RESULT_FORMAT
+    ) -> StreamingCursor:
+        return StreamingCursor(dbapi_connection, result_format)
+
     def do_begin(self, dbapi_connection: ydb_dbapi.Connection) -> None:
         dbapi_connection.begin()
 
@@ -420,33 +858,66 @@ class YqlDialect(StrCompileDialect):
     def _handle_column_name(self, variable):
         return "`" + variable + "`"
 
+    def _build_statement_template(
+        self, statement: str, variable_names: Optional[AbstractSet[str]]
+    ) -> Tuple[str, Mapping[str, str]]:
+        formatted_statement = statement
+        formatted_parameter_names = {}
+
+        if variable_names is not None:
+            formatted_variable_names = {
+                variable_name: f"${self._handle_column_name(variable_name)}" for variable_name in variable_names
+            }
+            formatted_statement = formatted_statement % formatted_variable_names
+            formatted_parameter_names = {variable_name: f"${variable_name}" for variable_name in variable_names}
+
+        formatted_statement = formatted_statement.replace("%%", "%")
+        return formatted_statement, formatted_parameter_names
+
+    def _get_statement_template(
+        self,
+        statement: str,
+        variable_names: Optional[AbstractSet[str]],
+        statement_templates: Optional[MutableMapping[Any, Tuple[str, Mapping[str, str]]]] = None,
+    ) -> Tuple[str, Mapping[str, str]]:
+        if statement_templates is None:
+            return self._build_statement_template(statement, variable_names)
+
+        cache_key = (statement, variable_names)
+        template = statement_templates.get(cache_key)
+        if template is None:
+            template = self._build_statement_template(statement, variable_names)
+            statement_templates[cache_key] = template
+        return template
+
     def _format_variables(
         self,
         statement: str,
         parameters: Optional[Union[Sequence[Mapping[str, Any]], Mapping[str, Any]]],
         execute_many: bool,
+        statement_templates: Optional[MutableMapping[Any, Tuple[str, Mapping[str, str]]]] = None,
     ) -> Tuple[str, Optional[Union[Sequence[Mapping[str, Any]], Mapping[str, Any]]]]:
-        formatted_statement = statement
-        formatted_parameters = None
-
+        variable_names = None
         if parameters:
             if execute_many:
-                parameters_sequence: Sequence[Mapping[str, Any]] = parameters
-                variable_names = set()
-                formatted_parameters = []
-                for i in range(len(parameters_sequence)):
-                    variable_names.update(set(parameters_sequence[i].keys()))
-                    formatted_parameters.append({f"${k}": v for k, v in parameters_sequence[i].items()})
+                variable_names = frozenset().union(*(parameters_entry.keys() for parameters_entry in parameters))
             else:
-                variable_names = set(parameters.keys())
-                formatted_parameters = {f"${k}": v for k, v in parameters.items()}
+                variable_names = frozenset(parameters.keys())
 
-            formatted_variable_names = {
-                variable_name: f"${self._handle_column_name(variable_name)}" for variable_name in variable_names
-            }
-            formatted_statement = formatted_statement % formatted_variable_names
+        formatted_statement, formatted_parameter_names = self._get_statement_template(
+            statement, variable_names, statement_templates
+        )
+
+        formatted_parameters = None
+        if parameters:
+            if execute_many:
+                formatted_parameters = [
+                    {formatted_parameter_names[k]: v for k, v in parameters_entry.items()}
+                    for parameters_entry in parameters
+                ]
+            else:
+                formatted_parameters = {formatted_parameter_names[k]: v for k, v in parameters.items()}
 
-        formatted_statement = formatted_statement.replace("%%", "%")
         return formatted_statement, formatted_parameters
 
     def _add_declare_for_yql_stmt_vars_impl(self, statement, parameters_types):
@@ -489,18 +960,21 @@ class YqlDialect(StrCompileDialect):
         execute_many: bool = False,
     ) -> Tuple[Optional[Union[Sequence[Mapping[str, Any]], Mapping[str, Any]]]]:
         is_ddl = context.isddl if context is not None else False
+        statement_templates = None
+        if not is_ddl and context is not None and context.compiled is not None:
+            statement_templates = context.compiled._statement_templates
 
         if not is_ddl and parameters:
             parameters_types = context.compiled.get_bind_types(parameters)
             if parameters_types != {}:
                 parameters = self.__merge_parameters_values_and_types(parameters, parameters_types, execute_many)
-            statement, parameters = self._format_variables(statement, parameters, execute_many)
+            statement, parameters = self._format_variables(statement, parameters, execute_many, statement_templates)
             if self._add_declare_for_yql_stmt_vars:
                 statement = self._add_declare_for_yql_stmt_vars_impl(statement, parameters_types)
             statement = self._apply_statement_prefixes_impl(statement)
             return statement, parameters
 
-        statement, parameters = self._format_variables(statement, parameters, execute_many)
+        statement, parameters = self._format_variables(statement, parameters, execute_many, statement_templates)
         statement = self._apply_statement_prefixes_impl(statement)
         return statement, parameters
 
@@ -513,6 +987,161 @@ class YqlDialect(StrCompileDialect):
             cursor.close()
         return True
 
+    def _is_as_table_executemany_supported(
+        self,
+        context: Optional[DefaultExecutionContext],
+        parameters: Optional[Sequence[Mapping[str, Any]]],
+    ) -> bool:
+        if context is None or context.isddl or not context.isinsert or not parameters:
+            return False
+
+        compiled = context.compiled
+        compile_state = compiled.compile_state
+        if compiled.statement.select is not None or compiled.postfetch:
+            return False
+        # Explicit .values() may contain SQL expressions which can not be moved into AS_TABLE rows
+        if compile_state._dict_parameters is not None or compile_state._has_multi_parameters:
+            return False
+
+        keys = parameters[0].keys()
+        if set(keys) != set(compiled.bind_names.values()) or any(key not in compile_state.dml_table.c for key in keys):
+            return False
+        return all(parameters_entry.keys() == keys for parameters_entry in parameters)
+
+    def _split_as_table_rows(self, rows: Sequence[Mapping[str, Any]]) -> Iterator[List[Mapping[str, Any]]]:
+        return _split_rows(rows, self._executemany_as_table_max_rows, self._executemany_as_table_max_bytes)
+
+    def _get_key_addressed_columns(
+        self,
+        context: DefaultExecutionContext,
+        parameters: Sequence[Mapping[str, Any]],
+    ) -> Optional[Mapping[str, sa.Column]]:
+        """Columns of parameters of an UPDATE or DELETE which finds rows by primary key bind parameters,
+        e.g. an ORM bulk update, or ``None`` if the statement can't be turned into ``UPDATE ON``/``DELETE ON``."""
+        compiled = context.compiled
+        compile_state = compiled.compile_state
+        table = compile_state.dml_table
+        # SQLAlchemy 1.4 doesn't set postfetch of DELETE
+        postfetch = getattr(compiled, "postfetch", None)
+        if compiled.statement._returning or postfetch or getattr(compile_state, "_extra_froms", None):
+            return None
+        if compile_state._dict_parameters is not None or not isinstance(table, sa.Table):
+            return None
+
+        columns_by_key = {}
+        for criterion in compiled.statement._where_criteria:
+            for clause in _iterate_and_clauses(criterion):
+                if not (
+                    isinstance(clause, sa.sql.elements.BinaryExpression)
+                    and clause.operator is sa.sql.operators.eq
+                    and isinstance(clause.left, sa.Column)
+                    and clause.left.table is table
+                    and isinstance(clause.right, sa.sql.elements.BindParameter)
+                    and not clause.right.unique
+                ):
+                    return None
+                columns_by_key[compiled.bind_names[clause.right]] = clause.left
+        if sorted(columns_by_key.values(), key=id) != sorted(table.primary_key.columns, key=id):
+            return None
+
+        keys = parameters[0].keys()
+        if set(keys) != set(compiled.bind_names.values()) or not all(entry.keys() == keys for entry in parameters):
+            return None
+        set_keys = [key for key in keys if key not in columns_by_key]
+        if context.isdelete and set_keys or context.isupdate and not set_keys:
+            return None
+        for key in set_keys:
+            if key not in table.c or table.c[key] in columns_by_key.values():
+                return None
+            columns_by_key[key] = table.c[key]
+        return columns_by_key
+
+    def _get_as_table_executemany_columns(
+        self,
+        context: Optional[DefaultExecutionContext],
+        parameters: Optional[Sequence[Mapping[str, Any]]],
+    ) -> Optional[Mapping[str, sa.Column]]:
+        if context is None or context.compiled is None or context.isddl or not parameters:
+            return None
+        if context.isinsert:
+            # UPDATE ON and DELETE ON exist to apply many rows at once, they always read them from AS_TABLE
+            if not self._executemany_as_table and not isinstance(context.compiled.statement, (UpdateOn, DeleteOn)):
+                return None
+            if not self._is_as_table_executemany_supported(context, parameters):
+                return None
+            table = context.compiled.compile_state.dml_table
+            return {key: table.c[key] for key in parameters[0].keys()}
+        if self._executemany_update_delete_on and (context.isupdate or context.isdelete):
+            return self._get_key_addressed_columns(context, parameters)
+        return None
+
+    def _prepare_as_table_executemany(
+        self,
+        context: DefaultExecutionContext,
+        columns_by_key: Mapping[str, sa.Column],
+        parameters: Sequence[Mapping[str, Any]],
+    ) -> Iterator[Tuple[str, Mapping[str, ydb.TypedValue]]]:
+        compiled = context.compiled
+        table = compiled.compile_state.dml_table
+        columns = list(columns_by_key.values())
+
+        struct_type = types.StructType(
+            {column.name: types.Optional(column.type) if column.nullable else column.type for column in columns}
+        )
+        rows_type = compiled._get_type_compiler().get_ydb_type(types.ListType(struct_type), is_optional=False)
+
+        table_name = self.identifier_preparer.format_table(table)
+        statement = compiled.statement
+        if isinstance(statement, Upsert):
+            target = f"UPSERT INTO {table_name}"
+        elif isinstance(statement, Replace):
+            target = f"REPLACE INTO {table_name}"
+        elif isinstance(statement, UpdateOn) or context.isupdate:
+            target = f"UPDATE {table_name} ON"
+        elif isinstance(statement, DeleteOn) or context.isdelete:
+            target = f"DELETE FROM {table_name} ON"
+        else:
+            target = f"INSERT INTO {table_name}"
+        column_names = ", ".join(self.identifier_preparer.format_column(column) for column in columns)
+        operation = f"{target} ({column_names})\nSELECT {column_names} FROM AS_TABLE({AS_TABLE_ROWS_PARAMETER})"
+        if self._add_declare_for_yql_stmt_vars:
+            operation = self._add_declare_for_yql_stmt_vars_impl(operation, {AS_TABLE_ROWS_PARAMETER: rows_type})
+        operation = self._apply_statement_prefixes_impl(operation)
+
+        column_names_by_key = {key: column.name for key, column in columns_by_key.items()}
+        for chunk in self._split_as_table_rows(parameters):
+            rows = [{column_names_by_key[key]: value for key, value in row.items()} for row in chunk]
+            yield operation, {AS_TABLE_ROWS_PARAMETER: ydb.TypedValue(rows, rows_type)}
+
+    def _get_insertmanyvalues_page_size(
+        self, compiled: YqlCompiler, parameters: Sequence[Mapping[str, Any]], page_size: int
+    ) -> int:
+        """``page_size`` reduced so that pages fit into ``_insertmanyvalues_max_bytes`` of parameter values
+        and ``_insertmanyvalues_max_query_size`` of query text, estimated by the largest row."""
+        row_size = max(sum(_estimate_value_size(value) for value in row.values()) for row in parameters)
+        parameter_text_size = INSERTMANYVALUES_PARAMETER_TEXT_SIZE
+        if self._add_declare_for_yql_stmt_vars:
+            parameter_text_size += INSERTMANYVALUES_DECLARED_PARAMETER_TEXT_SIZE
+        row_text_size = len(compiled._insertmanyvalues.single_values_expr) + sum(
+            len(key) + parameter_text_size for key in parameters[0].keys()
+        )
+        query_text_size = self._insertmanyvalues_max_query_size - len(compiled.string)
+
+        page_size = min(
+            page_size, self._insertmanyvalues_max_bytes // max(row_size, 1), query_text_size // row_text_size
+        )
+        return max(page_size, 1)
+
+    def _prepare_insertmanyvalues(self, context: DefaultExecutionContext) -> None:
+        if self._get_as_table_executemany_columns(context, context.parameters) is not None:
+            # Rows are sent in a single AS_TABLE parameter by do_executemany instead of a VALUES list
+            context.execute_style = ExecuteStyle.EXECUTEMANY
+            return
+
+        page_size = context.execution_options.get("insertmanyvalues_page_size", self.insertmanyvalues_page_size)
+        page_size = self._get_insertmanyvalues_page_size(context.compiled, context.parameters, page_size)
+        context.execution_options = context.execution_options.union({"insertmanyvalues_page_size": page_size})
+
     def do_executemany(
         self,
         cursor: ydb_dbapi.Cursor,
@@ -520,9 +1149,32 @@ class YqlDialect(StrCompileDialect):
         parameters: Optional[Sequence[Mapping[str, Any]]],
         context: Optional[DefaultExecutionContext] = None,
     ) -> None:
+        if self._is_batch_statement(context):
+            for parameters_entry in parameters:
+                self.do_execute(cursor, statement, parameters_entry, context)
+            return
+
+        columns_by_key = self._get_as_table_executemany_columns(context, parameters)
+        if columns_by_key is not None:
+            for operation, chunk_parameters in self._prepare_as_table_executemany(context, columns_by_key, parameters):
+                cursor.execute(operation, chunk_parameters)
+            return
+
         operation, parameters = self._prepare_ydb_query(statement, context, parameters, execute_many=True)
         cursor.executemany(operation, parameters)
 
+    def _is_batch_statement(self, context: Optional[DefaultExecutionContext]) -> bool:
+        if context is None or context.compiled is None:
+            return False
+        return isinstance(context.compiled.statement, (BatchUpdate, BatchDelete))
+
+    def _ensure_no_interactive_transaction(self, context: DefaultExecutionContext) -> None:
+        if context._dbapi_connection.dbapi_connection._tx_context is not None:
+            raise ydb_dbapi.ProgrammingError(
+                "BATCH UPDATE and BATCH DELETE can't be executed in an interactive transaction, "
+                "use them with the AUTOCOMMIT isolation level"
+            )
+
     def do_execute(
         self,
         cursor: ydb_dbapi.Cursor,
@@ -532,7 +1184,11 @@ class YqlDialect(StrCompileDialect):
     ) -> None:
         operation, parameters = self._prepare_ydb_query(statement, context, parameters, execute_many=False)
         is_ddl = context.isddl if context is not None else False
-        if is_ddl:
+        if self._is_batch_statement(context):
+            self._ensure_no_interactive_transaction(context)
+            # BATCH statements run without a transaction, the same way as schema queries
+            cursor.execute_scheme(operation, parameters)
+        elif is_ddl:
             cursor.execute_scheme(operation, parameters)
         else:
             cursor.execute(operation, parameters)
@@ -545,3 +1201,47 @@ class AsyncYqlDialect(YqlDialect):
 
     def connect(self, *cargs, **cparams):
         return AdaptedAsyncConnection(util.await_only(self.dbapi.async_connect(*cargs, **cparams)))
+
+    def _describe_table_names(
+        self, dbapi_connection: AdaptedAsyncConnection, table_names: Sequence[str]
+    ) -> List[Union[ydb.TableDescription, ydb_dbapi.ProgrammingError]]:
+        async_connection = dbapi_connection._connection
+
+        async def describe_all():
+            semaphore = asyncio.Semaphore(self._reflection_max_workers)
+
+            async def describe(table_name):
+                async with semaphore:
+                    try:
+                        return await async_connection.describe(table_name)
+                    except ydb_dbapi.ProgrammingError as e:
+                        if not _is_scheme_error(e):
+                            raise
+                        return e
+
+            return await asyncio.gather(*(describe(table_name) for table_name in table_names))
+
+        return list(util.await_only(describe_all()))
+
+    def _retry_operation(self, dbapi_connection, callee: Callable[[], Any]) -> Any:
+        return util.await_only(retry_operation_async(callee, dbapi_connection.get_ydb_retry_settings()))
+
+    def _walk_scheme(self, dbapi_connection, entry_types, scheme_filter, max_depth) -> List[str]:
+        root = posixpath.join(dbapi_connection.database, dbapi_connection.table_path_prefix)
+        settings = dbapi_connection._get_request_settings()
+        retry_settings = dbapi_connection.get_ydb_retry_settings()
+        scheme_client = dbapi_connection._driver.scheme_client
+
+        def list_directory(path):
+            return retry_operation_async(lambda: scheme_client.list_directory(path, settings=settings), retry_settings)
+
+        return util.await_only(
+            _async_walk_scheme(
+                list_directory, root, entry_types, scheme_filter, max_depth, self._reflection_max_workers
+            )
+        )
+
+    def _create_server_side_cursor(
+        self, dbapi_connection: AdaptedAsyncConnection, result_format: str = VALUE_RESULT_FORMAT
+    ) -> AdaptedAsyncStreamingCursor:
+        return AdaptedAsyncStreamingCursor(dbapi_connection._connection, result_format)
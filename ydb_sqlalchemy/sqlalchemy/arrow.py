@@ -0,0 +1,36 @@
+from typing import Iterator
+
+import sqlalchemy as sa
+
+from .cursors import ARROW_RESULT_FORMAT, StreamingCursor
+
+
+def _get_arrow_cursor(result: sa.engine.CursorResult) -> StreamingCursor:
+    cursor = result.context.cursor
+    if not isinstance(cursor, StreamingCursor) or cursor._result_format != ARROW_RESULT_FORMAT:
+        raise sa.exc.ArgumentError("Statement must be executed with ydb_result_format='arrow' execution option")
+    return cursor
+
+
+def iter_arrow_batches(result: sa.engine.CursorResult) -> Iterator["pyarrow.RecordBatch"]:  # noqa: F821
+    """Iterate over ``pyarrow.RecordBatch`` objects of a result executed with ``ydb_result_format="arrow"``.
+
+    Batches are read from the query stream one result set part at a time, the result is closed when exhausted.
+    """
+    cursor = _get_arrow_cursor(result)
+    try:
+        yield from cursor.fetch_arrow_batches()
+    finally:
+        result.close()
+
+
+def fetch_arrow(result: sa.engine.CursorResult) -> "pyarrow.Table":  # noqa: F821
+    """Read a result executed with ``ydb_result_format="arrow"`` into ``pyarrow.Table``."""
+    import pyarrow
+
+    cursor = _get_arrow_cursor(result)
+    batches = list(iter_arrow_batches(result))
+    if batches:
+        return pyarrow.Table.from_batches(batches)
+    schema = cursor.arrow_schema
+    return schema.empty_table() if schema is not None else pyarrow.table({})
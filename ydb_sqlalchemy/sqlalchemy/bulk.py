@@ -0,0 +1,104 @@
+import collections.abc
+import itertools
+from typing import Any, Iterable, Iterator, List, Mapping, Union
+
+import sqlalchemy as sa
+import ydb
+
+BULK_UPSERT_MAX_ROWS = 10000
+BULK_UPSERT_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _estimate_value_size(value) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, collections.abc.Mapping):
+        return sum(_estimate_value_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_value_size(v) for v in value)
+    return 8
+
+
+def _split_rows(rows: Iterable[Mapping[str, Any]], max_rows: int, max_bytes: int) -> Iterator[List[Mapping[str, Any]]]:
+    chunk = []
+    chunk_size = 0
+    for row in rows:
+        row_size = sum(_estimate_value_size(value) for value in row.values())
+        if chunk and (len(chunk) >= max_rows or chunk_size + row_size > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_size = 0
+        chunk.append(row)
+        chunk_size += row_size
+    if chunk:
+        yield chunk
+
+
+def _get_table(table_or_entity: Any) -> sa.Table:
+    if isinstance(table_or_entity, sa.Table):
+        return table_or_entity
+    table = getattr(sa.inspect(table_or_entity, raiseerr=False), "local_table", None)
+    if not isinstance(table, sa.Table):
+        raise sa.exc.ArgumentError(f"Table or ORM mapped class expected, got {table_or_entity!r}")
+    return table
+
+
+def bulk_upsert(
+    connection: sa.engine.Connection,
+    table: Union[sa.Table, Any],
+    rows: Iterable[Mapping[str, Any]],
+    max_rows: int = BULK_UPSERT_MAX_ROWS,
+    max_bytes: int = BULK_UPSERT_MAX_BYTES,
+) -> None:
+    """Upsert rows into a table through YDB BulkUpsert API.
+
+    Rows are mappings keyed by column keys, all of them must have the same keys as the first row.
+    Rows are sent in batches limited by ``max_rows`` and by the estimated size of values ``max_bytes``.
+    BulkUpsert is not transactional: each batch is applied independently of the current transaction.
+    """
+    table = _get_table(table)
+    dialect = connection.dialect
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+
+    keys = frozenset(first_row.keys())
+    missing_keys = keys.difference(table.c.keys())
+    if missing_keys:
+        raise sa.exc.ArgumentError(f"Unknown columns for table {table.name!r}: {', '.join(sorted(missing_keys))}")
+
+    columns = [column for column in table.c if column.key in keys]
+    column_types = ydb.BulkUpsertColumns()
+    processors = {}
+    for column in columns:
+        column_types.add_column(
+            column.name, dialect.type_compiler.get_ydb_type(column.type, is_optional=column.nullable)
+        )
+        processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+        if processor is not None:
+            processors[column.key] = processor
+
+    def process_rows():
+        for row in itertools.chain((first_row,), rows):
+            if row.keys() != keys:
+                raise sa.exc.ArgumentError(f"All rows must have the same keys: {', '.join(sorted(keys))}")
+            yield {
+                column.name: processors[column.key](row[column.key]) if column.key in processors else row[column.key]
+                for column in columns
+            }
+
+    dbapi_connection = connection.connection
+    for chunk in _split_rows(process_rows(), max_rows, max_bytes):
+        dbapi_connection.bulk_upsert(table.name, chunk, column_types)
+
+
+async def async_bulk_upsert(
+    connection: Any,
+    table: Union[sa.Table, Any],
+    rows: Iterable[Mapping[str, Any]],
+    max_rows: int = BULK_UPSERT_MAX_ROWS,
+    max_bytes: int = BULK_UPSERT_MAX_BYTES,
+) -> None:
+    """Async variant of :func:`bulk_upsert` for ``sqlalchemy.ext.asyncio.AsyncConnection``."""
+    await connection.run_sync(bulk_upsert, table, rows, max_rows=max_rows, max_bytes=max_bytes)
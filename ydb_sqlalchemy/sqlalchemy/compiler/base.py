@@ -1,8 +1,11 @@
 import collections
+import functools
+import weakref
 import sqlalchemy as sa
 import ydb
 from ydb_dbapi import NotSupportedError
 
+from sqlalchemy import util
 from sqlalchemy.exc import CompileError
 from sqlalchemy.sql import ddl
 from sqlalchemy.sql.compiler import (
@@ -33,6 +36,22 @@ except ImportError:
 
 
 from .. import types
+from ..ddl import (
+    CREATE_TABLE_OPTIONS,
+    INDEX_TYPES,
+    READ_REPLICAS_ZONES,
+    ROW_TABLE_OPTIONS,
+    TABLE_STORES,
+    TTL,
+    VECTOR_INDEX_KEYWORD_OPTIONS,
+    AddChangefeed,
+    Changefeed,
+    ColumnFamily,
+    DropChangefeed,
+    ResetTableOptions,
+    SetTableOptions,
+    format_interval,
+)
 
 
 OLD_SA = sa.__version__ < "2."
@@ -171,101 +190,128 @@ class BaseYqlTypeCompiler(StrSQLTypeCompiler):
             rendered_types.append(f"{field}:{type_str}")
         return f"Struct<{','.join(rendered_types)}>"
 
-    def get_ydb_type(
+    def _get_numeric_ydb_type(self, type_: sa.Numeric) -> ydb.DecimalType:
+        precision = getattr(type_, "precision", None) or 22
+        scale = getattr(type_, "scale", None) or 9
+        return ydb.DecimalType(precision, scale)
+
+    def _get_list_ydb_type(self, type_: Union[types.ListType, sa.ARRAY]) -> ydb.ListType:
+        return ydb.ListType(self.get_ydb_type(type_.item_type, is_optional=False))
+
+    def _get_tuple_ydb_type(self, type_: sa.TupleType) -> ydb.TupleType:
+        ydb_type = ydb.TupleType()
+        for item_type in type_.types:
+            ydb_type.add_element(self.get_ydb_type(item_type, is_optional=False))
+        return ydb_type
+
+    def _get_struct_ydb_type(self, type_: types.StructType) -> ydb.StructType:
+        ydb_type = ydb.StructType()
+        for field, field_type in type_.fields_types.items():
+            inner_type = to_instance(field_type)
+            ydb_type.add_member(field, self.get_ydb_type(inner_type, is_optional=False))
+        return ydb_type
+
+    # SQLAlchemy type class -> YDB type or a function building YDB type from the SQLAlchemy type instance.
+    # Lookup goes through the MRO of the type class, so the most specific registered class wins.
+    ydb_types_map = {
+        sa.String: ydb.PrimitiveType.Utf8,
+        # Integers
+        sa.Integer: ydb.PrimitiveType.Int64,
+        types.UInt64: ydb.PrimitiveType.Uint64,
+        types.UInt32: ydb.PrimitiveType.Uint32,
+        types.UInt16: ydb.PrimitiveType.Uint16,
+        types.UInt8: ydb.PrimitiveType.Uint8,
+        types.Int64: ydb.PrimitiveType.Int64,
+        types.Int32: ydb.PrimitiveType.Int32,
+        types.Int16: ydb.PrimitiveType.Int16,
+        types.Int8: ydb.PrimitiveType.Int8,
+        # Json
+        sa.JSON: ydb.PrimitiveType.Json,
+        sa.JSON.JSONStrIndexType: ydb.PrimitiveType.Utf8,
+        sa.JSON.JSONIntIndexType: ydb.PrimitiveType.Int64,
+        sa.JSON.JSONPathType: ydb.PrimitiveType.Utf8,
+        # Date and time
+        sa.Date: ydb.PrimitiveType.Date,
+        sa.DateTime: ydb.PrimitiveType.Timestamp,
+        sa.TIMESTAMP: ydb.PrimitiveType.Timestamp,
+        sa.DATETIME: ydb.PrimitiveType.Datetime,
+        types.YqlDateTime: ydb.PrimitiveType.Datetime,
+        types.YqlDate32: ydb.PrimitiveType.Date32,
+        types.YqlTimestamp64: ydb.PrimitiveType.Timestamp64,
+        types.YqlDateTime64: ydb.PrimitiveType.Datetime64,
+        _BinaryType: ydb.PrimitiveType.String,
+        sa.Float: ydb.PrimitiveType.Float,
+        sa.Boolean: ydb.PrimitiveType.Bool,
+        sa.Numeric: _get_numeric_ydb_type,
+        # Containers
+        types.ListType: _get_list_ydb_type,
+        sa.ARRAY: _get_list_ydb_type,
+        sa.TupleType: _get_tuple_ydb_type,
+        types.StructType: _get_struct_ydb_type,
+    }
+
+    def __init__(self, dialect):
+        super().__init__(dialect)
+        self._ydb_types_cache = weakref.WeakKeyDictionary()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_ydb_types_map_entry(cls, type_cls: Type[sa.types.TypeEngine]) -> Any:
+        for base_cls in type_cls.__mro__:
+            if base_cls in cls.ydb_types_map:
+                return cls.ydb_types_map[base_cls]
+        return None
+
+    def _resolve_ydb_type(
         self, type_: sa.types.TypeEngine, is_optional: bool
     ) -> Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]:
         if isinstance(type_, sa.TypeDecorator):
             type_ = type_.impl
 
-        if isinstance(type_, (sa.Text, sa.String)):
-            ydb_type = ydb.PrimitiveType.Utf8
-
-        elif isinstance(type_, types.Optional):
+        if isinstance(type_, types.Optional):
             inner = to_instance(type_.element_type)
             return self.get_ydb_type(inner, is_optional=True)
 
-        # Integers
-        elif isinstance(type_, types.UInt64):
-            ydb_type = ydb.PrimitiveType.Uint64
-        elif isinstance(type_, types.UInt32):
-            ydb_type = ydb.PrimitiveType.Uint32
-        elif isinstance(type_, types.UInt16):
-            ydb_type = ydb.PrimitiveType.Uint16
-        elif isinstance(type_, types.UInt8):
-            ydb_type = ydb.PrimitiveType.Uint8
-        elif isinstance(type_, types.Int64):
-            ydb_type = ydb.PrimitiveType.Int64
-        elif isinstance(type_, types.Int32):
-            ydb_type = ydb.PrimitiveType.Int32
-        elif isinstance(type_, types.Int16):
-            ydb_type = ydb.PrimitiveType.Int16
-        elif isinstance(type_, types.Int8):
-            ydb_type = ydb.PrimitiveType.Int8
-        elif isinstance(type_, sa.Integer):
-            ydb_type = ydb.PrimitiveType.Int64
-        # Integers
-
-        # Json
-        elif isinstance(type_, sa.JSON):
-            ydb_type = ydb.PrimitiveType.Json
-        elif isinstance(type_, sa.JSON.JSONStrIndexType):
-            ydb_type = ydb.PrimitiveType.Utf8
-        elif isinstance(type_, sa.JSON.JSONIntIndexType):
-            ydb_type = ydb.PrimitiveType.Int64
-        elif isinstance(type_, sa.JSON.JSONPathType):
-            ydb_type = ydb.PrimitiveType.Utf8
-        elif isinstance(type_, types.YqlJSON):
-            ydb_type = ydb.PrimitiveType.Json
-        elif isinstance(type_, types.YqlJSON.YqlJSONPathType):
-            ydb_type = ydb.PrimitiveType.Utf8
-        # Json
-        elif isinstance(type_, types.YqlDate32):
-            ydb_type = ydb.PrimitiveType.Date32
-        elif isinstance(type_, types.YqlTimestamp64):
-            ydb_type = ydb.PrimitiveType.Timestamp64
-        elif isinstance(type_, types.YqlDateTime64):
-            ydb_type = ydb.PrimitiveType.Datetime64
-        elif isinstance(type_, sa.DATETIME):
-            ydb_type = ydb.PrimitiveType.Datetime
-        elif isinstance(type_, sa.TIMESTAMP):
-            ydb_type = ydb.PrimitiveType.Timestamp
-        elif isinstance(type_, sa.DateTime):
-            ydb_type = ydb.PrimitiveType.Timestamp
-        elif isinstance(type_, sa.Date):
-            ydb_type = ydb.PrimitiveType.Date
-        elif isinstance(type_, _BinaryType):
-            ydb_type = ydb.PrimitiveType.String
-        elif isinstance(type_, sa.Float):
-            ydb_type = ydb.PrimitiveType.Float
-        elif isinstance(type_, sa.Boolean):
-            ydb_type = ydb.PrimitiveType.Bool
-        elif isinstance(type_, sa.Numeric):
-            precision = getattr(type_, "precision", None) or 22
-            scale = getattr(type_, "scale", None) or 9
-            ydb_type = ydb.DecimalType(precision, scale)
-        elif isinstance(type_, (types.ListType, sa.ARRAY)):
-            ydb_type = ydb.ListType(self.get_ydb_type(type_.item_type, is_optional=False))
-        elif isinstance(type_, sa.TupleType):
-            ydb_type = ydb.TupleType()
-            for item_type in type_.types:
-                ydb_type.add_element(self.get_ydb_type(item_type, is_optional=False))
-        elif isinstance(type_, types.StructType):
-            ydb_type = ydb.StructType()
-            for field, field_type in type_.fields_types.items():
-                inner_type = to_instance(field_type)
-                ydb_type.add_member(field, self.get_ydb_type(inner_type, is_optional=False))
-        else:
+        ydb_type = self._get_ydb_types_map_entry(type(type_))
+        if ydb_type is None:
             raise NotSupportedError(f"{type_} bind variables not supported")
+        if callable(ydb_type):
+            ydb_type = ydb_type(self, type_)
 
         if is_optional:
             return ydb.OptionalType(ydb_type)
 
         return ydb_type
 
+    def get_ydb_type(
+        self, type_: sa.types.TypeEngine, is_optional: bool
+    ) -> Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]:
+        try:
+            resolved_types = self._ydb_types_cache.setdefault(type_, {})
+        except TypeError:
+            # Type can not be weak referenced or hashed
+            return self._resolve_ydb_type(type_, is_optional)
+
+        ydb_type = resolved_types.get(is_optional)
+        if ydb_type is None:
+            ydb_type = resolved_types[is_optional] = self._resolve_ydb_type(type_, is_optional)
+        return ydb_type
+
 
 class BaseYqlCompiler(StrSQLCompiler):
     compound_keywords = COMPOUND_KEYWORDS
     _type_compiler_cls = BaseYqlTypeCompiler
+    _bind_types_cache_size = 100
+    _statement_templates_cache_size = 100
+
+    def __init__(self, *args, **kwargs):
+        # Compiled statements are reused through the SQLAlchemy statement cache,
+        # so bind types and final YQL texts built for one parameters shape are reused as well.
+        self._bind_types_cache = util.LRUCache(self._bind_types_cache_size)
+        self._statement_templates = util.LRUCache(self._statement_templates_cache_size)
+        self._in_list_bindparams = {}
+        self._in_list_bind_names = set()
+        super().__init__(*args, **kwargs)
 
     def get_from_hint_text(self, table, text):
         return text
@@ -351,6 +397,26 @@ class BaseYqlCompiler(StrSQLCompiler):
             + [name]
         ) % {"expr": self.function_argspec(func, **kwargs)}
 
+    def visit_vector_index_view(self, view, asfrom=False, **kw):
+        table_text = self.process(view.table, asfrom=True, **kw)
+        return f"{table_text} VIEW {self.preparer.format_index(view.index)}"
+
+    def visit_batch_update(self, update_stmt, **kw):
+        if update_stmt._returning:
+            raise CompileError("BATCH UPDATE doesn't support RETURNING")
+        return "BATCH " + self.visit_update(update_stmt, **kw)
+
+    def visit_batch_delete(self, delete_stmt, **kw):
+        if delete_stmt._returning:
+            raise CompileError("BATCH DELETE doesn't support RETURNING")
+        return "BATCH " + self.visit_delete(delete_stmt, **kw)
+
+    def _render_on_statement(self, insert_text: str, insert_stmt, verb: str, keyword: str) -> str:
+        # "INSERT INTO t (...) SELECT ..." -> "UPDATE t ON (...) SELECT ..." or "DELETE FROM t ON (...) SELECT ..."
+        table_name = self.preparer.format_table(insert_stmt.table)
+        text = insert_text.replace("INSERT", verb, 1)
+        return text.replace(f" INTO {table_name} ", f" {keyword}{table_name} ON ", 1)
+
     def visit_concat_func(self, func, **kwargs):
         arg_sql = " || ".join(self.process(arg, **kwargs) for arg in func.clauses)
         return arg_sql
@@ -362,6 +428,50 @@ class BaseYqlCompiler(StrSQLCompiler):
                 return column.nullable and not column.primary_key
         return False
 
+    def visit_bindparam(self, bindparam, **kw):
+        if (
+            bindparam.expanding
+            and self.dialect._render_in_as_list
+            and not bindparam.literal_execute
+            and not kw.get("literal_binds")
+            and not kw.get("literal_execute")
+            and not isinstance(bindparam.type, sa.TupleType)
+        ):
+            bindparam = self._get_in_list_bindparam(bindparam)
+            text = super().visit_bindparam(bindparam, **kw)
+            self._in_list_bind_names.add(self.bind_names[bindparam])
+            return text
+        return super().visit_bindparam(bindparam, **kw)
+
+    def _get_in_list_bindparam(self, bindparam):
+        """
+        Expanding parameter is rendered as a single List<T> parameter, e.g. `col IN $param`,
+        so the statement text does not depend on the number of values.
+        """
+        in_list_bindparam = self._in_list_bindparams.get(bindparam)
+        if in_list_bindparam is None:
+            in_list_bindparam = bindparam._clone(maintain_key=True)
+            in_list_bindparam.expanding = False
+            in_list_bindparam.type = types.ListType(bindparam.type.dialect_impl(self.dialect))
+            self._in_list_bindparams[bindparam] = in_list_bindparam
+        return in_list_bindparam
+
+    def _guess_in_list_bind_type(self, bind, post_compile_bind_values: list) -> Optional[sa.types.TypeEngine]:
+        items = [item for value in post_compile_bind_values if value is not None for item in value]
+        not_null_items = [item for item in items if item is not None]
+
+        item_type = bind.type.item_type
+        if isinstance(item_type, sa.types.NullType):
+            if not not_null_items:
+                return None
+            item_type = _bindparam("", not_null_items[0]).type
+            if isinstance(item_type, sa.types.NullType):
+                return None
+
+        if len(not_null_items) != len(items):
+            item_type = types.Optional(item_type)
+        return types.ListType(item_type)
+
     def _guess_bound_variable_type_by_parameters(
         self, bind, post_compile_bind_values: list
     ) -> Optional[sa.types.TypeEngine]:
@@ -376,22 +486,58 @@ class BaseYqlCompiler(StrSQLCompiler):
 
         return bind_type
 
-    def _get_expanding_bind_names(self, bind_name: str, parameters_values: Mapping[str, List[Any]]) -> List[Any]:
-        expanding_bind_names = []
+    def _group_expanding_bind_names(self, parameters_values: Mapping[str, List[Any]]) -> Dict[str, List[str]]:
+        # Expanding parameter `name` is passed as `name_1`, `name_2`, ...
+        expanding_bind_names = collections.defaultdict(list)
         for parameter_name in parameters_values:
-            parameter_bind_name = "_".join(parameter_name.split("_")[:-1])
-            if parameter_bind_name == bind_name:
-                expanding_bind_names.append(parameter_name)
+            expanding_bind_names[parameter_name.rpartition("_")[0]].append(parameter_name)
         return expanding_bind_names
 
+    def _group_insertmanyvalues_parameters(
+        self, parameters_values: Mapping[str, List[Any]]
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, List[str]]]:
+        # Parameter `name` of rows of an "insertmanyvalues" page is passed as `name__0`, `name__1`, ...
+        bind_names = {self.escaped_bind_names.get(name, name) for name in self.bind_names.values()}
+        grouped_values = collections.defaultdict(list)
+        insertmanyvalues_bind_names = collections.defaultdict(list)
+        for parameter_name, parameter_values in parameters_values.items():
+            bind_name, _, row_index = parameter_name.rpartition("__")
+            if row_index.isdigit() and bind_name in bind_names and parameter_name not in bind_names:
+                insertmanyvalues_bind_names[bind_name].append(parameter_name)
+                grouped_values[bind_name].extend(parameter_values)
+            else:
+                grouped_values[parameter_name] = parameter_values
+        return grouped_values, insertmanyvalues_bind_names
+
     def render_bind_cast(self, type_, dbapi_type, sqltext):
         pass
 
+    def _get_type_compiler(self) -> BaseYqlTypeCompiler:
+        # Dialect-wide type compiler keeps resolved YDB types between statements
+        type_compiler = self.dialect.type_compiler
+        if not isinstance(type_compiler, self._type_compiler_cls):
+            type_compiler = self._type_compiler_cls(self.dialect)
+        return type_compiler
+
+    def _get_bind_types_cache_key(self, parameters_values: Mapping[str, List[Any]]) -> frozenset:
+        key = []
+        for parameter_name, parameter_values in parameters_values.items():
+            not_null_value_type = next((type(value) for value in parameter_values if value is not None), None)
+            key.append((parameter_name, not_null_value_type, None in parameter_values))
+            if parameter_name in self._in_list_bind_names:
+                items = [item for value in parameter_values if value is not None for item in value]
+                not_null_item_type = next((type(item) for item in items if item is not None), None)
+                key.append((parameter_name, not_null_item_type, None in items))
+        return frozenset(key)
+
     def get_bind_types(
         self, post_compile_parameters: Optional[Union[Sequence[Mapping[str, Any]], Mapping[str, Any]]]
     ) -> Dict[str, Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]]:
         """
         This method extracts information about bound variables from the table definition and parameters.
+
+        Resolved types depend only on parameter names, nullability and python types of values,
+        so they are memoized on the compiled statement.
         """
         if isinstance(post_compile_parameters, collections.abc.Mapping):
             post_compile_parameters = [post_compile_parameters]
@@ -401,6 +547,33 @@ class BaseYqlCompiler(StrSQLCompiler):
             for parameter_name, parameter_value in parameters_entry.items():
                 parameters_values[parameter_name].append(parameter_value)
 
+        insertmanyvalues_bind_names = None
+        if getattr(self, "_insertmanyvalues", None):
+            # Pages of an "insertmanyvalues" batch differ in numbers of rows, so types are memoized by bind names
+            parameters_values, insertmanyvalues_bind_names = self._group_insertmanyvalues_parameters(parameters_values)
+
+        cache_key = self._get_bind_types_cache_key(parameters_values)
+        parameter_types = self._bind_types_cache.get(cache_key)
+        if parameter_types is None:
+            parameter_types = self._resolve_bind_types(parameters_values)
+            self._bind_types_cache[cache_key] = parameter_types
+
+        if insertmanyvalues_bind_names:
+            page_types = {
+                name: ydb_type for name, ydb_type in parameter_types.items() if name not in insertmanyvalues_bind_names
+            }
+            for bind_name, parameter_names in insertmanyvalues_bind_names.items():
+                if bind_name in parameter_types:
+                    page_types.update(dict.fromkeys(parameter_names, parameter_types[bind_name]))
+            parameter_types = page_types
+        return parameter_types
+
+    def _resolve_bind_types(
+        self, parameters_values: Mapping[str, List[Any]]
+    ) -> Dict[str, Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]]:
+        type_compiler = self._get_type_compiler()
+        expanding_bind_names = None
+
         parameter_types = {}
         for bind_name in self.bind_names.values():
             bind = self.binds[bind_name]
@@ -408,27 +581,35 @@ class BaseYqlCompiler(StrSQLCompiler):
             if bind.literal_execute:
                 continue
 
-            if not bind.expanding:
+            if not bind.expanding and bind_name not in parameters_values and getattr(self, "_insertmanyvalues", None):
+                # Values of rows of an "insertmanyvalues" page are grouped by get_bind_types()
+                escaped_bind_name = self.escaped_bind_names.get(bind_name, bind_name)
+                post_compile_bind_names = [escaped_bind_name]
+                post_compile_bind_values = parameters_values.get(escaped_bind_name, [])
+            elif not bind.expanding:
                 post_compile_bind_names = [bind_name]
-                post_compile_bind_values = parameters_values[bind_name]
+                post_compile_bind_values = parameters_values.get(bind_name, [])
             else:
-                post_compile_bind_names = self._get_expanding_bind_names(bind_name, parameters_values)
+                if expanding_bind_names is None:
+                    expanding_bind_names = self._group_expanding_bind_names(parameters_values)
+                post_compile_bind_names = expanding_bind_names.get(bind_name, [])
                 post_compile_bind_values = []
-                for parameter_name, parameter_values in parameters_values.items():
-                    if parameter_name in post_compile_bind_names:
-                        post_compile_bind_values.extend(parameter_values)
+                for parameter_name in post_compile_bind_names:
+                    post_compile_bind_values.extend(parameters_values[parameter_name])
 
             is_optional = self._is_bound_to_nullable_column(bind_name)
             if not post_compile_bind_values or None in post_compile_bind_values:
                 is_optional = True
 
-            bind_type = self._guess_bound_variable_type_by_parameters(bind, post_compile_bind_values)
+            if bind_name in self._in_list_bind_names:
+                bind_type = self._guess_in_list_bind_type(bind, post_compile_bind_values)
+            else:
+                bind_type = self._guess_bound_variable_type_by_parameters(bind, post_compile_bind_values)
 
             if bind_type:
+                ydb_type = type_compiler.get_ydb_type(bind_type, is_optional)
                 for post_compile_bind_name in post_compile_bind_names:
-                    parameter_types[post_compile_bind_name] = self._type_compiler_cls(self.dialect).get_ydb_type(
-                        bind_type, is_optional
-                    )
+                    parameter_types[post_compile_bind_name] = ydb_type
 
         return parameter_types
 
@@ -456,6 +637,8 @@ class BaseYqlDDLCompiler(DDLCompiler):
 
         if index.name is None:
             raise CompileError("ADD INDEX requires that the index has a name")
+        if self._get_table_store(index.table.dialect_options["ydb"]) == "column":
+            raise CompileError("Secondary indexes are not supported by column tables")
 
         table_name = self.preparer.format_table(index.table)
         index_name = self._prepared_index_name(index)
@@ -464,6 +647,12 @@ class BaseYqlDDLCompiler(DDLCompiler):
 
         text += " SYNC" if not ydb_opts.get("async", False) else " ASYNC"
 
+        index_type = ydb_opts.get("type")
+        if index_type is not None:
+            if index_type not in INDEX_TYPES:
+                raise CompileError(f"Unknown index type {index_type!r}, expected one of {INDEX_TYPES}")
+            text += f" USING {index_type}"
+
         columns = [self.preparer.format_column(col) for col in index.columns.values()]
         cover_columns = [
             col if isinstance(col, str) else self.preparer.format_column(col) for col in ydb_opts.get("cover", [])
@@ -475,8 +664,22 @@ class BaseYqlDDLCompiler(DDLCompiler):
         if cover_columns:
             text += " COVER (" + ", ".join(cover_columns) + ")"
 
+        vector_options = ydb_opts.get("vector_options")
+        if (index_type is None) != (vector_options is None):
+            raise CompileError("Vector options require ydb_type='vector_kmeans_tree' and vice versa")
+        if vector_options:
+            text += f" WITH ({', '.join(self._render_vector_index_options(vector_options))})"
+
         return text
 
+    def _render_vector_index_options(self, vector_options: Mapping[str, Any]) -> List[str]:
+        options = []
+        for name, value in vector_options.items():
+            if isinstance(value, str) and name not in VECTOR_INDEX_KEYWORD_OPTIONS:
+                value = f'"{value}"'
+            options.append(f"{name}={value}")
+        return options
+
     def visit_drop_index(self, drop: ddl.DropIndex, **kw) -> str:
         index: sa.Index = drop.element
 
@@ -487,15 +690,164 @@ class BaseYqlDDLCompiler(DDLCompiler):
 
         return f"ALTER TABLE {table_name} DROP INDEX {index_name}"
 
+    def get_column_specification(self, column: sa.Column, **kw) -> str:
+        colspec = super().get_column_specification(column, **kw)
+        family = column.dialect_options["ydb"]["family"]
+        if family is None:
+            return colspec
+
+        # FAMILY goes right after the column type, before NOT NULL and DEFAULT
+        type_spec = (
+            self.preparer.format_column(column)
+            + " "
+            + self.dialect.type_compiler.process(column.type, type_expression=column)
+        )
+        if not colspec.startswith(type_spec):
+            raise CompileError(f"Can't place FAMILY of column {column.name!r} after its type in {colspec!r}")
+        return f"{type_spec} FAMILY {self.preparer.quote(family)}{colspec[len(type_spec):]}"
+
+    def create_table_constraints(self, table: sa.Table, **kw) -> str:
+        constraints = super().create_table_constraints(table, **kw)
+        families = [self._render_column_family(family) for family in table.dialect_options["ydb"]["families"] or ()]
+        return ", \n\t".join(filter(None, [constraints, *families]))
+
+    def _render_column_family(self, family: ColumnFamily) -> str:
+        settings = []
+        if family.data is not None:
+            settings.append(f'DATA = "{family.data}"')
+        if family.compression is not None:
+            settings.append(f'COMPRESSION = "{family.compression}"')
+        if family.compression_level is not None:
+            settings.append(f"COMPRESSION_LEVEL = {family.compression_level}")
+        return f"FAMILY {self.preparer.quote(family.name)} ({', '.join(settings)})"
+
     def post_create_table(self, table: sa.Table) -> str:
         ydb_opts = table.dialect_options["ydb"]
-        with_clause_list = self._render_table_partitioning_settings(ydb_opts)
+        text = self._render_partition_by_hash(table, ydb_opts)
+        with_clause_list = self._render_table_settings(ydb_opts)
         if with_clause_list:
             with_clause_text = ",\n".join(with_clause_list)
-            return f"\nWITH (\n\t{with_clause_text}\n)"
-        return ""
+            text += f"\nWITH (\n\t{with_clause_text}\n)"
+        return text
+
+    def _get_table_store(self, ydb_opts: Mapping[str, Any]) -> Optional[str]:
+        store = ydb_opts.get("store")
+        if store is None:
+            return None
+        if store.lower() not in TABLE_STORES:
+            raise CompileError(f"Unknown table store {store!r}, expected one of {TABLE_STORES}")
+        return store.lower()
+
+    def _render_partition_by_hash(self, table: sa.Table, ydb_opts: Mapping[str, Any]) -> str:
+        store = self._get_table_store(ydb_opts)
+        if store == "column":
+            row_options = sorted(option for option in ROW_TABLE_OPTIONS if ydb_opts[option] is not None)
+            if row_options:
+                raise CompileError(
+                    f"Options of row tables are not supported by column tables: {', '.join(row_options)}"
+                )
+        elif ydb_opts["partition_by_hash"] is not None or ydb_opts["partition_count"] is not None:
+            raise CompileError("partition_by_hash and partition_count require ydb_store='column'")
+
+        if ydb_opts["partition_by_hash"] is None:
+            return ""
+        column_names = [column if isinstance(column, str) else column.name for column in ydb_opts["partition_by_hash"]]
+        primary_key = {column.name for column in table.primary_key.columns}
+        if not column_names or not primary_key.issuperset(column_names):
+            raise CompileError("PARTITION BY HASH requires columns of the primary key")
+        return f"\nPARTITION BY HASH({', '.join(self.preparer.quote(name) for name in column_names)})"
+
+    def _render_table_settings(self, ydb_opts: Mapping[str, Any]) -> List[str]:
+        settings = []
+        store = self._get_table_store(ydb_opts)
+        if store is not None:
+            settings.append(f"STORE = {store.upper()}")
+        if ydb_opts.get("partition_count") is not None:
+            settings.append(f"PARTITION_COUNT = {ydb_opts['partition_count']}")
+        return (
+            settings
+            + self._render_table_partitioning_settings(ydb_opts)
+            + self._render_table_read_settings(ydb_opts)
+            + self._render_table_ttl(ydb_opts)
+        )
+
+    def _render_table_read_settings(self, ydb_opts: Mapping[str, Any]) -> List[str]:
+        settings = []
+        read_replicas_settings = ydb_opts["read_replicas_settings"]
+        if read_replicas_settings is not None:
+            zone, _, count = read_replicas_settings.partition(":")
+            if zone.lower() not in READ_REPLICAS_ZONES or not count.isdigit():
+                raise CompileError(
+                    f"Invalid read replicas settings {read_replicas_settings!r}, expected e.g. 'PER_AZ:1' or 'ANY_AZ:2'"
+                )
+            settings.append(f'READ_REPLICAS_SETTINGS = "{zone.upper()}:{int(count)}"')
+        if ydb_opts["key_bloom_filter"] is not None:
+            key_bloom_filter = "ENABLED" if ydb_opts["key_bloom_filter"] else "DISABLED"
+            settings.append(f"KEY_BLOOM_FILTER = {key_bloom_filter}")
+        return settings
+
+    def _render_table_ttl(self, ydb_opts: Mapping[str, Any]) -> List[str]:
+        ttl: Optional[TTL] = ydb_opts["ttl"]
+        if ttl is None:
+            return []
+
+        actions = [
+            f'Interval("{format_interval(tier.interval)}") TO EXTERNAL DATA SOURCE '
+            f"{self.preparer.quote(tier.external_data_source)}"
+            for tier in ttl.tiers
+        ]
+        if ttl.interval is not None:
+            actions.append(f'Interval("{format_interval(ttl.interval)}")' + (" DELETE" if ttl.tiers else ""))
+
+        text = f"TTL = {', '.join(actions)} ON {self.preparer.quote(ttl.column)}"
+        if ttl.unit is not None:
+            text += f" AS {ttl.unit.upper()}"
+        return [text]
+
+    def _get_table_options(self, options: Mapping[str, Any]) -> Dict[str, Any]:
+        table_options = set(dict(self.dialect.construct_arguments)[sa.Table])
+        table_options.difference_update(CREATE_TABLE_OPTIONS)
+        unknown_options = set(options).difference(table_options)
+        if unknown_options:
+            raise CompileError(f"Unknown table options: {', '.join(sorted(unknown_options))}")
+        return {**dict.fromkeys(table_options), **options}
+
+    def _format_altered_table(self, table: Union[sa.Table, str]) -> str:
+        return self.preparer.format_table(table) if isinstance(table, sa.Table) else self.preparer.quote(table)
+
+    def visit_set_table_options(self, alter: SetTableOptions, **kw) -> str:
+        settings = self._render_table_settings(self._get_table_options(alter.options))
+        if not settings:
+            raise CompileError("SET of table options requires at least one option")
+        return f"ALTER TABLE {self._format_altered_table(alter.element)} SET ({', '.join(settings)})"
+
+    def visit_reset_table_options(self, alter: ResetTableOptions, **kw) -> str:
+        if not alter.options:
+            raise CompileError("RESET of table options requires at least one option")
+        self._get_table_options(dict.fromkeys(alter.options))
+        options = ", ".join(option.upper() for option in alter.options)
+        return f"ALTER TABLE {self._format_altered_table(alter.element)} RESET ({options})"
+
+    def visit_add_changefeed(self, alter: AddChangefeed, **kw) -> str:
+        changefeed: Changefeed = alter.changefeed
+        settings = [f"MODE = '{changefeed.mode.upper()}'", f"FORMAT = '{changefeed.format.upper()}'"]
+        if changefeed.retention_period is not None:
+            settings.append(f'RETENTION_PERIOD = Interval("{format_interval(changefeed.retention_period)}")')
+        if changefeed.virtual_timestamps is not None:
+            settings.append(f"VIRTUAL_TIMESTAMPS = {'TRUE' if changefeed.virtual_timestamps else 'FALSE'}")
+        if changefeed.initial_scan is not None:
+            settings.append(f"INITIAL_SCAN = {'TRUE' if changefeed.initial_scan else 'FALSE'}")
+        return (
+            f"ALTER TABLE {self._format_altered_table(alter.element)} "
+            f"ADD CHANGEFEED {self.preparer.quote(changefeed.name)} WITH ({', '.join(settings)})"
+        )
+
+    def visit_drop_changefeed(self, alter: DropChangefeed, **kw) -> str:
+        return (
+            f"ALTER TABLE {self._format_altered_table(alter.element)} DROP CHANGEFEED {self.preparer.quote(alter.name)}"
+        )
 
-    def _render_table_partitioning_settings(self, ydb_opts: Dict[str, Any]) -> List[str]:
+    def _render_table_partitioning_settings(self, ydb_opts: Mapping[str, Any]) -> List[str]:
         table_partitioning_settings = []
         if ydb_opts["auto_partitioning_by_size"] is not None:
             auto_partitioning_by_size = "ENABLED" if ydb_opts["auto_partitioning_by_size"] else "DISABLED"
@@ -1,4 +1,3 @@
-from typing import Union
 import sqlalchemy as sa
 import ydb
 
@@ -15,19 +14,10 @@ class YqlTypeCompiler(BaseYqlTypeCompiler):
     def visit_FLOAT(self, type_: sa.FLOAT, **kw):
         return "DOUBLE"
 
-    def get_ydb_type(
-        self, type_: sa.types.TypeEngine, is_optional: bool
-    ) -> Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]:
-        if isinstance(type_, sa.TypeDecorator):
-            type_ = type_.impl
-
-        if isinstance(type_, sa.Float):
-            ydb_type = ydb.PrimitiveType.Double
-            if is_optional:
-                return ydb.OptionalType(ydb_type)
-            return ydb_type
-
-        return super().get_ydb_type(type_, is_optional)
+    ydb_types_map = {
+        **BaseYqlTypeCompiler.ydb_types_map,
+        sa.Float: ydb.PrimitiveType.Double,
+    }
 
 
 class YqlIdentifierPreparer(BaseYqlIdentifierPreparer):
@@ -40,6 +30,15 @@ class YqlCompiler(BaseYqlCompiler):
     def visit_upsert(self, insert_stmt, **kw):
         return self.visit_insert(insert_stmt, **kw).replace("INSERT", "UPSERT", 1)
 
+    def visit_replace(self, insert_stmt, **kw):
+        return self.visit_insert(insert_stmt, **kw).replace("INSERT", "REPLACE", 1)
+
+    def visit_update_on(self, insert_stmt, **kw):
+        return self._render_on_statement(self.visit_insert(insert_stmt, **kw), insert_stmt, "UPDATE", "")
+
+    def visit_delete_on(self, insert_stmt, **kw):
+        return self._render_on_statement(self.visit_insert(insert_stmt, **kw), insert_stmt, "DELETE", "FROM ")
+
 
 class YqlDDLCompiler(BaseYqlDDLCompiler):
     ...
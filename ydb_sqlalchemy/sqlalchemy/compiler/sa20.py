@@ -11,32 +11,17 @@ from .base import (
     BaseYqlIdentifierPreparer,
     BaseYqlTypeCompiler,
 )
-from typing import Union
 
 
 class YqlTypeCompiler(BaseYqlTypeCompiler):
     def visit_uuid(self, type_: sa.Uuid, **kw):
         return "UTF8"
 
-    def get_ydb_type(
-        self, type_: sa.types.TypeEngine, is_optional: bool
-    ) -> Union[ydb.PrimitiveType, ydb.AbstractTypeBuilder]:
-        if isinstance(type_, sa.TypeDecorator):
-            type_ = type_.impl
-
-        if isinstance(type_, sa.Uuid):
-            ydb_type = ydb.PrimitiveType.Utf8
-            if is_optional:
-                return ydb.OptionalType(ydb_type)
-            return ydb_type
-
-        if isinstance(type_, sa.Double):
-            ydb_type = ydb.PrimitiveType.Double
-            if is_optional:
-                return ydb.OptionalType(ydb_type)
-            return ydb_type
-
-        return super().get_ydb_type(type_, is_optional)
+    ydb_types_map = {
+        **BaseYqlTypeCompiler.ydb_types_map,
+        sa.Uuid: ydb.PrimitiveType.Utf8,
+        sa.Double: ydb.PrimitiveType.Double,
+    }
 
 
 class YqlIdentifierPreparer(BaseYqlIdentifierPreparer):
@@ -87,6 +72,19 @@ class YqlCompiler(BaseYqlCompiler):
     def visit_upsert(self, insert_stmt, visited_bindparam=None, **kw):
         return self.visit_insert(insert_stmt, visited_bindparam, **kw).replace("INSERT", "UPSERT", 1)
 
+    def visit_replace(self, insert_stmt, visited_bindparam=None, **kw):
+        return self.visit_insert(insert_stmt, visited_bindparam, **kw).replace("INSERT", "REPLACE", 1)
+
+    def visit_update_on(self, insert_stmt, visited_bindparam=None, **kw):
+        return self._render_on_statement(
+            self.visit_insert(insert_stmt, visited_bindparam, **kw), insert_stmt, "UPDATE", ""
+        )
+
+    def visit_delete_on(self, insert_stmt, visited_bindparam=None, **kw):
+        return self._render_on_statement(
+            self.visit_insert(insert_stmt, visited_bindparam, **kw), insert_stmt, "DELETE", "FROM "
+        )
+
 
 class YqlDDLCompiler(BaseYqlDDLCompiler):
     ...
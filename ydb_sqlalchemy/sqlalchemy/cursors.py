@@ -0,0 +1,204 @@
+import collections
+from typing import Any, Iterator, List, Optional
+
+import ydb
+import ydb_dbapi
+from ydb_dbapi.cursors import BufferedCursor
+from ydb_dbapi.utils import CursorStatus, handle_ydb_errors
+
+VALUE_RESULT_FORMAT = "value"
+ARROW_RESULT_FORMAT = "arrow"
+
+
+class StreamingCursor(BufferedCursor):
+    """Server side cursor which reads result set parts of a query as rows are fetched.
+
+    Only the current result set part is kept in memory, the next one is requested from the
+    query stream when the current part is exhausted.
+
+    With ``result_format="arrow"`` parts are requested in Arrow format, they have no rows and are
+    read with :meth:`fetch_arrow_batches`.
+    """
+
+    def __init__(self, connection: ydb_dbapi.Connection, result_format: str = VALUE_RESULT_FORMAT):
+        super().__init__()
+        self._connection = connection
+        self._table_path_prefix = connection.table_path_prefix
+        self._session = None
+        self._stream = None
+
+        if result_format not in (VALUE_RESULT_FORMAT, ARROW_RESULT_FORMAT):
+            raise ydb_dbapi.ProgrammingError(f"Unknown result format: {result_format!r}")
+        self._result_format = result_format
+        self._arrow_parts = collections.deque()
+        self._arrow_schema_data: Optional[bytes] = None
+        self._arrow_schemas = {}
+
+    @property
+    def rowcount(self) -> int:
+        return -1
+
+    def _acquire_session(self):
+        return self._connection._session_pool.acquire()
+
+    def _release_session(self, session) -> None:
+        self._connection._session_pool.release(session)
+
+    def _delete_session(self, session) -> None:
+        session.delete()
+
+    def _execute_in_tx(self, tx_context, **kwargs):
+        return tx_context.execute(**kwargs)
+
+    def _next_result_set(self, stream) -> Optional[ydb.convert.ResultSet]:
+        return next(stream, None)
+
+    def _invalidate_connection_session(self) -> None:
+        self._connection._invalidate_session()
+
+    @handle_ydb_errors
+    def _start_stream(self, query: str, parameters: Optional[Any]) -> None:
+        connection = self._connection
+        settings = connection._get_request_settings()
+        tx_context = connection._tx_context
+        commit_tx = tx_context is None
+        kwargs = {}
+        if self._result_format == ARROW_RESULT_FORMAT:
+            kwargs["result_set_format"] = ydb.QueryResultSetFormat.ARROW
+        try:
+            if tx_context is None:
+                self._session = self._acquire_session()
+                tx_context = self._session.transaction(connection._tx_mode)
+            self._stream = self._execute_in_tx(
+                tx_context, query=query, parameters=parameters, commit_tx=commit_tx, settings=settings, **kwargs
+            )
+        except ydb.Error:
+            self._close_stream(cancel=True)
+            raise
+
+    @handle_ydb_errors
+    def _read_next_part(self) -> bool:
+        if self._stream is None:
+            return False
+        try:
+            result_set = self._next_result_set(self._stream)
+        except ydb.Error:
+            self._close_stream(cancel=True)
+            raise
+
+        if result_set is None:
+            # Stream is exhausted, there is nothing to cancel or read
+            self._stream = None
+            self._close_stream()
+            return False
+        self._update_result_set(result_set)
+        return True
+
+    def _update_result_set(self, result_set: ydb.convert.ResultSet, replace_current: bool = True) -> None:
+        arrow_format_meta = getattr(result_set, "arrow_format_meta", None)
+        if arrow_format_meta is not None and arrow_format_meta.schema:
+            self._arrow_schema_data = arrow_format_meta.schema
+        data = getattr(result_set, "data", None)
+        if data is not None:
+            self._arrow_parts.append((self._arrow_schema_data, data))
+        super()._update_result_set(result_set, replace_current)
+
+        if self._description is None and self._arrow_schema_data is not None:
+            self._description = [
+                (field.name, str(field.type), None, None, None, None, None) for field in self.arrow_schema
+            ]
+
+    def _close_stream(self, cancel: bool = False) -> None:
+        stream, self._stream = self._stream, None
+        session, self._session = self._session, None
+        self._finish_query()
+
+        if session is not None:
+            if stream is not None or cancel:
+                # Server may still run the cancelled query, the session is deleted and the pool creates a new one
+                if stream is not None:
+                    stream.cancel()
+                self._delete_session(session)
+            self._release_session(session)
+        elif cancel:
+            self._invalidate_connection_session()
+        elif stream is not None:
+            # Stream of a connection transaction is read till the end to keep the transaction usable
+            try:
+                while self._next_result_set(stream) is not None:
+                    pass
+            except ydb.Error:
+                self._invalidate_connection_session()
+                raise
+
+    def execute(self, operation: str, parameters: Optional[Any] = None) -> None:
+        self._raise_if_closed()
+        handle_ydb_errors(self._close_stream)()
+
+        self._rows = None
+        self._description = None
+        self._arrow_parts.clear()
+        self._arrow_schema_data = None
+        self._begin_query()
+        self._start_stream(self._append_table_path_prefix(operation), parameters)
+        # Description is known after the first part with columns
+        while self._description is None and self._read_next_part():
+            pass
+
+    def executemany(self, operation: str, seq_of_parameters: List[Any]) -> None:
+        for parameters in seq_of_parameters:
+            self.execute(operation, parameters)
+
+    def fetchone(self) -> Optional[tuple]:
+        row = self._fetchone_from_buffer()
+        while row is None and self._read_next_part():
+            row = self._fetchone_from_buffer()
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> list:
+        size = size or self.arraysize
+        rows = self._fetchmany_from_buffer(size)
+        while len(rows) < size and self._read_next_part():
+            rows.extend(self._fetchmany_from_buffer(size - len(rows)))
+        return rows
+
+    def fetchall(self) -> list:
+        rows = self._fetchall_from_buffer()
+        while self._read_next_part():
+            rows.extend(self._fetchall_from_buffer())
+        return rows
+
+    def _read_arrow_schema(self, schema_data: bytes) -> "pyarrow.Schema":  # noqa: F821
+        schema = self._arrow_schemas.get(schema_data)
+        if schema is None:
+            import pyarrow
+
+            schema = self._arrow_schemas[schema_data] = pyarrow.ipc.read_schema(pyarrow.py_buffer(schema_data))
+        return schema
+
+    @property
+    def arrow_schema(self) -> Optional["pyarrow.Schema"]:  # noqa: F821
+        if self._arrow_schema_data is None:
+            return None
+        return self._read_arrow_schema(self._arrow_schema_data)
+
+    def fetch_arrow_batches(self) -> Iterator["pyarrow.RecordBatch"]:  # noqa: F821
+        import pyarrow
+
+        self._raise_if_closed()
+        while self._arrow_parts or self._read_next_part():
+            while self._arrow_parts:
+                schema_data, data = self._arrow_parts.popleft()
+                yield pyarrow.ipc.read_record_batch(pyarrow.py_buffer(data), self._read_arrow_schema(schema_data))
+
+    def nextset(self) -> bool:
+        return False
+
+    @handle_ydb_errors
+    def close(self) -> None:
+        if self.is_closed:
+            return
+        try:
+            self._close_stream()
+        finally:
+            self._state = CursorStatus.closed
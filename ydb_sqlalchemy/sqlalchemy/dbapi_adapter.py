@@ -4,6 +4,8 @@ from sqlalchemy.util.concurrency import await_only
 from ydb_dbapi import AsyncConnection, AsyncCursor
 import ydb
 
+from .cursors import StreamingCursor
+
 
 class AdaptedAsyncConnection(AdaptedConnection):
     def __init__(self, connection: AsyncConnection):
@@ -17,6 +19,18 @@ class AdaptedAsyncConnection(AdaptedConnection):
     def _session_pool(self):
         return self._connection._session_pool
 
+    @property
+    def endpoint(self):
+        return self._connection.endpoint
+
+    @property
+    def database(self):
+        return self._connection.database
+
+    @property
+    def table_path_prefix(self):
+        return self._connection.table_path_prefix
+
     @property
     def _tx_context(self):
         return self._connection._tx_context
@@ -62,6 +76,9 @@ class AdaptedAsyncConnection(AdaptedConnection):
     def get_ydb_retry_settings(self) -> ydb.RetrySettings:
         return self._connection.get_ydb_retry_settings()
 
+    def _get_request_settings(self) -> ydb.BaseRequestSettings:
+        return self._connection._get_request_settings()
+
     def describe(self, table_path: str):
         return await_only(self._connection.describe(table_path))
 
@@ -74,6 +91,9 @@ class AdaptedAsyncConnection(AdaptedConnection):
     def get_view_names(self):
         return await_only(self._connection.get_view_names())
 
+    def bulk_upsert(self, table_name: str, rows, column_types: ydb.BulkUpsertColumns):
+        return await_only(self._connection.bulk_upsert(table_name, rows, column_types))
+
 
 # TODO(vgvoleg): Migrate to AsyncAdapt_dbapi_cursor and AsyncAdapt_dbapi_connection
 class AdaptedAsyncCursor:
@@ -127,3 +147,31 @@ class AdaptedAsyncCursor:
 
     async def _async_soft_close(self) -> None:
         pass
+
+
+class AdaptedAsyncStreamingCursor(StreamingCursor):
+    _awaitable_cursor_close: bool = False
+
+    def _acquire_session(self):
+        return await_only(self._connection._session_pool.acquire())
+
+    def _release_session(self, session) -> None:
+        await_only(self._connection._session_pool.release(session))
+
+    def _delete_session(self, session) -> None:
+        await_only(session.delete())
+
+    def _execute_in_tx(self, tx_context, **kwargs):
+        return await_only(tx_context.execute(**kwargs))
+
+    def _next_result_set(self, stream):
+        try:
+            return await_only(stream.__anext__())
+        except StopAsyncIteration:
+            return None
+
+    def _invalidate_connection_session(self) -> None:
+        await_only(self._connection._invalidate_session())
+
+    async def _async_soft_close(self) -> None:
+        pass
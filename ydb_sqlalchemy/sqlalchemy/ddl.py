@@ -0,0 +1,273 @@
+import datetime
+import re
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+
+TTL_COLUMN_UNITS = ("seconds", "milliseconds", "microseconds", "nanoseconds")
+
+TABLE_STORES = ("row", "column")
+
+INDEX_TYPES = ("vector_kmeans_tree",)
+# Options of vector indexes whose values are keywords rather than strings, e.g. ``distance=cosine``
+VECTOR_INDEX_KEYWORD_OPTIONS = frozenset(("distance", "similarity"))
+
+COLUMN_FAMILY_COMPRESSIONS = ("off", "lz4", "zstd")
+# Kinds of storage pools of column families, e.g. ``"ssd"`` or ``"rot"``
+STORAGE_POOL_KIND_RE = re.compile(r"[\w-]+")
+
+CHANGEFEED_MODES = ("keys_only", "updates", "new_image", "old_image", "new_and_old_images")
+CHANGEFEED_FORMATS = ("json", "debezium_json", "dynamodb_streams_json")
+
+# ISO 8601 durations accepted by YQL ``Interval()``, e.g. ``"P1DT12H"`` or ``"PT0.5S"``
+ISO_8601_DURATION_RE = re.compile(r"P(?=.)(\d+W)?(\d+D)?(T(?=.)(\d+H)?(\d+M)?(\d+(\.\d+)?S)?)?")
+
+# Availability zones of read replicas, ``ydb_read_replicas_settings="PER_AZ:1"``
+READ_REPLICAS_ZONES = ("per_az", "any_az")
+
+# Table dialect options which can't be changed with ALTER TABLE ... SET,
+# changefeeds are changed with AddChangefeed and DropChangefeed
+CREATE_TABLE_OPTIONS = frozenset(("store", "partition_by_hash", "partition_count", "families", "changefeeds"))
+# Table dialect options of row tables only
+ROW_TABLE_OPTIONS = frozenset(
+    (
+        "auto_partitioning_by_size",
+        "auto_partitioning_by_load",
+        "auto_partitioning_partition_size_mb",
+        "uniform_partitions",
+        "partition_at_keys",
+        "read_replicas_settings",
+        "key_bloom_filter",
+        "changefeeds",
+    )
+)
+
+
+def format_interval(value: Union[datetime.timedelta, str]) -> str:
+    """Format a ``timedelta`` as an ISO 8601 duration accepted by YQL ``Interval()``.
+
+    Strings are checked to be ISO 8601 durations and returned as is.
+    """
+    if isinstance(value, str):
+        if not ISO_8601_DURATION_RE.fullmatch(value):
+            raise sa.exc.ArgumentError(f"Invalid interval {value!r}, expected an ISO 8601 duration such as 'P1DT12H'")
+        return value
+    if not isinstance(value, datetime.timedelta):
+        raise sa.exc.ArgumentError(f"Invalid interval {value!r}, expected a timedelta or an ISO 8601 duration")
+    if value < datetime.timedelta(0):
+        raise sa.exc.ArgumentError(f"Invalid interval {value!r}, intervals can't be negative")
+
+    days, microseconds = divmod(value // datetime.timedelta(microseconds=1), 24 * 3600 * 10**6)
+    seconds, microseconds = divmod(microseconds, 10**6)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+
+    text = f"P{days}D" if days else "P"
+    time_text = "".join(f"{amount}{unit}" for amount, unit in ((hours, "H"), (minutes, "M")) if amount)
+    if microseconds:
+        time_text += f"{seconds}.{microseconds:06d}".rstrip("0") + "S"
+    elif seconds or not (days or time_text):
+        time_text += f"{seconds}S"
+    return text + ("T" + time_text if time_text else "")
+
+
+class TTLTier:
+    """Eviction of rows to an external data source after ``interval``, a tier of :class:`TTL`."""
+
+    def __init__(self, interval: Union[datetime.timedelta, str], external_data_source: str):
+        format_interval(interval)
+        self.interval = interval
+        self.external_data_source = external_data_source
+
+    def _key(self):
+        return format_interval(self.interval), self.external_data_source
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, TTLTier) and self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return f"TTLTier({self.interval!r}, {self.external_data_source!r})"
+
+
+class TTL:
+    """Time to live of table rows, the ``ydb_ttl`` table option.
+
+    Rows are deleted ``interval`` after the time in ``column``. A column of a numeric type stores
+    time since the Unix epoch in ``unit``: one of ``"seconds"``, ``"milliseconds"``, ``"microseconds"``
+    or ``"nanoseconds"``. With ``tiers`` rows are evicted to external data sources before deletion,
+    ``interval=None`` keeps them in the last tier. ``interval`` is required, ``None`` is accepted only with ``tiers``.
+    """
+
+    def __init__(
+        self,
+        column: str,
+        interval: Optional[Union[datetime.timedelta, str]],
+        unit: Optional[str] = None,
+        tiers: Sequence[TTLTier] = (),
+    ):
+        if unit is not None and unit.lower() not in TTL_COLUMN_UNITS:
+            raise sa.exc.ArgumentError(f"Unknown TTL column unit {unit!r}, expected one of {TTL_COLUMN_UNITS}")
+        if interval is None and not tiers:
+            raise sa.exc.ArgumentError("TTL requires interval or tiers")
+        if interval is not None:
+            format_interval(interval)
+        self.column = column
+        self.interval = interval
+        self.unit = unit.lower() if unit is not None else None
+        self.tiers = list(tiers)
+
+    def _key(self):
+        interval = format_interval(self.interval) if self.interval is not None else None
+        return self.column, interval, self.unit, [tier._key() for tier in self.tiers]
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, TTL) and self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return f"TTL({self.column!r}, {self.interval!r}, unit={self.unit!r}, tiers={self.tiers!r})"
+
+
+class ColumnFamily:
+    """A column family of a table, an item of the ``ydb_families`` table option.
+
+    ``data`` is the storage pool kind of the family, e.g. ``"ssd"`` or ``"rot"``, ``compression`` is the codec:
+    ``"off"``, ``"lz4"`` or ``"zstd"`` (column tables only) with an optional ``compression_level``.
+    Columns are put into a family with the ``ydb_family`` column option, other columns belong to ``"default"``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        data: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
+        if data is not None and not STORAGE_POOL_KIND_RE.fullmatch(data):
+            raise sa.exc.ArgumentError(f"Invalid storage pool kind {data!r} of column family {name!r}")
+        if compression is not None and compression.lower() not in COLUMN_FAMILY_COMPRESSIONS:
+            raise sa.exc.ArgumentError(
+                f"Unknown compression {compression!r} of column family {name!r}, "
+                f"expected one of {COLUMN_FAMILY_COMPRESSIONS}"
+            )
+        self.name = name
+        self.data = data
+        self.compression = compression.lower() if compression is not None else None
+        self.compression_level = compression_level
+
+    def _key(self):
+        return self.name, self.data, self.compression, self.compression_level
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ColumnFamily) and self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnFamily({self.name!r}, data={self.data!r}, compression={self.compression!r}, "
+            f"compression_level={self.compression_level!r})"
+        )
+
+
+class Changefeed:
+    """A changefeed of a table, an item of the ``ydb_changefeeds`` table option.
+
+    ``mode`` is one of ``"keys_only"``, ``"updates"``, ``"new_image"``, ``"old_image"`` or ``"new_and_old_images"``,
+    ``format`` is ``"json"``, ``"debezium_json"`` or ``"dynamodb_streams_json"``. Changes are kept in the topic of
+    the changefeed for ``retention_period``, with ``initial_scan=True`` the rows existing when the changefeed is
+    added are written to it as well.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str,
+        format: str = "json",
+        retention_period: Optional[Union[datetime.timedelta, str]] = None,
+        initial_scan: Optional[bool] = None,
+        virtual_timestamps: Optional[bool] = None,
+    ):
+        if mode.lower() not in CHANGEFEED_MODES:
+            raise sa.exc.ArgumentError(f"Unknown changefeed mode {mode!r}, expected one of {CHANGEFEED_MODES}")
+        if format.lower() not in CHANGEFEED_FORMATS:
+            raise sa.exc.ArgumentError(f"Unknown changefeed format {format!r}, expected one of {CHANGEFEED_FORMATS}")
+        if retention_period is not None:
+            format_interval(retention_period)
+        self.name = name
+        self.mode = mode.lower()
+        self.format = format.lower()
+        self.retention_period = retention_period
+        self.initial_scan = initial_scan
+        self.virtual_timestamps = virtual_timestamps
+
+    def _key(self):
+        retention_period = format_interval(self.retention_period) if self.retention_period is not None else None
+        return self.name, self.mode, self.format, retention_period, self.virtual_timestamps
+
+    def __eq__(self, other: Any) -> bool:
+        # initial_scan only affects adding of the changefeed and is not a part of its state
+        return isinstance(other, Changefeed) and self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"Changefeed({self.name!r}, {self.mode!r}, format={self.format!r}, "
+            f"retention_period={self.retention_period!r}, initial_scan={self.initial_scan!r}, "
+            f"virtual_timestamps={self.virtual_timestamps!r})"
+        )
+
+
+class SetTableOptions(sa.schema.DDLElement):
+    """``ALTER TABLE ... SET (...)`` of ``ydb_*`` table options, e.g. for ``op.execute()`` in Alembic migrations.
+
+    Options are passed without the ``ydb_`` prefix: ``SetTableOptions("events", ttl=TTL("created_at", "P30D"))``.
+    """
+
+    __visit_name__ = "set_table_options"
+    stringify_dialect = "yql"
+
+    def __init__(self, table: Union[sa.Table, str], **options: Any):
+        self.element = table
+        self.options = options
+
+
+class ResetTableOptions(sa.schema.DDLElement):
+    """``ALTER TABLE ... RESET (...)`` of ``ydb_*`` table options: ``ResetTableOptions("events", "ttl")``."""
+
+    __visit_name__ = "reset_table_options"
+    stringify_dialect = "yql"
+
+    def __init__(self, table: Union[sa.Table, str], *options: str):
+        self.element = table
+        self.options = options
+
+
+class AddChangefeed(sa.schema.DDLElement):
+    """``ALTER TABLE ... ADD CHANGEFEED ...``: ``AddChangefeed("events", Changefeed("updates", "updates"))``."""
+
+    __visit_name__ = "add_changefeed"
+    stringify_dialect = "yql"
+
+    def __init__(self, table: Union[sa.Table, str], changefeed: Changefeed):
+        self.element = table
+        self.changefeed = changefeed
+
+
+class DropChangefeed(sa.schema.DDLElement):
+    """``ALTER TABLE ... DROP CHANGEFEED ...``: ``DropChangefeed("events", "updates")``."""
+
+    __visit_name__ = "drop_changefeed"
+    stringify_dialect = "yql"
+
+    def __init__(self, table: Union[sa.Table, str], name: str):
+        self.element = table
+        self.name = name
+
+
+def _add_changefeeds(table: sa.Table, connection: sa.engine.Connection, **kw: Any) -> None:
+    # Changefeeds can't be a part of CREATE TABLE, they are added to the created table.
+    # The listener is registered for all tables, tables of other dialects and without changefeeds are skipped.
+    if connection.dialect.name != "yql":
+        return
+    for changefeed in table.dialect_options["ydb"]["changefeeds"] or ():
+        connection.execute(AddChangefeed(table, changefeed))
+
+
+sa.event.listen(sa.Table, "after_create", _add_changefeeds)
@@ -1,13 +1,118 @@
 import sqlalchemy as sa
+import sqlalchemy.orm  # noqa: F401 registers the ORM compile states of DML statements
+from sqlalchemy import util
 
 
 class Upsert(sa.sql.Insert):
     __visit_name__ = "upsert"
-    _propagate_attrs = {"compile_state_plugin": "yql"}
+    # "plugin_subject" is a part of the statement cache key
+    _propagate_attrs = util.immutabledict({"compile_state_plugin": "yql", "plugin_subject": None})
     stringify_dialect = "yql"
-    inherit_cache = False
+    inherit_cache = True
 
 
 @sa.sql.base.CompileState.plugin_for("yql", "upsert")
 class UpsertDMLState(sa.sql.dml.InsertDMLState):
     pass
+
+
+class Replace(sa.sql.Insert):
+    """``REPLACE INTO``: writes rows without reading existing ones, a row with the same primary key is overwritten.
+
+    Unlike :class:`Upsert`, ``_propagate_attrs`` is taken from the table, so ``replace()`` of an ORM mapped
+    class is executed by the ORM bulk insert with a list of parameters keyed by attribute names.
+    """
+
+    __visit_name__ = "replace"
+    stringify_dialect = "yql"
+    inherit_cache = True
+
+
+@sa.sql.base.CompileState.plugin_for("default", "replace")
+class ReplaceDMLState(sa.sql.dml.InsertDMLState):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("orm", "replace")
+class BulkORMReplaceState(sa.sql.base.CompileState.plugins[("orm", "insert")]):
+    pass
+
+
+class BatchUpdate(sa.sql.Update):
+    """``BATCH UPDATE``: the update is applied to every partition of the table independently.
+
+    It is not atomic and is executed without a transaction, so it isn't limited by the transaction size.
+    """
+
+    __visit_name__ = "batch_update"
+    stringify_dialect = "yql"
+    inherit_cache = True
+
+
+class BatchDelete(sa.sql.Delete):
+    """``BATCH DELETE``: rows are deleted in every partition of the table independently, without a transaction."""
+
+    __visit_name__ = "batch_delete"
+    stringify_dialect = "yql"
+    inherit_cache = True
+
+
+@sa.sql.base.CompileState.plugin_for("default", "batch_update")
+class BatchUpdateDMLState(sa.sql.dml.UpdateDMLState):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("default", "batch_delete")
+class BatchDeleteDMLState(sa.sql.dml.DeleteDMLState):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("orm", "batch_update")
+class BulkORMBatchUpdateState(sa.sql.base.CompileState.plugins[("orm", "update")]):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("orm", "batch_delete")
+class BulkORMBatchDeleteState(sa.sql.base.CompileState.plugins[("orm", "delete")]):
+    pass
+
+
+class UpdateOn(sa.sql.Insert):
+    """``UPDATE ... ON``: updates existing rows found by the primary key columns of the source rows.
+
+    Rows are given the same way as to ``insert()``: with ``values()``, ``from_select()`` or as executemany
+    parameters which are always sent as a single ``AS_TABLE`` parameter. Rows with keys missing in the table
+    are skipped, the table is not scanned.
+    """
+
+    __visit_name__ = "update_on"
+    stringify_dialect = "yql"
+    inherit_cache = True
+
+
+class DeleteOn(sa.sql.Insert):
+    """``DELETE FROM ... ON``: deletes rows by the primary key columns of the source rows, see :class:`UpdateOn`."""
+
+    __visit_name__ = "delete_on"
+    stringify_dialect = "yql"
+    inherit_cache = True
+
+
+@sa.sql.base.CompileState.plugin_for("default", "update_on")
+class UpdateOnDMLState(sa.sql.dml.InsertDMLState):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("default", "delete_on")
+class DeleteOnDMLState(sa.sql.dml.InsertDMLState):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("orm", "update_on")
+class BulkORMUpdateOnState(sa.sql.base.CompileState.plugins[("orm", "insert")]):
+    pass
+
+
+@sa.sql.base.CompileState.plugin_for("orm", "delete_on")
+class BulkORMDeleteOnState(sa.sql.base.CompileState.plugins[("orm", "insert")]):
+    pass
@@ -0,0 +1,102 @@
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.sql.visitors import InternalTraversal
+
+KNN_DISTANCE_FUNCTIONS = {
+    "cosine": "CosineDistance",
+    "euclidean": "EuclideanDistance",
+    "manhattan": "ManhattanDistance",
+}
+KNN_SIMILARITY_FUNCTIONS = {
+    "cosine": "CosineSimilarity",
+    "inner_product": "InnerProductSimilarity",
+}
+
+
+def _knn_function(functions, kind: str, metric: str, column: sa.sql.ColumnElement, vector: Any):
+    if metric not in functions:
+        raise sa.exc.ArgumentError(f"Unknown {kind} {metric!r}, expected one of {tuple(functions)}")
+    target = sa.bindparam(None, vector, type_=column.type)
+    return getattr(sa.func.Knn, functions[metric])(column, target, type_=sa.Float)
+
+
+def knn_distance(column: sa.sql.ColumnElement, vector: Any, distance: str = "cosine") -> sa.sql.ColumnElement:
+    """``Knn::<Distance>Distance(column, vector)``, smaller values are nearer.
+
+    ``vector`` is bound with the type of ``column``, so a list of numbers is packed for a
+    :class:`~ydb_sqlalchemy.sqlalchemy.types.Vector` column.
+    """
+    return _knn_function(KNN_DISTANCE_FUNCTIONS, "distance", distance, column, vector)
+
+
+def knn_similarity(column: sa.sql.ColumnElement, vector: Any, similarity: str = "cosine") -> sa.sql.ColumnElement:
+    """``Knn::<Similarity>Similarity(column, vector)``, larger values are nearer."""
+    return _knn_function(KNN_SIMILARITY_FUNCTIONS, "similarity", similarity, column, vector)
+
+
+def _find_vector_index(table: sa.Table, column: sa.Column, index: Optional[str]) -> sa.Index:
+    for table_index in table.indexes:
+        if table_index.dialect_options["ydb"]["type"] is None:
+            continue
+        # Vector column is the last one, the others are prefix columns
+        matches = table_index.name == index if index is not None else list(table_index.columns)[-1] is column
+        if matches:
+            return table_index
+    description = repr(index) if index is not None else f"on column {column.name!r}"
+    raise sa.exc.ArgumentError(f"Vector index {description} not found in table {table.name!r}")
+
+
+class VectorIndexView(sa.sql.expression.TableClause):
+    """``table VIEW index``: rows of ``table`` read through its vector ``index``.
+
+    The index name is formatted by the preparer of the dialect compiling the statement.
+    """
+
+    __visit_name__ = "vector_index_view"
+    _traverse_internals = sa.sql.expression.TableClause._traverse_internals + [
+        ("index_name", InternalTraversal.dp_string),
+    ]
+    inherit_cache = True
+
+    def __init__(self, table: sa.Table, index: sa.Index):
+        super().__init__(table.name, schema=table.schema)
+        self.table = table
+        self.index = index
+        self.index_name = index.name
+
+
+def knn_search(
+    table: sa.Table,
+    column: Union[str, sa.Column],
+    vector: Any,
+    limit: int,
+    columns: Optional[Sequence[Union[str, sa.Column]]] = None,
+    index: Optional[str] = None,
+) -> sa.sql.Select:
+    """Select ``limit`` rows nearest to ``vector`` through the vector index of ``column``.
+
+    The index is found among ``table.indexes`` by ``index`` name or as the one built on ``column``,
+    rows are ordered with the distance or similarity function of the index and read from it with ``VIEW``.
+    Columns are selected by their names as YDB doesn't accept columns qualified with the table name in
+    queries with ``VIEW``; conditions on prefix columns of the index are added with ``where()`` the same way.
+    """
+    column = table.c[column] if isinstance(column, str) else column
+    vector_index = _find_vector_index(table, column, index)
+    if vector_index.name is None:
+        raise sa.exc.ArgumentError(f"Vector index on column {column.name!r} has no name to be read with VIEW")
+    vector_options = vector_index.dialect_options["ydb"]["vector_options"]
+
+    target_column = sa.column(column.name, column.type)
+    if "similarity" in vector_options:
+        order_by = knn_similarity(target_column, vector, vector_options["similarity"]).desc()
+    else:
+        order_by = knn_distance(target_column, vector, vector_options.get("distance", "cosine"))
+
+    selected = [table.c[name] if isinstance(name, str) else name for name in columns or table.columns]
+    return (
+        sa.select(*(sa.column(selected_column.name, selected_column.type) for selected_column in selected))
+        .select_from(VectorIndexView(table, vector_index))
+        .order_by(order_by)
+        .limit(limit)
+    )
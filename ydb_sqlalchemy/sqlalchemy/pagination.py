@@ -0,0 +1,164 @@
+from typing import Any, AsyncIterator, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+import sqlalchemy as sa
+
+KEYSET_PAGE_SIZE = 1000
+
+
+class KeysetPage(NamedTuple):
+    """Rows of a page and the primary key of its last row, the continuation token of the next page.
+
+    ``next_key`` is ``None`` on the last page.
+    """
+
+    rows: List[sa.engine.Row]
+    next_key: Optional[tuple]
+
+
+def _after_key_clause(columns: Sequence[sa.Column], values: Sequence[Any]) -> sa.sql.ColumnElement:
+    # (c1, c2) > (v1, v2) as c1 > v1 OR c1 = v1 AND c2 > v2, which YDB reads as a range of the primary key.
+    # NULL is less than any other value of a key column.
+    clause = None
+    for column, value in reversed(list(zip(columns, values))):
+        if value is None:
+            greater, equal = column.is_not(None), column.is_(None)
+        else:
+            greater, equal = column > value, column == value
+        clause = greater if clause is None else sa.or_(greater, sa.and_(equal, clause))
+    return clause
+
+
+def _get_primary_key(connection: sa.engine.Connection, table: sa.Table) -> List[sa.Column]:
+    if table.primary_key.columns:
+        return list(table.primary_key.columns)
+
+    names = sa.inspect(connection).get_pk_constraint(table.name)["constrained_columns"]
+    missing = [name for name in names if name not in table.c]
+    if not names or missing:
+        raise sa.exc.ArgumentError(f"Primary key columns {missing or names} not found in table {table.name!r}")
+    return [table.c[name] for name in names]
+
+
+def _keyset_select(
+    table: sa.Table,
+    primary_key: Sequence[sa.Column],
+    limit: int,
+    after: Optional[Sequence[Any]],
+    columns: Optional[Sequence[Union[str, sa.Column]]],
+    where: Optional[sa.sql.ColumnElement],
+) -> sa.sql.Select:
+    selected = [table.c[column] if isinstance(column, str) else column for column in columns or table.columns]
+    if not all(any(column is selected_column for selected_column in selected) for column in primary_key):
+        raise sa.exc.ArgumentError("Columns of keyset pages must include the primary key columns")
+    if after is not None and len(after) != len(primary_key):
+        raise sa.exc.ArgumentError(f"Key {after!r} doesn't match the primary key of table {table.name!r}")
+
+    statement = sa.select(*selected).order_by(*primary_key).limit(limit)
+    if where is not None:
+        statement = statement.where(where)
+    if after is not None:
+        statement = statement.where(_after_key_clause(primary_key, after))
+    return statement
+
+
+def _make_page(rows: Sequence[sa.engine.Row], primary_key: Sequence[sa.Column], limit: int) -> KeysetPage:
+    # One more row than the limit is read to know if there is a next page
+    if len(rows) <= limit:
+        return KeysetPage(list(rows), None)
+    rows = list(rows[:limit])
+    return KeysetPage(rows, tuple(rows[-1]._mapping[column] for column in primary_key))
+
+
+def fetch_keyset_page(
+    connection: sa.engine.Connection,
+    table: sa.Table,
+    limit: int = KEYSET_PAGE_SIZE,
+    after: Optional[Sequence[Any]] = None,
+    columns: Optional[Sequence[Union[str, sa.Column]]] = None,
+    where: Optional[sa.sql.ColumnElement] = None,
+) -> KeysetPage:
+    """Read ``limit`` rows of a table in the primary key order, after the row with the primary key ``after``.
+
+    Unlike ``OFFSET``, which reads and skips all rows of the previous pages, rows of the page are found by
+    a condition on the primary key ``(k1, k2) > ($k1, $k2)``, so every page costs the same.
+    ``after`` is ``next_key`` of the previous page, it is a tuple of plain values and can be passed to clients.
+    Primary key columns are taken from ``table`` or, if it has none, from ``get_pk_constraint()``;
+    ``columns`` must include them. ``where`` is an additional condition on rows.
+    """
+    return _fetch_keyset_page(connection, table, _get_primary_key(connection, table), limit, after, columns, where)
+
+
+def _fetch_keyset_page(
+    connection: sa.engine.Connection,
+    table: sa.Table,
+    primary_key: Sequence[sa.Column],
+    limit: int,
+    after: Optional[Sequence[Any]],
+    columns: Optional[Sequence[Union[str, sa.Column]]],
+    where: Optional[sa.sql.ColumnElement],
+) -> KeysetPage:
+    statement = _keyset_select(table, primary_key, limit + 1, after, columns, where)
+    return _make_page(connection.execute(statement).fetchall(), primary_key, limit)
+
+
+def iter_keyset_pages(
+    connection: sa.engine.Connection,
+    table: sa.Table,
+    page_size: int = KEYSET_PAGE_SIZE,
+    after: Optional[Sequence[Any]] = None,
+    columns: Optional[Sequence[Union[str, sa.Column]]] = None,
+    where: Optional[sa.sql.ColumnElement] = None,
+) -> Iterator[KeysetPage]:
+    """Pages of :func:`fetch_keyset_page` from ``after`` to the end of the table, one query per page."""
+    primary_key = _get_primary_key(connection, table)
+    while True:
+        page = _fetch_keyset_page(connection, table, primary_key, page_size, after, columns, where)
+        yield page
+        if page.next_key is None:
+            return
+        after = page.next_key
+
+
+async def async_fetch_keyset_page(
+    connection: Any,
+    table: sa.Table,
+    limit: int = KEYSET_PAGE_SIZE,
+    after: Optional[Sequence[Any]] = None,
+    columns: Optional[Sequence[Union[str, sa.Column]]] = None,
+    where: Optional[sa.sql.ColumnElement] = None,
+) -> KeysetPage:
+    """Async variant of :func:`fetch_keyset_page` for ``sqlalchemy.ext.asyncio.AsyncConnection``."""
+    primary_key = await connection.run_sync(_get_primary_key, table)
+    return await _async_fetch_keyset_page(connection, table, primary_key, limit, after, columns, where)
+
+
+async def _async_fetch_keyset_page(
+    connection: Any,
+    table: sa.Table,
+    primary_key: Sequence[sa.Column],
+    limit: int,
+    after: Optional[Sequence[Any]],
+    columns: Optional[Sequence[Union[str, sa.Column]]],
+    where: Optional[sa.sql.ColumnElement],
+) -> KeysetPage:
+    statement = _keyset_select(table, primary_key, limit + 1, after, columns, where)
+    result = await connection.execute(statement)
+    return _make_page(result.fetchall(), primary_key, limit)
+
+
+async def async_iter_keyset_pages(
+    connection: Any,
+    table: sa.Table,
+    page_size: int = KEYSET_PAGE_SIZE,
+    after: Optional[Sequence[Any]] = None,
+    columns: Optional[Sequence[Union[str, sa.Column]]] = None,
+    where: Optional[sa.sql.ColumnElement] = None,
+) -> AsyncIterator[KeysetPage]:
+    """Async variant of :func:`iter_keyset_pages`."""
+    primary_key = await connection.run_sync(_get_primary_key, table)
+    while True:
+        page = await _async_fetch_keyset_page(connection, table, primary_key, page_size, after, columns, where)
+        yield page
+        if page.next_key is None:
+            return
+        after = page.next_key
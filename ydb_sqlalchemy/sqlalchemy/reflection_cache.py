@@ -0,0 +1,116 @@
+import contextlib
+import functools
+import pickle
+import sqlite3
+import time
+from typing import Any, Callable, Collection, Optional, Set
+
+_MISSING = object()
+
+# Table paths per query of ReflectionCache.contained(), below the SQLite limit of 999 parameters
+CONTAINED_QUERY_TABLE_PATHS = 500
+
+
+class ReflectionCache:
+    """Reflection results of tables stored in a SQLite file shared by processes.
+
+    Entries are keyed by endpoint, database and table path. An entry is valid while it was written with
+    the same ``version`` and, if ``max_age`` is set, it is not older than ``max_age`` seconds.
+    Values are pickled, the file must be trusted as much as the application code.
+    """
+
+    def __init__(self, path: str, version: Optional[str] = None, max_age: Optional[float] = None):
+        self.path = path
+        self.version = version or ""
+        self.max_age = max_age
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS reflection ("
+                "endpoint TEXT, table_path TEXT, method TEXT, version TEXT, created_at REAL, data BLOB, "
+                "PRIMARY KEY (endpoint, table_path, method))"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as db, db:
+            yield db
+
+    def _valid_entries_condition(self):
+        condition = "endpoint = ? AND method = ? AND version = ?"
+        parameters = [self.version]
+        if self.max_age is not None:
+            condition += " AND created_at >= ?"
+            parameters.append(time.time() - self.max_age)
+        return condition, parameters
+
+    def get(self, endpoint: str, table_path: str, method: str) -> Any:
+        condition, parameters = self._valid_entries_condition()
+        query = f"SELECT data FROM reflection WHERE {condition} AND table_path = ?"
+        with self._connect() as db:
+            row = db.execute(query, [endpoint, method, *parameters, table_path]).fetchone()
+        return _MISSING if row is None else pickle.loads(row[0])
+
+    def set(self, endpoint: str, table_path: str, method: str, value: Any) -> None:
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO reflection VALUES (?, ?, ?, ?, ?, ?)",
+                (endpoint, table_path, method, self.version, time.time(), pickle.dumps(value)),
+            )
+
+    def contains(self, endpoint: str, table_path: str, method: str) -> bool:
+        return table_path in self.contained(endpoint, [table_path], method)
+
+    def contained(self, endpoint: str, table_paths: Collection[str], method: str) -> Set[str]:
+        """Paths of tables among ``table_paths`` with valid entries, found without reading the values."""
+        condition, parameters = self._valid_entries_condition()
+        table_paths = list(table_paths)
+        contained = set()
+        with self._connect() as db:
+            for start in range(0, len(table_paths), CONTAINED_QUERY_TABLE_PATHS):
+                chunk = table_paths[start : start + CONTAINED_QUERY_TABLE_PATHS]  # noqa: E203
+                query = (
+                    f"SELECT table_path FROM reflection WHERE {condition} "
+                    f"AND table_path IN ({', '.join('?' * len(chunk))})"
+                )
+                contained.update(row[0] for row in db.execute(query, [endpoint, method, *parameters, *chunk]))
+        return contained
+
+    def invalidate(self, endpoint: str, database: str) -> None:
+        """Remove entries of all tables of a database."""
+        with self._connect() as db:
+            db.execute(
+                "DELETE FROM reflection WHERE endpoint = ? AND table_path LIKE ? ESCAPE '\\'",
+                (endpoint, _escape_like(database.rstrip("/")) + "/%"),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as db:
+            db.execute("DELETE FROM reflection")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def persistent_cache(fn: Callable) -> Callable:
+    """Keep results of a table reflection method in the dialect reflection cache, if any.
+
+    Applied under ``reflection.cache``, so a result is read from the file once per ``Inspector``.
+    """
+    method = fn.__name__
+
+    @functools.wraps(fn)
+    def decorated(self, connection, table_name, schema=None, **kw):
+        cache = self._reflection_cache
+        if cache is None:
+            return fn(self, connection, table_name, schema, **kw)
+
+        key = self._get_reflection_cache_key(connection, table_name, schema)
+        value = cache.get(*key, method)
+        if value is _MISSING:
+            value = fn(self, connection, table_name, schema, **kw)
+            cache.set(*key, method, value)
+        return value
+
+    return decorated
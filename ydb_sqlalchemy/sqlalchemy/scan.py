@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import itertools
+import queue
+import threading
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence
+
+import sqlalchemy as sa
+import ydb
+
+SCAN_MAX_WORKERS = 5
+SCAN_YIELD_PER = 1000
+SCAN_MAX_BUFFERED_PARTITIONS = 2
+
+_END_OF_RANGE = object()
+
+
+def _key_bound_clause(
+    columns: Sequence[sa.Column], values: Sequence[Any], inclusive: bool, lower: bool
+) -> Optional[sa.sql.ColumnElement]:
+    # NULL is less than any other value of a key column, so NULL in a bound makes the rest of it meaningless
+    not_null_values = tuple(itertools.takewhile(lambda value: value is not None, values))
+    if len(not_null_values) < len(values):
+        inclusive = lower
+    values = not_null_values
+
+    if not values:
+        return None if lower else sa.false()
+
+    clause = None
+    for column, value in reversed(list(zip(columns, values))):
+        if lower:
+            strict, last = column > value, column >= value if inclusive else column > value
+        else:
+            strict, last = column < value, column <= value if inclusive else column < value
+            if column.nullable:
+                strict, last = sa.or_(strict, column.is_(None)), sa.or_(last, column.is_(None))
+        clause = last if clause is None else sa.or_(strict, sa.and_(column == value, clause))
+    return clause
+
+
+def _key_range_clauses(columns: Sequence[sa.Column], key_range: ydb.KeyRange) -> List[sa.sql.ColumnElement]:
+    clauses = []
+    for key_bound, lower in ((key_range.from_bound, True), (key_range.to_bound, False)):
+        if key_bound is not None:
+            clause = _key_bound_clause(columns, key_bound.value, key_bound.is_inclusive(), lower)
+            if clause is not None:
+                clauses.append(clause)
+    return clauses
+
+
+def _get_key_range_statements(
+    connection: sa.engine.Connection, table: sa.Table, columns: Optional[Sequence[Any]], ordered: bool
+) -> List[sa.sql.Select]:
+    primary_key = list(table.primary_key.columns)
+    statement = sa.select(*(columns or [table]))
+    if ordered:
+        statement = statement.order_by(*primary_key)
+
+    return [
+        statement.where(*_key_range_clauses(primary_key, key_range))
+        for key_range in connection.dialect._get_table_key_ranges(connection, table.name)
+    ]
+
+
+def _make_outputs(queue_cls, ranges_count: int, ordered: bool, max_workers: int):
+    if ordered:
+        outputs = [queue_cls(SCAN_MAX_BUFFERED_PARTITIONS) for _ in range(ranges_count)]
+        return outputs, [(output, 1) for output in outputs]
+    output = queue_cls(SCAN_MAX_BUFFERED_PARTITIONS * max_workers)
+    return [output] * ranges_count, [(output, ranges_count)]
+
+
+def scan_table(
+    engine: sa.engine.Engine,
+    table: sa.Table,
+    columns: Optional[Sequence[Any]] = None,
+    ordered: bool = False,
+    max_workers: int = SCAN_MAX_WORKERS,
+    yield_per: int = SCAN_YIELD_PER,
+) -> Iterator[sa.engine.Row]:
+    """Read a whole table with one query per partition running in parallel.
+
+    Key ranges of the table partitions are read from the table description, every range is read by
+    a separate connection of the engine in a thread pool of ``max_workers`` threads. With ``ordered=True``
+    rows are returned in the primary key order, otherwise in the order partitions of rows are received.
+    """
+    with engine.connect() as connection:
+        statements = _get_key_range_statements(connection, table, columns, ordered)
+
+    stop = threading.Event()
+    outputs, consumed_outputs = _make_outputs(queue.Queue, len(statements), ordered, max_workers)
+
+    def put(output: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read_key_range(statement: sa.sql.Select, output: queue.Queue) -> None:
+        if stop.is_set():
+            return
+        try:
+            with engine.connect() as connection:
+                result = connection.execution_options(stream_results=True).execute(statement)
+                for partition in result.partitions(yield_per):
+                    if not put(output, partition):
+                        return
+        except Exception as e:
+            put(output, e)
+            return
+        put(output, _END_OF_RANGE)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(read_key_range, *args) for args in zip(statements, outputs)]
+        try:
+            for output, ranges_count in consumed_outputs:
+                while ranges_count:
+                    item = output.get()
+                    if item is _END_OF_RANGE:
+                        ranges_count -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield from item
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+
+
+async def async_scan_table(
+    engine: Any,
+    table: sa.Table,
+    columns: Optional[Sequence[Any]] = None,
+    ordered: bool = False,
+    max_workers: int = SCAN_MAX_WORKERS,
+    yield_per: int = SCAN_YIELD_PER,
+) -> AsyncIterator[sa.engine.Row]:
+    """Async variant of :func:`scan_table` for ``sqlalchemy.ext.asyncio.AsyncEngine``.
+
+    Key ranges are read by concurrent tasks, at most ``max_workers`` of them are running at once.
+    """
+    async with engine.connect() as connection:
+        statements = await connection.run_sync(_get_key_range_statements, table, columns, ordered)
+
+    semaphore = asyncio.Semaphore(max_workers)
+    outputs, consumed_outputs = _make_outputs(asyncio.Queue, len(statements), ordered, max_workers)
+
+    async def read_key_range(statement: sa.sql.Select, output: asyncio.Queue) -> None:
+        try:
+            async with semaphore, engine.connect() as connection:
+                result = await connection.stream(statement)
+                async for partition in result.partitions(yield_per):
+                    await output.put(partition)
+        except Exception as e:
+            await output.put(e)
+            return
+        await output.put(_END_OF_RANGE)
+
+    tasks = [asyncio.ensure_future(read_key_range(*args)) for args in zip(statements, outputs)]
+    try:
+        for output, ranges_count in consumed_outputs:
+            while ranges_count:
+                item = await output.get()
+                if item is _END_OF_RANGE:
+                    ranges_count -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    for row in item:
+                        yield row
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,147 @@
+import asyncio
+import concurrent.futures
+import fnmatch
+import posixpath
+import re
+from typing import Awaitable, Callable, Collection, Iterator, List, Optional, Sequence, Union
+
+import ydb
+
+SCHEME_MAX_WORKERS = 10
+
+
+class SchemeFilter:
+    """Glob patterns of paths relative to the walked directory.
+
+    ``*`` and ``?`` match within a single path segment, ``**`` matches any number of segments.
+    Patterns are also used to skip directories which can't contain matching paths.
+    """
+
+    def __init__(self, patterns: Union[str, Sequence[str]]):
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        self.patterns = [pattern.strip("/").split("/") for pattern in patterns]
+        self._regexes = [re.compile(_translate_pattern(parts)) for parts in self.patterns]
+
+    def match(self, path: str) -> bool:
+        return any(regex.fullmatch(path) for regex in self._regexes)
+
+    def may_contain(self, directory: str) -> bool:
+        return any(_may_contain(parts, directory.split("/")) for parts in self.patterns)
+
+
+def _translate_segment(segment: str) -> str:
+    regex = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+        elif char == "[" and "]" in segment[i + 2 :]:  # noqa: E203
+            end = segment.index("]", i + 2)
+            chars = segment[i + 1 : end]  # noqa: E203
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            regex.append(f"[{chars}]")
+            i = end
+        else:
+            regex.append(re.escape(char))
+        i += 1
+    return "".join(regex)
+
+
+def _translate_pattern(parts: Sequence[str]) -> str:
+    regex = []
+    for i, part in enumerate(parts):
+        is_last = i == len(parts) - 1
+        if part == "**":
+            regex.append(".*" if is_last else "(?:[^/]+/)*")
+        else:
+            regex.append(_translate_segment(part) + ("" if is_last else "/"))
+    return "".join(regex)
+
+
+def _may_contain(pattern_parts: Sequence[str], directory_parts: Sequence[str]) -> bool:
+    for pattern_part, directory_part in zip(pattern_parts, directory_parts):
+        if pattern_part == "**":
+            return True
+        if not fnmatch.fnmatchcase(directory_part, pattern_part):
+            return False
+    return len(directory_parts) < len(pattern_parts)
+
+
+def _visit_directory(
+    directory: str,
+    listing: ydb.Directory,
+    entry_types: Collection[ydb.SchemeEntryType],
+    scheme_filter: Optional[SchemeFilter],
+    max_depth: Optional[int],
+):
+    paths, subdirectories = [], []
+    for child in listing.children:
+        path = posixpath.join(directory, child.name)
+        if child.type in entry_types:
+            if scheme_filter is None or scheme_filter.match(path):
+                paths.append(path)
+        elif child.is_directory() and not child.name.startswith("."):
+            if max_depth is not None and path.count("/") >= max_depth:
+                continue
+            if scheme_filter is None or scheme_filter.may_contain(path):
+                subdirectories.append(path)
+    return paths, subdirectories
+
+
+def _walk_scheme(
+    list_directory: Callable[[str], ydb.Directory],
+    root: str,
+    entry_types: Collection[ydb.SchemeEntryType],
+    scheme_filter: Optional[SchemeFilter] = None,
+    max_depth: Optional[int] = None,
+    max_workers: int = SCHEME_MAX_WORKERS,
+) -> Iterator[str]:
+    """Yield paths of entries under ``root`` relative to it, as soon as their directories are listed.
+
+    Directories are listed concurrently by at most ``max_workers`` threads, directories deeper than
+    ``max_depth`` levels below ``root`` and directories which can't contain paths matching ``scheme_filter``
+    are not listed.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = {executor.submit(list_directory, root): ""}
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    directory = pending.pop(future)
+                    paths, subdirectories = _visit_directory(
+                        directory, future.result(), entry_types, scheme_filter, max_depth
+                    )
+                    for subdirectory in subdirectories:
+                        pending[executor.submit(list_directory, posixpath.join(root, subdirectory))] = subdirectory
+                    yield from paths
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def _async_walk_scheme(
+    list_directory: Callable[[str], Awaitable[ydb.Directory]],
+    root: str,
+    entry_types: Collection[ydb.SchemeEntryType],
+    scheme_filter: Optional[SchemeFilter] = None,
+    max_depth: Optional[int] = None,
+    max_workers: int = SCHEME_MAX_WORKERS,
+) -> List[str]:
+    """Async variant of :func:`_walk_scheme`, directories are listed by concurrent tasks."""
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def walk(directory: str) -> List[str]:
+        async with semaphore:
+            listing = await list_directory(posixpath.join(root, directory) if directory else root)
+        paths, subdirectories = _visit_directory(directory, listing, entry_types, scheme_filter, max_depth)
+        for subdirectory_paths in await asyncio.gather(*(walk(subdirectory) for subdirectory in subdirectories)):
+            paths.extend(subdirectory_paths)
+        return paths
+
+    return await walk("")
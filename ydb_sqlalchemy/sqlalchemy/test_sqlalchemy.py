@@ -1,9 +1,42 @@
-from datetime import date
+import struct
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
 import sqlalchemy as sa
+from sqlalchemy import orm
+
+import ydb_dbapi
 
 from . import YqlDialect, types
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _register_dialects():
+    # ydb_* options of tables are validated by the registered "ydb" dialect
+    from sqlalchemy.dialects import registry
+
+    registry.register("ydb", "ydb_sqlalchemy.sqlalchemy", "YqlDialect")
+    registry.register("yql.ydb", "ydb_sqlalchemy.sqlalchemy", "YqlDialect")
+
+
+def _stub_table_description(dialect, **attributes):
+    import ydb
+
+    # A row table without options unless attributes of the description are given
+    defaults = dict(
+        type=ydb.SchemeEntryType.TABLE,
+        ttl_settings=None,
+        read_replicas_settings=None,
+        key_bloom_filter=ydb.FeatureFlag.UNSPECIFIED,
+        columns=[],
+        column_families=[],
+    )
+    description = SimpleNamespace(**{**defaults, **attributes})
+    dialect._describe_table = lambda *args, **kwargs: description
+    return description
+
+
 def test_casts():
     dialect = YqlDialect()
     expr = sa.literal_column("1/2")
@@ -167,3 +200,1254 @@ def test_optional_type_compilation():
     # get_ydb_type returns ydb.PrimitiveType.Int64 (enum) wrapped in OptionalType.
     # OptionalType.item is the inner type.
     assert ydb_type.item == ydb.PrimitiveType.Int64
+
+
+def test_bind_types_are_cached_on_compiled_statement():
+    import ydb
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    compiled = sa.select(table).where(table.c.id == sa.bindparam("id")).compile(dialect=dialect, column_keys=[])
+
+    resolved_types = []
+    get_ydb_type = compiled._type_compiler_cls.get_ydb_type
+
+    def counting_get_ydb_type(self, type_, is_optional):
+        resolved_types.append(type_)
+        return get_ydb_type(self, type_, is_optional)
+
+    compiled._type_compiler_cls = type(
+        "CountingTypeCompiler", (compiled._type_compiler_cls,), {"get_ydb_type": counting_get_ydb_type}
+    )
+
+    assert compiled.get_bind_types({"id": 1}) == {"id": ydb.PrimitiveType.Int64}
+    assert compiled.get_bind_types({"id": 2}) == {"id": ydb.PrimitiveType.Int64}
+    assert len(resolved_types) == 1
+
+    assert compiled.get_bind_types({"id": None}) == {"id": ydb.OptionalType(ydb.PrimitiveType.Int64)}
+    assert compiled.get_bind_types([{"id": 1}, {"id": None}]) == {"id": ydb.OptionalType(ydb.PrimitiveType.Int64)}
+    assert len(resolved_types) == 3
+
+
+def test_format_variables_reuses_statement_template():
+    dialect = YqlDialect()
+    statement_templates = {}
+
+    statement, parameters = dialect._format_variables(
+        "SELECT %(id)s, '100%%'", {"id": 1}, execute_many=False, statement_templates=statement_templates
+    )
+    assert statement == "SELECT $`id`, '100%'"
+    assert parameters == {"$id": 1}
+    assert len(statement_templates) == 1
+
+    same_statement, parameters = dialect._format_variables(
+        "SELECT %(id)s, '100%%'", {"id": 2}, execute_many=False, statement_templates=statement_templates
+    )
+    assert same_statement is statement
+    assert parameters == {"$id": 2}
+    assert len(statement_templates) == 1
+
+    statement, parameters = dialect._format_variables(
+        "SELECT %(id)s", [{"id": 1}, {"id": 2}], execute_many=True, statement_templates=statement_templates
+    )
+    assert statement == "SELECT $`id`"
+    assert parameters == [{"$id": 1}, {"$id": 2}]
+    assert len(statement_templates) == 2
+
+
+class _RecordingCursor:
+    description = None
+    rowcount = -1
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, operation, parameters=None):
+        self.executed.append(("execute", operation, parameters))
+
+    def executemany(self, operation, parameters=None):
+        self.executed.append(("executemany", operation, parameters))
+
+    def execute_scheme(self, operation, parameters=None):
+        self.executed.append(("execute_scheme", operation, parameters))
+
+    def close(self):
+        pass
+
+
+def _executemany_context(statement, dialect, column_keys):
+    compiled = statement.compile(dialect=dialect, column_keys=column_keys, for_executemany=True)
+    return SimpleNamespace(
+        isddl=False,
+        isinsert=compiled.isinsert,
+        isupdate=compiled.isupdate,
+        isdelete=compiled.isdelete,
+        compiled=compiled,
+    )
+
+
+def test_executemany_as_table():
+    from . import replace, upsert
+
+    dialect = YqlDialect(paramstyle="pyformat", _executemany_as_table=True, _executemany_as_table_max_rows=2)
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode, key="value_key"),
+    )
+    rows = [{"id": 1, "value_key": "a"}, {"id": 2, "value_key": None}, {"id": 3, "value_key": "c"}]
+
+    for statement, verb in [(sa.insert(table), "INSERT"), (upsert(table), "UPSERT"), (replace(table), "REPLACE")]:
+        context = _executemany_context(statement, dialect, ["id", "value_key"])
+        cursor = _RecordingCursor()
+        dialect.do_executemany(cursor, context.compiled.string, rows, context)
+
+        assert [method for method, _, _ in cursor.executed] == ["execute", "execute"]
+        for _, operation, _ in cursor.executed:
+            assert operation == f"{verb} INTO test (id, value)\nSELECT id, value FROM AS_TABLE($rows)"
+
+        chunks = [parameters["$rows"] for _, _, parameters in cursor.executed]
+        assert [chunk.value for chunk in chunks] == [
+            [{"id": 1, "value": "a"}, {"id": 2, "value": None}],
+            [{"id": 3, "value": "c"}],
+        ]
+        assert str(chunks[0].value_type) == "List<Struct<id:Int64,value:Utf8?>>"
+
+
+def test_executemany_as_table_falls_back_for_sql_expressions():
+    dialect = YqlDialect(paramstyle="pyformat", _executemany_as_table=True)
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("created_at", sa.DateTime, default=sa.func.CurrentUtcTimestamp()),
+    )
+    context = _executemany_context(sa.insert(table), dialect, ["id"])
+    cursor = _RecordingCursor()
+    dialect.do_executemany(cursor, context.compiled.string, [{"id": 1}, {"id": 2}], context)
+
+    assert [method for method, _, _ in cursor.executed] == ["executemany"]
+
+
+def _compile_with_cache(statement, dialect, compiled_cache):
+    # Compiled statement and its cache stats, e.g. dialect.CACHE_HIT
+    result = statement._compile_w_cache(dialect, compiled_cache=compiled_cache, column_keys=[])
+    return result[0], result[-1]
+
+
+def test_upsert_hits_statement_cache():
+    from . import upsert
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    compiled_cache = {}
+
+    compiled, cache_stats = _compile_with_cache(upsert(table).values(id=1, value="a"), dialect, compiled_cache)
+    assert str(compiled) == "UPSERT INTO test (id, value) VALUES (?, ?)"
+    assert cache_stats == dialect.CACHE_MISS
+
+    cached, cache_stats = _compile_with_cache(upsert(table).values(id=2, value="b"), dialect, compiled_cache)
+    assert cached is compiled
+    assert cache_stats == dialect.CACHE_HIT
+
+    compiled, cache_stats = _compile_with_cache(sa.insert(table).values(id=1, value="a"), dialect, compiled_cache)
+    assert str(compiled) == "INSERT INTO test (id, value) VALUES (?, ?)"
+    assert cache_stats == dialect.CACHE_MISS
+
+
+def test_replace():
+    from . import replace
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    compiled_cache = {}
+
+    compiled, cache_stats = _compile_with_cache(replace(table).values(id=1, value="a"), dialect, compiled_cache)
+    assert str(compiled) == "REPLACE INTO test (id, value) VALUES (?, ?)"
+    assert cache_stats == dialect.CACHE_MISS
+    cached, cache_stats = _compile_with_cache(replace(table).values(id=2, value="b"), dialect, compiled_cache)
+    assert cached is compiled
+    assert cache_stats == dialect.CACHE_HIT
+
+    source = sa.select(table.c.id + 1, table.c.value)
+    assert str(replace(table).from_select(["id", "value"], source).compile(dialect=dialect)) == (
+        "REPLACE INTO test (id, value) SELECT test.id + ? AS anon_1, test.value \nFROM test"
+    )
+
+    Base = orm.declarative_base()
+
+    class Item(Base):
+        __tablename__ = "items"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column("value", sa.Unicode)
+
+    # Statements of mapped classes are executed by the ORM bulk insert
+    statement = replace(Item)
+    assert statement._propagate_attrs["compile_state_plugin"] == "orm"
+    assert str(statement.values(id=1, value="a").compile(dialect=dialect)) == (
+        "REPLACE INTO items (id, value) VALUES (?, ?)"
+    )
+
+
+def test_batch_update_and_delete():
+    from . import batch_delete, batch_update
+
+    dialect = YqlDialect(paramstyle="pyformat")
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    update = batch_update(table).where(table.c.id > 10).values(value="a")
+    delete = batch_delete(table).where(table.c.id > 10)
+    assert str(update.compile(dialect=YqlDialect())) == "BATCH UPDATE test SET value=? WHERE test.id > ?"
+    assert str(delete.compile(dialect=YqlDialect())) == "BATCH DELETE FROM test WHERE test.id > ?"
+    with pytest.raises(sa.exc.CompileError, match="RETURNING"):
+        batch_delete(table).returning(table.c.id).compile(dialect=YqlDialect())
+
+    def execute(statement, tx_context=None):
+        compiled = statement.compile(dialect=dialect, column_keys=[])
+        dbapi_connection = SimpleNamespace(_tx_context=tx_context)
+        context = SimpleNamespace(
+            isddl=False, compiled=compiled, _dbapi_connection=SimpleNamespace(dbapi_connection=dbapi_connection)
+        )
+        cursor = _RecordingCursor()
+        dialect.do_execute(cursor, compiled.string, compiled.params, context)
+        return cursor.executed
+
+    # BATCH statements are executed without a transaction, as schema queries are
+    [(method, operation, parameters)] = execute(delete)
+    assert method == "execute_scheme"
+    assert operation == "BATCH DELETE FROM test WHERE test.id > $`id_1`"
+    assert parameters["$id_1"].value == 10
+    assert [method for method, _, _ in execute(sa.delete(table).where(table.c.id > 10))] == ["execute"]
+
+    with pytest.raises(ydb_dbapi.ProgrammingError, match="interactive transaction"):
+        execute(update, tx_context=object())
+
+
+class _RecordingConnection:
+    _tx_context = None
+
+    def __init__(self):
+        self.recording_cursor = _RecordingCursor()
+
+    def cursor(self):
+        return self.recording_cursor
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.mark.skipif(sa.__version__ < "2.", reason="insertmanyvalues is available since SQLAlchemy 2.0")
+def test_insertmanyvalues():
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    rows = [{"id": i, "value": "a" * i if i != 3 else None} for i in range(10)]
+
+    def execute(statement, rows, **engine_kwargs):
+        dbapi_connection = _RecordingConnection()
+        engine = sa.create_engine("yql+ydb://localhost:2136/local", creator=lambda: dbapi_connection, **engine_kwargs)
+        with engine.connect() as connection:
+            dbapi_connection.recording_cursor.executed.clear()
+            connection.execute(statement, rows)
+        return dbapi_connection.recording_cursor.executed
+
+    executed = execute(sa.insert(table), rows, insertmanyvalues_page_size=4)
+    assert [method for method, _, _ in executed] == ["execute"] * 3
+    _, operation, parameters = executed[0]
+    assert operation == (
+        "INSERT INTO test (id, value) VALUES "
+        "($`id__0`, $`value__0`), ($`id__1`, $`value__1`), ($`id__2`, $`value__2`), ($`id__3`, $`value__3`)"
+    )
+    assert [parameters[f"$id__{i}"].value for i in range(4)] == [0, 1, 2, 3]
+    assert parameters["$value__3"].value is None
+    assert str(parameters["$value__3"].value_type) == "Utf8?"
+    assert str(executed[-1][2]["$id__1"].value_type) == "Int64"
+
+    # Types of pages are memoized by bind names, pages without NULL values share them
+    dbapi_connection = _RecordingConnection()
+    engine = sa.create_engine("yql+ydb://localhost:2136/local", creator=lambda: dbapi_connection)
+    with engine.connect() as connection:
+        result = connection.execute(sa.insert(table), rows, execution_options={"insertmanyvalues_page_size": 4})
+    assert len(dbapi_connection.recording_cursor.executed) == 3
+    assert len(result.context.compiled._bind_types_cache) == 2
+
+    # Pages are limited by the estimated size of values of the largest row, 8 + 9 bytes here
+    executed = execute(sa.insert(table), rows, _insertmanyvalues_max_bytes=40)
+    assert [len(parameters) for _, _, parameters in executed] == [4] * 5
+    # ... and by the size of the query text
+    executed = execute(sa.insert(table), rows, _insertmanyvalues_max_query_size=200)
+    assert all(len(operation) <= 200 for _, operation, _ in executed) and len(executed) > 1
+
+    # Statements which are sent through AS_TABLE are not split into pages
+    executed = execute(sa.insert(table), rows, _executemany_as_table=True)
+    assert [operation for _, operation, _ in executed] == [
+        "INSERT INTO test (id, value)\nSELECT id, value FROM AS_TABLE($rows)"
+    ]
+
+
+def test_update_on_and_delete_on():
+    from . import delete_on, update_on
+
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode),
+    )
+    assert str(update_on(table).values(id=1, value="a").compile(dialect=YqlDialect())) == (
+        "UPDATE test ON (id, value) VALUES (?, ?)"
+    )
+    source = sa.select(table.c.id).where(table.c.value.is_(None))
+    assert str(delete_on(table).from_select(["id"], source).compile(dialect=YqlDialect())) == (
+        "DELETE FROM test ON (id) SELECT test.id \nFROM test \nWHERE test.value IS NULL"
+    )
+
+    def executemany(statement, column_keys, rows, **dialect_kwargs):
+        dialect = YqlDialect(paramstyle="pyformat", **dialect_kwargs)
+        context = _executemany_context(statement, dialect, column_keys)
+        cursor = _RecordingCursor()
+        dialect.do_executemany(cursor, context.compiled.string, rows, context)
+        return cursor.executed
+
+    # Rows of UPDATE ON and DELETE ON are always sent through AS_TABLE
+    [(_, operation, parameters)] = executemany(
+        update_on(table), ["id", "value"], [{"id": 1, "value": "a"}, {"id": 2, "value": None}]
+    )
+    assert operation == "UPDATE test ON (id, value)\nSELECT id, value FROM AS_TABLE($rows)"
+    assert parameters["$rows"].value == [{"id": 1, "value": "a"}, {"id": 2, "value": None}]
+    [(_, operation, parameters)] = executemany(delete_on(table), ["id"], [{"id": 1}, {"id": 2}])
+    assert operation == "DELETE FROM test ON (id)\nSELECT id FROM AS_TABLE($rows)"
+    assert str(parameters["$rows"].value_type) == "List<Struct<id:Int64>>"
+
+    # With _executemany_update_delete_on UPDATE and DELETE by primary key bind parameters, as ORM bulk updates are,
+    # are turned into them
+    update = sa.update(table).where(table.c.id == sa.bindparam("test_id"))
+    rows = [{"test_id": 1, "value": "a"}, {"test_id": 2, "value": "b"}]
+    [(_, operation, parameters)] = executemany(update, ["test_id", "value"], rows, _executemany_update_delete_on=True)
+    assert operation == "UPDATE test ON (id, value)\nSELECT id, value FROM AS_TABLE($rows)"
+    assert parameters["$rows"].value == [{"id": 1, "value": "a"}, {"id": 2, "value": "b"}]
+    delete = sa.delete(table).where(table.c.id == sa.bindparam("test_id"))
+    [(_, operation, parameters)] = executemany(delete, [], [{"test_id": 1}], _executemany_update_delete_on=True)
+    assert operation == "DELETE FROM test ON (id)\nSELECT id FROM AS_TABLE($rows)"
+    assert parameters["$rows"].value == [{"id": 1}]
+
+    assert [method for method, _, _ in executemany(update, ["test_id", "value"], rows)] == ["executemany"]
+    # _executemany_as_table alone applies to INSERT, UPSERT and REPLACE only
+    executed = executemany(update, ["test_id", "value"], rows, _executemany_as_table=True)
+    assert [method for method, _, _ in executed] == ["executemany"]
+    # Other conditions and SQL expressions in SET can't be moved into AS_TABLE rows
+    for statement, column_keys, statement_rows in [
+        (
+            update.where(table.c.value == sa.bindparam("old_value")),
+            ["test_id", "value", "old_value"],
+            [{"test_id": 1, "value": "a", "old_value": "b"}],
+        ),
+        (sa.update(table).where(table.c.id > sa.bindparam("test_id")), ["test_id", "value"], rows),
+        (update.values(value=sa.func.Unicode.ToUpper(table.c.value)), ["test_id"], [{"test_id": 1}]),
+    ]:
+        executed = executemany(statement, column_keys, statement_rows, _executemany_update_delete_on=True)
+        assert [method for method, _, _ in executed] == ["executemany"]
+
+
+def test_render_in_as_list():
+    dialect = YqlDialect(paramstyle="pyformat", _render_in_as_list=True)
+    table = sa.Table("test", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True))
+
+    statement = sa.select(table.c.id).where(table.c.id.in_([1, 2, 3]), table.c.id.not_in([4]))
+    compiled = statement.compile(dialect=dialect, column_keys=[])
+    assert str(compiled) == ("SELECT test.id \nFROM test \nWHERE test.id IN %(id_1)s AND (test.id NOT IN %(id_2)s)")
+
+    parameters = compiled.construct_params()
+    assert parameters == {"id_1": [1, 2, 3], "id_2": [4]}
+
+    def bind_types(parameters):
+        return {name: str(type_) for name, type_ in compiled.get_bind_types(parameters).items()}
+
+    assert bind_types(parameters) == {"id_1": "List<Int64>", "id_2": "List<Int64>"}
+    assert bind_types({"id_1": [1, None], "id_2": [4]}) == {"id_1": "List<Int64?>", "id_2": "List<Int64>"}
+
+    literal_compiled = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    assert str(literal_compiled) == "SELECT test.id \nFROM test \nWHERE test.id IN (1, 2, 3) AND (test.id NOT IN (4))"
+
+
+def test_ydb_types_map():
+    dialect = YqlDialect()
+    type_compiler = dialect.type_compiler
+
+    def get_ydb_type(type_, is_optional=False):
+        return str(type_compiler.get_ydb_type(type_, is_optional=is_optional))
+
+    assert get_ydb_type(sa.Unicode()) == "Utf8"
+    assert get_ydb_type(sa.BigInteger()) == "Int64"
+    assert get_ydb_type(types.UInt8()) == "Uint8"
+    assert get_ydb_type(sa.DATETIME()) == "Datetime"
+    assert get_ydb_type(types.YqlDateTime()) == "Datetime"
+    assert get_ydb_type(types.YqlTimestamp()) == "Timestamp"
+    assert get_ydb_type(types.YqlDateTime64()) == "Datetime64"
+    assert get_ydb_type(sa.Numeric(10, 2), is_optional=True) == "Decimal(10,2)?"
+    assert get_ydb_type(types.Optional(sa.BLOB())) == "String?"
+    assert get_ydb_type(sa.TupleType(sa.Integer(), sa.Boolean())) == "Tuple<Int64,Bool>"
+
+
+def test_ydb_types_are_cached():
+    dialect = YqlDialect()
+    type_compiler = dialect.type_compiler
+    struct_type = types.StructType(
+        {"id": sa.Integer, "tags": types.ListType(sa.String), "val": types.Optional(sa.Float)}
+    )
+
+    ydb_type = type_compiler.get_ydb_type(struct_type, is_optional=False)
+    assert type_compiler.get_ydb_type(struct_type, is_optional=False) is ydb_type
+    assert type_compiler.get_ydb_type(struct_type, is_optional=True) is not ydb_type
+    assert str(type_compiler.get_ydb_type(struct_type, is_optional=True)) == f"{ydb_type}?"
+
+
+def test_bulk_upsert():
+    from . import bulk_upsert
+
+    class RecordingConnection:
+        def __init__(self):
+            self.calls = []
+
+        def bulk_upsert(self, table_name, rows, column_types):
+            self.calls.append((table_name, rows, column_types))
+
+    dialect = YqlDialect()
+    dbapi_connection = RecordingConnection()
+    connection = SimpleNamespace(dialect=dialect, connection=dbapi_connection)
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.Unicode, key="value_key"),
+        sa.Column("created_at", types.YqlDateTime),
+    )
+    created_at = datetime(2024, 1, 1)
+    rows = ({"id": i, "value_key": str(i) if i % 2 else None, "created_at": created_at} for i in range(5))
+
+    bulk_upsert(connection, table, rows, max_rows=2)
+
+    assert [len(rows) for _, rows, _ in dbapi_connection.calls] == [2, 2, 1]
+    assert all(table_name == "test" for table_name, _, _ in dbapi_connection.calls)
+    assert dbapi_connection.calls[0][1] == [
+        {"id": 0, "value": None, "created_at": 1704067200},
+        {"id": 1, "value": "1", "created_at": 1704067200},
+    ]
+    column_types = dbapi_connection.calls[0][2]
+    assert str(column_types) == "BulkUpsertColumns<id:Int64,value:Utf8?,created_at:Datetime?>"
+
+    class Entity:
+        pass
+
+    orm.registry().map_imperatively(Entity, table)
+    bulk_upsert(connection, Entity, [{"id": 1}])
+    assert dbapi_connection.calls[-1][1] == [{"id": 1}]
+
+    with pytest.raises(sa.exc.ArgumentError):
+        bulk_upsert(connection, table, [{"id": 1, "unknown": 1}])
+    with pytest.raises(sa.exc.ArgumentError):
+        bulk_upsert(connection, table, [{"id": 1}, {"id": 2, "value_key": "a"}])
+
+
+class _FakeQueryStream:
+    def __init__(self, parts):
+        self._parts = iter(parts)
+        self.parts_read = 0
+        self.cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        part = next(self._parts)
+        self.parts_read += 1
+        return part
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _streaming_connection(stream):
+    tx_context = SimpleNamespace(execute=lambda **kwargs: stream)
+    session = SimpleNamespace(transaction=lambda tx_mode: tx_context, deleted=False)
+    session.delete = lambda: setattr(session, "deleted", True)
+    session_pool = SimpleNamespace(acquire=lambda: session, released=[])
+    session_pool.release = session_pool.released.append
+    return SimpleNamespace(
+        table_path_prefix="",
+        _session_pool=session_pool,
+        _tx_context=None,
+        _tx_mode=None,
+        _get_request_settings=lambda: None,
+    )
+
+
+def test_streaming_cursor():
+    import ydb
+
+    from .cursors import StreamingCursor
+
+    columns = [SimpleNamespace(name="id", type=ydb.PrimitiveType.Int64.proto)]
+    parts = [SimpleNamespace(columns=columns, rows=[(i,), (i + 1,)]) for i in range(0, 6, 2)]
+
+    stream = _FakeQueryStream(parts)
+    connection = _streaming_connection(stream)
+    cursor = StreamingCursor(connection)
+    cursor.execute("SELECT id FROM test")
+
+    assert stream.parts_read == 1
+    assert [column[0] for column in cursor.description] == ["id"]
+    assert cursor.fetchmany(3) == [(0,), (1,), (2,)]
+    assert stream.parts_read == 2
+    assert cursor.fetchall() == [(3,), (4,), (5,)]
+    assert cursor.fetchone() is None
+    assert len(connection._session_pool.released) == 1
+    assert not stream.cancelled
+    assert not connection._session_pool.released[0].deleted
+
+    stream = _FakeQueryStream(parts)
+    connection = _streaming_connection(stream)
+    cursor = StreamingCursor(connection)
+    cursor.execute("SELECT id FROM test")
+    assert cursor.fetchone() == (0,)
+    cursor.close()
+
+    assert stream.cancelled
+    assert len(connection._session_pool.released) == 1
+    assert connection._session_pool.released[0].deleted
+
+
+def test_arrow_result_format():
+    import pyarrow
+
+    from . import fetch_arrow
+    from .cursors import StreamingCursor
+
+    table = pyarrow.table({"id": pyarrow.array([1, 2, 3, 4], pyarrow.int64()), "value": ["a", "b", None, "d"]})
+    schema_data = table.schema.serialize().to_pybytes()
+    parts = [
+        SimpleNamespace(
+            columns=[],
+            rows=[],
+            arrow_format_meta=SimpleNamespace(schema=schema_data),
+            data=batch.serialize().to_pybytes(),
+        )
+        for batch in table.to_batches(max_chunksize=2)
+    ]
+
+    stream = _FakeQueryStream(parts)
+    cursor = StreamingCursor(_streaming_connection(stream), result_format="arrow")
+    cursor.execute("SELECT id, value FROM test")
+
+    assert stream.parts_read == 1
+    assert [column[0] for column in cursor.description] == ["id", "value"]
+    assert cursor.fetchone() is None
+
+    result = SimpleNamespace(context=SimpleNamespace(cursor=cursor), close=cursor.close)
+    assert fetch_arrow(result).equals(table)
+    assert stream.parts_read == 2
+
+
+def test_key_range_statements():
+    import ydb
+
+    from .scan import _get_key_range_statements
+
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("a", sa.Integer, primary_key=True),
+        sa.Column("b", sa.Integer, primary_key=True, nullable=True),
+        sa.Column("value", sa.Unicode),
+    )
+    key_type = (
+        ydb.TupleType().add_element(ydb.PrimitiveType.Int64).add_element(ydb.OptionalType(ydb.PrimitiveType.Int64))
+    )
+    key_ranges = [
+        ydb.KeyRange(None, ydb.KeyBound.exclusive((1, 10), key_type)),
+        ydb.KeyRange(ydb.KeyBound.inclusive((1, 10), key_type), ydb.KeyBound.exclusive((5, None), key_type)),
+        ydb.KeyRange(ydb.KeyBound.inclusive((5, None), key_type), None),
+    ]
+    dialect = YqlDialect()
+    connection = SimpleNamespace(dialect=SimpleNamespace(_get_table_key_ranges=lambda connection, name: key_ranges))
+
+    statements = _get_key_range_statements(connection, table, [table.c.a, table.c.value], ordered=True)
+    where_clauses = [
+        str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})).split("\nWHERE ")[1]
+        for statement in statements
+    ]
+    assert where_clauses == [
+        "test.a < 1 OR test.a = 1 AND (test.b < 10 OR test.b IS NULL) ORDER BY test.a, test.b",
+        "(test.a > 1 OR test.a = 1 AND test.b >= 10) AND test.a < 5 ORDER BY test.a, test.b",
+        "test.a >= 5 ORDER BY test.a, test.b",
+    ]
+    assert str(statements[0].compile(dialect=dialect)).startswith("SELECT test.a, test.value \nFROM test")
+
+
+def test_keyset_pages():
+    from .pagination import _keyset_select, fetch_keyset_page, iter_keyset_pages
+
+    table = sa.Table(
+        "test",
+        sa.MetaData(),
+        sa.Column("a", sa.Integer, primary_key=True),
+        sa.Column("b", sa.Integer, primary_key=True, nullable=True),
+        sa.Column("value", sa.Unicode),
+    )
+    statement = _keyset_select(table, [table.c.a, table.c.b], 11, (1, 10), None, table.c.value.is_not(None))
+    assert str(statement.compile(dialect=YqlDialect(), compile_kwargs={"literal_binds": True})) == (
+        "SELECT test.a, test.b, test.value \nFROM test \n"
+        "WHERE test.value IS NOT NULL AND (test.a > 1 OR test.a = 1 AND test.b > 10) "
+        "ORDER BY test.a, test.b\n LIMIT CAST(11 AS UInt64)"
+    )
+    with pytest.raises(sa.exc.ArgumentError, match="primary key"):
+        _keyset_select(table, [table.c.a, table.c.b], 10, None, ["a", "value"], None)
+
+    # Pages are read from SQLite, which orders NULL before other values as YDB does
+    engine = sa.create_engine("sqlite://")
+    rows = [{"a": a, "b": b, "value": f"{a}-{b}"} for a in range(3) for b in (None, 1, 2)]
+    with engine.begin() as connection:
+        table.create(connection)
+        connection.execute(table.insert(), rows)
+
+        pages = list(iter_keyset_pages(connection, table, page_size=2))
+        assert [row._asdict() for page in pages for row in page.rows] == rows
+        assert [len(page.rows) for page in pages] == [2, 2, 2, 2, 1]
+        assert [page.next_key for page in pages] == [(0, 1), (1, None), (1, 2), (2, 1), None]
+
+        page = fetch_keyset_page(connection, table, 3, after=(1, None), columns=["a", "b"])
+        assert page == ([(1, 1), (1, 2), (2, None)], (2, None))
+        assert fetch_keyset_page(connection, table, 2, after=(2, 1)) == ([(2, 2, "2-2")], None)
+
+
+def _reflection_connection(described, scheme=None, failures=None):
+    # failures are errors raised by the next scheme requests of paths, e.g. {"/local/a": [ydb.Unavailable("")]}
+    import threading
+
+    import ydb
+
+    if scheme is None:
+        scheme = {"a": ydb.SchemeEntryType.TABLE, "b": ydb.SchemeEntryType.TABLE, "c": ydb.SchemeEntryType.TABLE}
+    lock = threading.Lock()
+
+    def describe(table_name):
+        with lock:
+            described.append(table_name)
+        if table_name == "missing":
+            raise ydb_dbapi.ProgrammingError("missing", original_error=ydb.SchemeError("Path not found"))
+        if table_name == "unavailable":
+            raise ydb_dbapi.OperationalError("unavailable", original_error=ydb.Unavailable("unavailable"))
+        return SimpleNamespace(
+            columns=[SimpleNamespace(name="id", type=ydb.PrimitiveType.Int64, family=None)],
+            primary_key=["id"],
+            indexes=[],
+        )
+
+    def get_entry(path, settings):
+        assert isinstance(settings, ydb.BaseRequestSettings)
+        with lock:
+            described.append(path)
+            if failures and failures.get(path):
+                raise failures[path].pop(0)
+        entry = scheme
+        for name in path.strip("/").split("/")[1:]:
+            if not isinstance(entry, dict) or name not in entry:
+                raise ydb.SchemeError("Path not found")
+            entry = entry[name]
+        return entry
+
+    def entry_type(entry):
+        return ydb.SchemeEntryType.DIRECTORY if isinstance(entry, dict) else entry
+
+    def describe_path(path, settings=None):
+        return SimpleNamespace(type=entry_type(get_entry(path, settings)))
+
+    def describe_table(path, settings=None):
+        assert isinstance(settings, ydb.DescribeTableSettings) and settings.include_shard_key_bounds
+        get_entry(path, settings)
+        return SimpleNamespace(shard_key_ranges=[ydb.KeyRange(None, None)])
+
+    def list_directory(path, settings=None):
+        return SimpleNamespace(
+            children=[
+                SimpleNamespace(
+                    name=name, type=entry_type(entry), is_directory=lambda entry=entry: isinstance(entry, dict)
+                )
+                for name, entry in get_entry(path, settings).items()
+            ]
+        )
+
+    dbapi_connection = SimpleNamespace(
+        describe=describe,
+        endpoint="grpc://localhost:2136",
+        database="/local",
+        table_path_prefix="",
+        _get_request_settings=ydb.BaseRequestSettings,
+        get_ydb_retry_settings=lambda: ydb.RetrySettings(
+            max_retries=2,
+            fast_backoff_settings=ydb.BackoffSettings(0, 0),
+            slow_backoff_settings=ydb.BackoffSettings(0, 0),
+        ),
+        _driver=SimpleNamespace(
+            scheme_client=SimpleNamespace(describe_path=describe_path, list_directory=list_directory),
+            table_client=SimpleNamespace(describe_table=describe_table),
+        ),
+    )
+    return SimpleNamespace(connection=SimpleNamespace(dbapi_connection=dbapi_connection, **vars(dbapi_connection)))
+
+
+@pytest.mark.skipif(sa.__version__ < "2.", reason="get_multi_* reflection is available since SQLAlchemy 2.0")
+def test_get_multi_reflection_describes_tables_once():
+    from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+    described = []
+    connection = _reflection_connection(described)
+    dialect = YqlDialect()
+    kw = dict(schema=None, filter_names=None, scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE, info_cache={})
+
+    columns = dict(dialect.get_multi_columns(connection, **kw))
+    pk_constraints = dict(dialect.get_multi_pk_constraint(connection, **kw))
+    indexes = dict(dialect.get_multi_indexes(connection, **kw))
+
+    assert sorted(described) == ["/local/", "a", "b", "c"]
+    assert list(columns) == list(pk_constraints) == list(indexes) == [(None, "a"), (None, "b"), (None, "c")]
+    assert [column["name"] for column in columns[(None, "a")]] == ["id"]
+    assert pk_constraints[(None, "b")]["constrained_columns"] == ["id"]
+
+    kw.update(filter_names=["a", "missing"], scope=ObjectScope.ANY, kind=ObjectKind.ANY)
+    assert list(dict(dialect.get_multi_columns(connection, **kw))) == [(None, "a")]
+    assert sorted(described) == ["/local/", "a", "b", "c", "missing"]
+
+    # Only missing tables are cached, other errors are raised
+    info_cache = {}
+    with pytest.raises(ydb_dbapi.OperationalError):
+        dialect.get_columns(connection, "unavailable", info_cache=info_cache)
+    assert "unavailable" not in info_cache["ydb_table_descriptions"]
+
+
+@pytest.mark.skipif(sa.__version__ < "2.", reason="get_multi_* reflection is available since SQLAlchemy 2.0")
+def test_get_multi_reflection_skips_cached_tables(tmp_path):
+    from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+    path = str(tmp_path / "reflection.db")
+    described = []
+    connection = _reflection_connection(described)
+    YqlDialect(_reflection_cache_path=path).get_columns(connection, "b", info_cache={})
+
+    dialect = YqlDialect(_reflection_cache_path=path)
+    kw = dict(schema=None, filter_names=None, scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE, info_cache={})
+    assert list(dict(dialect.get_multi_columns(connection, **kw))) == [(None, "a"), (None, "b"), (None, "c")]
+    assert sorted(described) == ["/local/", "a", "b", "c"]
+
+
+def test_persistent_reflection_cache(tmp_path):
+    path = str(tmp_path / "reflection.db")
+    described = []
+    connection = _reflection_connection(described)
+
+    def reflect(dialect):
+        info_cache = {}
+        return (
+            dialect.get_columns(connection, "a", info_cache=info_cache),
+            dialect.get_pk_constraint(connection, "a", info_cache=info_cache),
+            dialect.get_indexes(connection, "a", info_cache=info_cache),
+        )
+
+    columns, pk_constraint, indexes = reflect(YqlDialect(_reflection_cache_path=path))
+    assert described == ["a"]
+    assert [column["name"] for column in columns] == ["id"]
+    assert columns[0]["type"] is sa.INTEGER
+
+    # Another process with the same file does not describe the table
+    assert reflect(YqlDialect(_reflection_cache_path=path))[1] == pk_constraint
+    assert described == ["a"]
+
+    cache = YqlDialect(_reflection_cache_path=path)._reflection_cache
+    paths = [f"/local/{name}" for name in ("a", "b", *map(str, range(1000)))]
+    assert cache.contained("grpc://localhost:2136", paths, "get_columns") == {"/local/a"}
+    assert cache.contained("grpc://localhost:2136", paths, "get_foreign_keys") == set()
+
+    reflect(YqlDialect(_reflection_cache_path=path, _reflection_cache_version="2"))
+    assert described == ["a", "a"]
+
+    dialect = YqlDialect(_reflection_cache_path=path, _reflection_cache_version="2")
+    dialect._reflection_cache.invalidate("grpc://localhost:2136", "/local")
+    reflect(dialect)
+    assert described == ["a", "a", "a"]
+
+    dialect = YqlDialect(_reflection_cache_path=path, _reflection_cache_max_age=0)
+    with pytest.raises(sa.exc.NoSuchTableError) as exc_info:
+        dialect.get_columns(connection, "missing", info_cache={})
+    assert isinstance(exc_info.value.__cause__, ydb_dbapi.ProgrammingError)
+    reflect(dialect)
+    assert described == ["a", "a", "a", "missing", "a"]
+
+
+def test_has_table_describes_path():
+    import ydb
+
+    described_paths = []
+    scheme = {"table": ydb.SchemeEntryType.TABLE, "view": ydb.SchemeEntryType.VIEW, "dir": {}}
+    failures = {"/local/table": [ydb.Unavailable("unavailable")]}
+    connection = _reflection_connection(described_paths, scheme, failures)
+    dialect = YqlDialect()
+
+    assert dialect.has_table(connection, "table")
+    assert dialect.has_table(connection, "view")
+    assert not dialect.has_table(connection, "dir")
+    assert not dialect.has_table(connection, "missing")
+    assert described_paths == ["/local/table", "/local/table", "/local/view", "/local/dir", "/local/missing"]
+
+    # Errors other than missing paths are raised as DBAPI errors
+    failures["/local/table"] = [ydb.Unauthorized("unauthorized")]
+    with pytest.raises(ydb_dbapi.DatabaseError, match="unauthorized"):
+        dialect.has_table(connection, "table")
+    del described_paths[:]
+
+    # Descriptions of the inspector cache are used without requests
+    missing = ydb_dbapi.ProgrammingError("missing", original_error=ydb.SchemeError("Path not found"))
+    info_cache = {"ydb_table_descriptions": {"a": object(), "b": missing}}
+    assert dialect.has_table(connection, "a", info_cache=info_cache)
+    assert not dialect.has_table(connection, "b", info_cache=info_cache)
+    assert described_paths == []
+
+
+def test_get_table_key_ranges():
+    import ydb
+
+    described_paths = []
+    failures = {"/local/a": [ydb.Unavailable("unavailable")]}
+    connection = _reflection_connection(described_paths, failures=failures)
+    dialect = YqlDialect()
+
+    assert len(dialect._get_table_key_ranges(connection, "a")) == 1
+    assert described_paths == ["/local/a", "/local/a"]
+    with pytest.raises(sa.exc.NoSuchTableError):
+        dialect._get_table_key_ranges(connection, "missing")
+
+    failures["/local/a"] = [ydb.Unauthorized("unauthorized")]
+    with pytest.raises(ydb_dbapi.DatabaseError, match="unauthorized"):
+        dialect._get_table_key_ranges(connection, "a")
+
+
+def test_get_table_names_walks_scheme():
+    import ydb
+
+    table, view = ydb.SchemeEntryType.TABLE, ydb.SchemeEntryType.VIEW
+    scheme = {
+        "t": table,
+        "v": view,
+        ".sys": {"s": table},
+        "a": {"t": table, "b": {"t": table, "c": {"t": table}}},
+        "x": {"t": table, "y": {"t": table}},
+    }
+    listed = []
+    # Listings failed with transient errors are retried
+    failures = {"/local/a/b": [ydb.Overloaded("overloaded")]}
+    connection = _reflection_connection(listed, scheme, failures)
+    dialect = YqlDialect()
+
+    assert dialect.get_table_names(connection) == ["a/b/c/t", "a/b/t", "a/t", "t", "x/t", "x/y/t"]
+    assert listed.count("/local/a/b") == 2
+    assert dialect.get_view_names(connection) == ["v"]
+    assert dialect.get_table_names(connection, ydb_max_depth=1) == ["a/t", "t", "x/t"]
+
+    del listed[:]
+    assert dialect.get_table_names(connection, ydb_filter="a/*/t") == ["a/b/t"]
+    assert sorted(listed) == ["/local/", "/local/a", "/local/a/b"]
+
+    del listed[:]
+    assert dialect.get_table_names(connection, ydb_filter=("a/**", "x/y/t")) == ["a/b/c/t", "a/b/t", "a/t", "x/y/t"]
+    assert "/local/.sys" not in listed
+
+    # Walk options are arguments of reflection, not table options
+    with pytest.raises(sa.exc.ArgumentError, match="ydb_filter"):
+        sa.Table("t", sa.MetaData(), ydb_filter="a/**")
+
+    with pytest.raises(ydb_dbapi.ProgrammingError):
+        connection.connection.table_path_prefix = "missing"
+        dialect.get_table_names(connection)
+
+
+def test_ttl_table_option():
+    import datetime
+
+    from sqlalchemy.schema import CreateTable
+
+    from . import TTL, ResetTableOptions, SetTableOptions, TTLTier
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "events",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("ts", sa.Integer),
+        ydb_ttl=TTL(
+            "ts",
+            datetime.timedelta(days=30),
+            unit="SECONDS",
+            tiers=[TTLTier(datetime.timedelta(days=1, hours=12), "/local/s3")],
+        ),
+    )
+    assert (
+        'TTL = Interval("P1DT12H") TO EXTERNAL DATA SOURCE `/local/s3`, Interval("P30D") DELETE ON ts AS SECONDS\n)'
+        in str(CreateTable(table).compile(dialect=dialect))
+    )
+
+    ttl = TTL("ts", datetime.timedelta(minutes=90))
+    assert str(SetTableOptions(table, ttl=ttl, auto_partitioning_by_load=True).compile(dialect=dialect)) == (
+        'ALTER TABLE events SET (AUTO_PARTITIONING_BY_LOAD = ENABLED, TTL = Interval("PT1H30M") ON ts)'
+    )
+    assert (
+        str(ResetTableOptions("dir/events", "ttl").compile(dialect=dialect)) == "ALTER TABLE `dir/events` RESET (TTL)"
+    )
+    with pytest.raises(sa.exc.CompileError, match="Unknown table options: unknown"):
+        SetTableOptions(table, unknown=1).compile(dialect=dialect)
+    with pytest.raises(sa.exc.ArgumentError, match="Unknown TTL column unit"):
+        TTL("ts", datetime.timedelta(days=1), unit="days")
+    with pytest.raises(TypeError):
+        TTL("ts")
+    with pytest.raises(sa.exc.ArgumentError, match="TTL requires interval or tiers"):
+        TTL("ts", None)
+    with pytest.raises(sa.exc.ArgumentError, match="can't be negative"):
+        TTL("ts", datetime.timedelta(seconds=-1))
+    with pytest.raises(sa.exc.ArgumentError, match="ISO 8601"):
+        TTL("ts", '1D") DELETE ON ts; DROP TABLE events; --')
+    with pytest.raises(sa.exc.ArgumentError, match="ISO 8601"):
+        TTLTier("PT", "/local/s3")
+
+    assert ttl == TTL("ts", "PT1H30M")
+    assert ttl != TTL("ts", "PT1H30M", unit="seconds")
+
+
+def _make_table(name, **kwargs):
+    # A table with a composite primary key, kwargs are ydb_* table options
+    return sa.Table(
+        name,
+        sa.MetaData(),
+        sa.Column("host", sa.String, primary_key=True),
+        sa.Column("ts", sa.DateTime, primary_key=True),
+        sa.Column("value", sa.Float),
+        **kwargs,
+    )
+
+
+def test_column_table_options():
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    from . import SetTableOptions
+
+    dialect = YqlDialect()
+
+    table = _make_table("metrics", ydb_store="COLUMN", ydb_partition_by_hash=["host"], ydb_partition_count=8)
+    assert str(CreateTable(table).compile(dialect=dialect)).endswith(
+        "PRIMARY KEY (host, ts)\n)\nPARTITION BY HASH(host)\nWITH (\n\tSTORE = COLUMN,\nPARTITION_COUNT = 8\n)\n\n"
+    )
+
+    hashed_by_value = _make_table("metrics", ydb_store="column", ydb_partition_by_hash=["value"])
+    with pytest.raises(sa.exc.CompileError, match="primary key"):
+        CreateTable(hashed_by_value).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="require ydb_store='column'"):
+        CreateTable(_make_table("metrics", ydb_partition_by_hash=["host"])).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="uniform_partitions"):
+        CreateTable(_make_table("metrics", ydb_store="column", ydb_uniform_partitions=4)).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="Unknown table store"):
+        CreateTable(_make_table("metrics", ydb_store="document")).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="Secondary indexes"):
+        CreateIndex(sa.Index("ix_value", table.c.value)).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="Unknown table options: store"):
+        SetTableOptions(table, store="row").compile(dialect=dialect)
+
+
+def test_column_families():
+    import ydb
+    from sqlalchemy.schema import CreateTable
+
+    from . import ColumnFamily
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "documents",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("body", sa.String, nullable=False, ydb_family="cold"),
+        ydb_families=[ColumnFamily("default", data="ssd"), ColumnFamily("cold", data="rot", compression="lz4")],
+    )
+    assert str(CreateTable(table).compile(dialect=dialect)) == (
+        "\nCREATE TABLE documents (\n"
+        "\tid Int64 NOT NULL, \n"
+        "\tbody UTF8 FAMILY cold NOT NULL, \n"
+        "\tPRIMARY KEY (id), \n"
+        '\tFAMILY `default` (DATA = "ssd"), \n'
+        '\tFAMILY cold (DATA = "rot", COMPRESSION = "lz4")\n'
+        ")\n\n"
+    )
+    with pytest.raises(sa.exc.ArgumentError, match="Invalid storage pool kind"):
+        ColumnFamily("cold", data='rot"), FAMILY x (DATA = "ssd')
+    with pytest.raises(sa.exc.ArgumentError, match="Unknown compression"):
+        ColumnFamily("cold", compression="gzip")
+
+    # The column specification is not patched when it doesn't start with the column type
+    class UnstableType(sa.types.UserDefinedType):
+        cache_ok = True
+        calls = 0
+
+        def get_col_spec(self, **kw):
+            UnstableType.calls += 1
+            return f"Type{UnstableType.calls}"
+
+    unstable_table = sa.Table(
+        "unstable", sa.MetaData(), sa.Column("id", UnstableType(), primary_key=True, ydb_family="cold")
+    )
+    with pytest.raises(sa.exc.CompileError, match="Can't place FAMILY of column 'id'"):
+        CreateTable(unstable_table).compile(dialect=dialect)
+
+    description = _stub_table_description(
+        dialect,
+        columns=[
+            ydb.Column("id", ydb.PrimitiveType.Int64, "default"),
+            ydb.Column("body", ydb.OptionalType(ydb.PrimitiveType.Utf8), "cold"),
+        ],
+        column_families=[
+            ydb.ColumnFamily().with_name("default"),
+            ydb.ColumnFamily()
+            .with_name("cold")
+            .with_data(ydb.StoragePool("rot"))
+            .with_compression(ydb.Compression.LZ4),
+        ],
+    )
+    columns = dialect.get_columns(None, "documents")
+    assert "dialect_options" not in columns[0]
+    assert columns[1]["dialect_options"] == {"ydb_family": "cold"}
+    assert dialect.get_table_options(None, "documents") == {
+        "ydb_families": [ColumnFamily("default"), ColumnFamily("cold", data="rot", compression="lz4")]
+    }
+
+    description.column_families = description.column_families[:1]
+    assert dialect.get_table_options(None, "documents") == {}
+
+
+def test_read_table_options():
+    import ydb
+    from sqlalchemy.schema import CreateTable
+
+    from . import ResetTableOptions, SetTableOptions
+
+    dialect = YqlDialect()
+
+    table = _make_table("lookup", ydb_read_replicas_settings="per_az:1", ydb_key_bloom_filter=True)
+    assert str(CreateTable(table).compile(dialect=dialect)).endswith(
+        'WITH (\n\tREAD_REPLICAS_SETTINGS = "PER_AZ:1",\nKEY_BLOOM_FILTER = ENABLED\n)\n\n'
+    )
+    assert str(SetTableOptions(table, read_replicas_settings="ANY_AZ:2").compile(dialect=dialect)) == (
+        'ALTER TABLE lookup SET (READ_REPLICAS_SETTINGS = "ANY_AZ:2")'
+    )
+    assert str(ResetTableOptions(table, "key_bloom_filter").compile(dialect=dialect)) == (
+        "ALTER TABLE lookup RESET (KEY_BLOOM_FILTER)"
+    )
+    with pytest.raises(sa.exc.CompileError, match="Invalid read replicas settings"):
+        CreateTable(_make_table("lookup", ydb_read_replicas_settings="ALL_AZ:1")).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="key_bloom_filter"):
+        CreateTable(_make_table("lookup", ydb_store="column", ydb_key_bloom_filter=True)).compile(dialect=dialect)
+
+    _stub_table_description(
+        dialect,
+        read_replicas_settings=ydb.ReadReplicasSettings().with_any_az_read_replicas_count(2),
+        key_bloom_filter=ydb.FeatureFlag.ENABLED,
+    )
+    assert dialect.get_table_options(None, "lookup") == {
+        "ydb_read_replicas_settings": "ANY_AZ:2",
+        "ydb_key_bloom_filter": True,
+    }
+
+
+def test_vector_index_and_knn_search():
+    from sqlalchemy.schema import CreateIndex
+
+    from . import knn_distance, knn_search
+
+    dialect = YqlDialect()
+    table = sa.Table(
+        "documents",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("owner_id", sa.Integer),
+        sa.Column("embedding", types.Vector(3)),
+        sa.Index(
+            "ix_embedding",
+            "owner_id",
+            "embedding",
+            ydb_type="vector_kmeans_tree",
+            ydb_cover=["id"],
+            ydb_vector_options={"similarity": "inner_product", "vector_type": "float", "vector_dimension": 3},
+        ),
+    )
+    (index,) = table.indexes
+    assert str(CreateIndex(index).compile(dialect=dialect)) == (
+        "ALTER TABLE documents ADD INDEX ix_embedding GLOBAL SYNC USING vector_kmeans_tree ON (owner_id, embedding) "
+        'COVER (id) WITH (similarity=inner_product, vector_type="float", vector_dimension=3)'
+    )
+    with pytest.raises(sa.exc.CompileError, match="Unknown index type"):
+        CreateIndex(sa.Index("ix_id", table.c.id, ydb_type="hnsw", ydb_vector_options={})).compile(dialect=dialect)
+    with pytest.raises(sa.exc.CompileError, match="Vector options require"):
+        CreateIndex(sa.Index("ix_id", table.c.id, ydb_type="vector_kmeans_tree")).compile(dialect=dialect)
+
+    packed = table.c.embedding.type.process_bind_param([1, 0.5, -2], dialect)
+    assert packed == struct.pack("<3f", 1, 0.5, -2) + b"\x01"
+    assert table.c.embedding.type.process_result_value(packed, dialect) == [1, 0.5, -2]
+    assert types.Vector(2, item_type="uint8").process_bind_param([1, 255], dialect) == b"\x01\xff\x02"
+    with pytest.raises(ValueError):
+        table.c.embedding.type.process_bind_param([1, 2], dialect)
+
+    statement = knn_search(table, "embedding", [1, 0.5, -2], limit=10, columns=["id"]).where(sa.column("owner_id") == 1)
+    compiled = statement.compile(dialect=dialect)
+    assert str(compiled) == (
+        "SELECT id \nFROM documents VIEW ix_embedding \nWHERE owner_id = ? "
+        "ORDER BY Knn::InnerProductSimilarity(embedding, ?) DESC\n LIMIT CAST(? AS UInt64)"
+    )
+    assert str(sa.select(table.c.id).order_by(knn_distance(table.c.embedding, [1, 0, 0])).compile(dialect=dialect)) == (
+        "SELECT documents.id \nFROM documents ORDER BY Knn::CosineDistance(documents.embedding, ?)"
+    )
+    with pytest.raises(sa.exc.ArgumentError, match="not found"):
+        knn_search(table, "embedding", [1, 0, 0], limit=1, index="ix_missing")
+
+    # Index names are rendered by the preparer of the compiling dialect and are a part of the cache key
+    cache_key = knn_search(table, "embedding", [1, 0, 0], limit=1)._generate_cache_key()
+    index.name = "dir/ix_embedding"
+    statement = knn_search(table, "embedding", [1, 0, 0], limit=1)
+    assert statement._generate_cache_key().key != cache_key.key
+    assert "FROM documents VIEW `dir_ix_embedding`" in str(statement.compile(dialect=dialect))
+
+    class IndexPathPreparer(type(dialect.identifier_preparer)):
+        def format_index(self, index):
+            return self.quote_identifier(index.name)
+
+    path_dialect = YqlDialect()
+    path_dialect.identifier_preparer = IndexPathPreparer(path_dialect)
+    assert "FROM documents VIEW `dir/ix_embedding`" in str(statement.compile(dialect=path_dialect))
+    index.name = None
+    with pytest.raises(sa.exc.ArgumentError, match="has no name"):
+        knn_search(table, "embedding", [1, 0, 0], limit=1)
+
+
+def test_changefeeds():
+    import datetime
+
+    from sqlalchemy.schema import CreateTable
+
+    from . import AddChangefeed, Changefeed, DropChangefeed, SetTableOptions, _get_reflected_changefeeds
+    from .ddl import _add_changefeeds
+
+    dialect = YqlDialect()
+    changefeed = Changefeed("updates", "UPDATES", retention_period=datetime.timedelta(hours=12), initial_scan=True)
+    table = sa.Table(
+        "events",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        ydb_changefeeds=[changefeed],
+    )
+    assert "CHANGEFEED" not in str(CreateTable(table).compile(dialect=dialect))
+
+    # Changefeeds are added after CREATE TABLE by a listener of all tables, other tables are skipped
+    plain_table = sa.Table("plain", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True))
+    dbapi_connection = _RecordingConnection()
+    engine = sa.create_engine("yql+ydb://localhost:2136/local", creator=lambda: dbapi_connection)
+    with engine.connect() as connection:
+        dbapi_connection.recording_cursor.executed.clear()
+        table.create(connection, checkfirst=False)
+        plain_table.create(connection, checkfirst=False)
+    operations = [operation.split("(")[0].strip() for _, operation, _ in dbapi_connection.recording_cursor.executed]
+    assert operations == ["CREATE TABLE events", "ALTER TABLE events ADD CHANGEFEED updates WITH", "CREATE TABLE plain"]
+    assert sa.event.contains(sa.Table, "after_create", _add_changefeeds)
+    # Tables created with other dialects are skipped too
+    table.create(sa.create_engine("sqlite://"))
+    assert str(AddChangefeed(table, changefeed).compile(dialect=dialect)) == (
+        "ALTER TABLE events ADD CHANGEFEED updates "
+        "WITH (MODE = 'UPDATES', FORMAT = 'JSON', RETENTION_PERIOD = Interval(\"PT12H\"), INITIAL_SCAN = TRUE)"
+    )
+    assert str(DropChangefeed("dir/events", "updates").compile(dialect=dialect)) == (
+        "ALTER TABLE `dir/events` DROP CHANGEFEED updates"
+    )
+    with pytest.raises(sa.exc.CompileError, match="Unknown table options: changefeeds"):
+        SetTableOptions(table, changefeeds=[changefeed]).compile(dialect=dialect)
+    with pytest.raises(sa.exc.ArgumentError, match="Unknown changefeed mode"):
+        Changefeed("updates", "all")
+    with pytest.raises(sa.exc.ArgumentError, match="ISO 8601"):
+        Changefeed("updates", "updates", retention_period="12 hours")
+
+    create_query = (
+        "CREATE TABLE `events` (\n\t`id` Int64 NOT NULL,\n\tPRIMARY KEY (`id`)\n);\n\n"
+        "ALTER TABLE `events`\n\tADD CHANGEFEED `updates` WITH (MODE = 'UPDATES', FORMAT = 'JSON', "
+        "RETENTION_PERIOD = INTERVAL('PT12H'), TOPIC_MIN_ACTIVE_PARTITIONS = 1)\n;\n\n"
+        "ALTER TABLE `events`\n\tADD CHANGEFEED `cdc` WITH (MODE = 'NEW_AND_OLD_IMAGES', "
+        "FORMAT = 'DEBEZIUM_JSON', VIRTUAL_TIMESTAMPS = TRUE, RETENTION_PERIOD = INTERVAL('P1D'))\n;\n"
+    )
+    assert _get_reflected_changefeeds(create_query) == [
+        changefeed,
+        Changefeed("cdc", "new_and_old_images", "debezium_json", retention_period="P1D", virtual_timestamps=True),
+    ]
+
+    import ydb
+
+    class ShowCreateConnection:
+        def __init__(self, result):
+            self.result = result
+            self.statements = []
+
+        def execute(self, statement):
+            self.statements.append(str(statement))
+            if isinstance(self.result, Exception):
+                raise self.result
+            return SimpleNamespace(fetchone=lambda: SimpleNamespace(_mapping={"CreateQuery": self.result}))
+
+    _stub_table_description(dialect)
+    connection = ShowCreateConnection(create_query)
+    assert dialect.get_table_options(connection, "events") == {}
+    assert connection.statements == []
+    assert dialect.get_table_options(connection, "events", ydb_reflect_changefeeds=True) == {
+        "ydb_changefeeds": _get_reflected_changefeeds(create_query)
+    }
+    assert connection.statements == ["SHOW CREATE TABLE events"]
+
+    unsupported = ydb_dbapi.NotSupportedError("SHOW CREATE is not supported")
+    connection = ShowCreateConnection(sa.exc.DBAPIError("SHOW CREATE TABLE events", None, unsupported))
+    assert dialect.get_table_options(connection, "events", ydb_reflect_changefeeds=True) == {}
+    unavailable = ydb_dbapi.OperationalError("unavailable", original_error=ydb.Unavailable("unavailable"))
+    connection = ShowCreateConnection(sa.exc.DBAPIError("SHOW CREATE TABLE events", None, unavailable))
+    with pytest.raises(sa.exc.DBAPIError, match="unavailable"):
+        dialect.get_table_options(connection, "events", ydb_reflect_changefeeds=True)
+
+    with pytest.raises(sa.exc.ArgumentError, match="ydb_reflect_changefeeds"):
+        sa.Table("events", sa.MetaData(), ydb_reflect_changefeeds=True)
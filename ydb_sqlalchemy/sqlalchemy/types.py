@@ -1,4 +1,6 @@
+import array
 import decimal
+import sys
 from typing import Any, Mapping, Type, Union
 
 from sqlalchemy import __version__ as sa_version
@@ -228,3 +230,47 @@ class Binary(types.LargeBinary):
 
     def bind_processor(self, dialect):
         return None
+
+
+class Vector(types.TypeDecorator):
+    """
+    Vector of numbers stored in a ``String`` column in the packed format of YDB ``Knn::`` functions.
+
+    Lists of numbers are serialized the same way as by ``Knn::ToBinaryStringFloat`` (or ``Uint8``, ``Int8``
+    for ``item_type="uint8"``, ``"int8"``) and are read back as lists.
+    """
+
+    impl = Binary
+    cache_ok = True
+
+    # item type -> array typecode and the trailing format byte of the packed vector
+    formats = {"float": ("f", 1), "uint8": ("B", 2), "int8": ("b", 3)}
+
+    def __init__(self, dimension: int = None, item_type: str = "float"):
+        if item_type not in self.formats:
+            raise exc.ArgumentError(f"Unknown vector item type {item_type!r}, expected one of {tuple(self.formats)}")
+        super().__init__()
+        self.dimension = dimension
+        self.item_type = item_type
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        typecode, format_byte = self.formats[self.item_type]
+        items = array.array(typecode, value)
+        if self.dimension is not None and len(items) != self.dimension:
+            raise ValueError(f"Expected a vector of {self.dimension} items, got {len(items)}")
+        if sys.byteorder == "big":
+            items.byteswap()
+        return items.tobytes() + bytes((format_byte,))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        typecode, format_byte = self.formats[self.item_type]
+        if value[-1:] != bytes((format_byte,)):
+            raise ValueError(f"Value is not a packed vector of {self.item_type} items")
+        items = array.array(typecode, value[:-1])
+        if sys.byteorder == "big":
+            items.byteswap()
+        return items.tolist()